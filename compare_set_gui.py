@@ -3,20 +3,33 @@
 
 from __future__ import annotations
 
+import codecs
 import compareset_engine as compare_engine
+import fnmatch
+import functools
 import json
 import logging
+import mmap
+import multiprocessing
 import os
 import shutil
 import sqlite3
 import sys
 import threading
+import time
 import webbrowser
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Deque, Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
 from PySide6.QtCore import (
+    QAbstractListModel,
+    QAbstractTableModel,
+    QModelIndex,
     QObject,
+    QSignalBlocker,
+    QSignalMapper,
+    QSortFilterProxyModel,
     QThread,
     Qt,
     Signal,
@@ -28,7 +41,7 @@ from PySide6.QtCore import (
     QUrl,
     QTimer,
 )
-from PySide6.QtGui import QAction, QColor, QDesktopServices, QIcon, QKeySequence, QPalette, QShortcut
+from PySide6.QtGui import QAction, QColor, QDesktopServices, QIcon, QKeySequence, QPalette, QShortcut, QStyleHints, QTextCursor
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -41,8 +54,7 @@ from PySide6.QtWidgets import (
     QHeaderView,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMainWindow,
     QMenu,
     QMenuBar,
@@ -52,6 +64,10 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QStackedWidget,
     QStatusBar,
+    QStyle,
+    QStyleOptionButton,
+    QStyledItemDelegate,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QTextEdit,
@@ -141,10 +157,209 @@ RELEASED_ROOT = csenv.RELEASED_ROOT
 HISTORY_DIR = csenv.HISTORY_DIR
 LOG_DIR = csenv.LOG_DIR
 
+# Bytes of a log decoded per event-loop turn when streaming it into the viewer.
+LOG_VIEW_CHUNK_BYTES = 64 * 1024
+# Recent log lines kept for the developer tools dialog.
+LOG_HISTORY_LIMIT = 500
+# Shortest gap between progress bar repaints while a comparison reports pages.
+PROGRESS_REFRESH_MS = 33
+# Shortest gap between widget moves while dragging in layout mode (one frame).
+DRAG_REFRESH_MS = 16
+# Quiet period after the last keystroke before a search box refilters.
+SEARCH_DEBOUNCE_MS = 200
+
 ACCENT_COLOR = "#5a2b81"
 ACCENT_COLOR_HOVER = "#6f3b9f"
 ACCENT_COLOR_PRESSED = "#4a216b"
 
+THEME_COLORS: Dict[str, Dict[str, str]] = {
+    "dark": {
+        "card_bg": "#242424",
+        "canvas_bg": "#1c1c1c",
+        "text_color": "#f3f3f3",
+        "panel_bg": "#2a2a2a",
+        "border": "#3a3a3a",
+        "input_bg": "#1f1f1f",
+        "button_bg": "#2c2c2c",
+        "button_hover": "#343434",
+        "button_pressed": "#2a2a2a",
+        "button_border": "#3d3d3d",
+        "disabled_bg": "#222222",
+        "disabled_text": "#7f7f7f",
+        "disabled_border": "#2f2f2f",
+        "accent": ACCENT_COLOR,
+        "accent_hover": ACCENT_COLOR_HOVER,
+        "accent_pressed": ACCENT_COLOR_PRESSED,
+        "muted_text": "#b8b8b8",
+    },
+    "light": {
+        "card_bg": "#fdfefe",
+        "canvas_bg": "#eef2f8",
+        "text_color": "#1f2937",
+        "panel_bg": "#f8fbff",
+        "border": "#d6deeb",
+        "input_bg": "#f4f6fb",
+        "button_bg": "#e8edf7",
+        "button_hover": "#dfe7f6",
+        "button_pressed": "#d2dcf0",
+        "button_border": "#c7d4ea",
+        "disabled_bg": "#e6ebf5",
+        "disabled_text": "#8c94a6",
+        "disabled_border": "#d5deed",
+        "accent": ACCENT_COLOR,
+        "accent_hover": ACCENT_COLOR_HOVER,
+        "accent_pressed": ACCENT_COLOR_PRESSED,
+        "muted_text": "#4b5563",
+    },
+}
+
+THEME_QSS_TEMPLATE = """
+    QWidget#layout_canvas {{
+        background-color: {canvas_bg};
+        color: {text_color};
+        font-family: 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
+    }}
+    QFrame#main_card {{
+        background-color: {card_bg};
+        border-radius: 18px;
+        border: 1px solid {border};
+    }}
+    QFrame#dialog_card {{
+        background-color: {panel_bg};
+        border: 1px solid {border};
+        border-radius: 12px;
+    }}
+    QFrame#top_toolbar, QFrame#progress_panel, QFrame#file_group, QFrame#navigation_bar, QFrame#back_bar {{
+        background-color: {panel_bg};
+        border: 1px solid {border};
+        border-radius: 12px;
+    }}
+    QLabel#title_label {{
+        font-size: 24px;
+        font-weight: 700;
+        letter-spacing: 0.2px;
+    }}
+    QLabel[class="section_label"] {{
+        font-size: 14px;
+        font-weight: 600;
+        letter-spacing: 0.3px;
+    }}
+    QLabel[class="field_label"] {{
+        color: {muted_text};
+        font-size: 13px;
+    }}
+    QLabel#version_label {{
+        color: {muted_text};
+    }}
+    QLineEdit {{
+        padding: 8px 10px;
+        border-radius: 10px;
+        border: 1px solid {border};
+        background-color: {input_bg};
+    }}
+    QLineEdit:focus {{
+        border: 1px solid {accent};
+        outline: none;
+    }}
+    QPushButton {{
+        padding: 8px 14px;
+        border-radius: 10px;
+        border: 1px solid {button_border};
+        background-color: {button_bg};
+        color: {text_color};
+        font-weight: 600;
+    }}
+    QPushButton:hover {{
+        background-color: {button_hover};
+    }}
+    QPushButton:pressed {{
+        background-color: {button_pressed};
+    }}
+    QPushButton:disabled {{
+        color: {disabled_text};
+        background-color: {disabled_bg};
+        border-color: {disabled_border};
+    }}
+    QPushButton#compare_button {{
+        background-color: {accent};
+        color: #ffffff;
+        border: none;
+    }}
+    QPushButton#compare_button:hover {{
+        background-color: {accent_hover};
+    }}
+    QPushButton#compare_button:pressed {{
+        background-color: {accent_pressed};
+    }}
+    QPushButton#cancel_button {{
+        border-color: {border};
+    }}
+    QFrame#navigation_bar QPushButton,
+    QFrame#back_bar QPushButton {{
+        border-radius: 16px;
+        padding: 8px 16px;
+    }}
+    QFrame#navigation_bar QPushButton:checked,
+    QFrame#navigation_bar QPushButton:disabled {{
+        background-color: {accent};
+        color: #ffffff;
+        border-color: {accent};
+    }}
+    QFrame#navigation_bar QPushButton:checked:hover,
+    QFrame#navigation_bar QPushButton:disabled:hover {{
+        background-color: {accent_hover};
+    }}
+    QFrame#navigation_bar QPushButton:checked:pressed,
+    QFrame#navigation_bar QPushButton:disabled:pressed {{
+        background-color: {accent_pressed};
+    }}
+    QProgressBar {{
+        border: 1px solid {border};
+        border-radius: 8px;
+        background-color: {input_bg};
+        height: 12px;
+    }}
+    QProgressBar::chunk {{
+        background-color: {accent};
+        border-radius: 8px;
+    }}
+"""
+
+THEME_QSS_DARK = THEME_QSS_TEMPLATE.format(**THEME_COLORS["dark"])
+THEME_QSS_LIGHT = THEME_QSS_TEMPLATE.format(**THEME_COLORS["light"])
+
+
+@functools.lru_cache(maxsize=None)
+def theme_palette(theme: str) -> QPalette:
+    """Return the application palette for ``theme``, built once per theme."""
+
+    palette = QPalette()
+    if theme == "dark":
+        palette.setColor(QPalette.Window, QColor(53, 53, 53))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        palette.setColor(QPalette.Base, QColor(35, 35, 35))
+        palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
+        palette.setColor(QPalette.ToolTipBase, Qt.white)
+        palette.setColor(QPalette.ToolTipText, Qt.white)
+        palette.setColor(QPalette.Text, Qt.white)
+        palette.setColor(QPalette.Button, QColor(53, 53, 53))
+        palette.setColor(QPalette.ButtonText, Qt.white)
+        palette.setColor(QPalette.Highlight, QColor(ACCENT_COLOR))
+        palette.setColor(QPalette.HighlightedText, Qt.black)
+    else:
+        palette.setColor(QPalette.Window, QColor(240, 243, 249))
+        palette.setColor(QPalette.WindowText, QColor(31, 41, 55))
+        palette.setColor(QPalette.Base, QColor(253, 254, 255))
+        palette.setColor(QPalette.AlternateBase, QColor(245, 248, 253))
+        palette.setColor(QPalette.ToolTipBase, QColor(253, 254, 255))
+        palette.setColor(QPalette.ToolTipText, QColor(31, 41, 55))
+        palette.setColor(QPalette.Text, QColor(31, 41, 55))
+        palette.setColor(QPalette.Button, QColor(232, 237, 247))
+        palette.setColor(QPalette.ButtonText, QColor(31, 41, 55))
+        palette.setColor(QPalette.Highlight, QColor(ACCENT_COLOR))
+        palette.setColor(QPalette.HighlightedText, Qt.white)
+    return palette
+
 
 TRANSLATIONS: Dict[str, Dict[str, str]] = {
     "pt-BR": {
@@ -172,6 +387,9 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "history_view": "Visualizar",
         "history_export": "Exportar",
         "history_view_log": "Ver log",
+        "history_clear_prompt": "Remover todos os resultados exibidos? Esta ação não pode ser desfeita.",
+        "history_cleared": "Histórico limpo.",
+        "history_clear_failed": "Erro ao limpar histórico: {message}",
         "released": "Arquivos Liberados",
         "settings": "Configurações",
         "compare": "Comparar",
@@ -202,6 +420,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "email_placeholder": "email@dominio.com",
         "admin_title": "Administração",
         "search_user_placeholder": "Buscar usuário…",
+        "admin_loading_users": "Carregando usuários…",
         "admin_username": "Usuário",
         "admin_role": "Perfil",
         "admin_status": "Status",
@@ -251,6 +470,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "incorrect_password": "Senha incorreta",
         "processing_page": "Processando página {current} de {total}…",
         "cancelling": "Cancelando…",
+        "comparison_failed": "Falha na comparação.",
     },
     "en-US": {
         "app_title": "CompareSet",
@@ -277,6 +497,9 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "history_view": "View",
         "history_export": "Export",
         "history_view_log": "View log",
+        "history_clear_prompt": "Remove all results? This action cannot be undone.",
+        "history_cleared": "History cleared.",
+        "history_clear_failed": "Unable to clear history: {message}",
         "released": "Released files",
         "settings": "Settings",
         "compare": "Compare",
@@ -307,6 +530,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "email_placeholder": "email@domain.com",
         "admin_title": "Administration",
         "search_user_placeholder": "Search username…",
+        "admin_loading_users": "Loading users…",
         "admin_username": "Username",
         "admin_role": "Role",
         "admin_status": "Status",
@@ -356,6 +580,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "incorrect_password": "Incorrect password",
         "processing_page": "Processing page {current} of {total}…",
         "cancelling": "Cancelling…",
+        "comparison_failed": "Comparison failed.",
     },
 }
 
@@ -366,6 +591,23 @@ def tr(language: str, key: str) -> str:
     return current.get(key) or fallback.get(key) or key
 
 
+# Connection banner and warning strings per language; they never change at runtime.
+_CONNECTION_TEXTS: Dict[str, Dict[str, str]] = {
+    language: {key: tr(language, key) for key in ("offline_status", "offline_info", "update_available")}
+    for language in TRANSLATIONS
+}
+
+# Actions a designer button can trigger, label -> action key; shared and read-only.
+_REGISTERED_ACTIONS: Dict[str, str] = {
+    "Nenhuma": "none",
+    "Abrir histórico": "history",
+    "Abrir liberados": "released",
+    "Abrir configurações": "settings",
+    "Iniciar comparação": "compare",
+    "Cancelar comparação": "cancel",
+}
+
+
 def is_server_available(server_root: str) -> bool:
     """Return True when the UNC server root exists and is reachable."""
 
@@ -400,6 +642,8 @@ USERS_DB_PATH = os.path.join(CONFIG_ROOT, "users.sqlite")
 USER_SETTINGS_DB_PATH = os.path.join(CONFIG_ROOT, "user_settings.sqlite")
 RELEASED_DB_PATH = os.path.join(CONFIG_ROOT, "released.sqlite")
 DEV_LAYOUT_PATH = Path(DEV_SETTINGS_PATH).with_name("dev_layout.json")
+# Set to any non-empty value to write the developer layout indented for reading.
+DEV_LAYOUT_PRETTY_ENV = "COMPARESET_PRETTY_LAYOUT"
 
 def make_long_path(path: str) -> str:
     """Return a Windows long-path-safe absolute path."""
@@ -407,6 +651,29 @@ def make_long_path(path: str) -> str:
     return csenv.make_long_path(path)
 
 
+def get_conn(path: str) -> sqlite3.Connection:
+    """Return this thread's pooled connection to one of the shared databases."""
+
+    return csenv.get_sqlite_connection(path)
+
+
+# (whole second, formatted prefix) of the last UTC timestamp produced.
+_NOW_ISO_SECOND: Tuple[int, str] = (-1, "")
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as ISO text, reformatting the date part once per second."""
+
+    global _NOW_ISO_SECOND
+    now = time.time()
+    second = int(now)
+    cached = _NOW_ISO_SECOND
+    if cached[0] != second:
+        cached = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+        _NOW_ISO_SECOND = cached
+    return f"{cached[1]}.{int((now - second) * 1_000_000):06d}"
+
+
 def get_current_username() -> str:
     """Return the current Windows username for authentication."""
 
@@ -419,12 +686,23 @@ def ensure_server_directories() -> None:
     csenv.ensure_server_directories()
 
 
+# Database paths whose schema has already been created/migrated this process.
+_INITIALIZED_DBS: set[str] = set()
+
+USER_SETTINGS_CACHE_TTL = 300.0
+_settings_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+
+
 def ensure_users_db_initialized() -> None:
     """Create the Users table if needed and seed an admin if empty."""
 
+    if USERS_DB_PATH in _INITIALIZED_DBS:
+        return
     ensure_server_directories()
-    conn = sqlite3.connect(make_long_path(USERS_DB_PATH))
-    try:
+    conn = get_conn(USERS_DB_PATH)
+    with conn:
+        # Take the write lock first so concurrent first runs seed only one admin.
+        conn.execute("BEGIN IMMEDIATE")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS Users (
@@ -440,103 +718,114 @@ def ensure_users_db_initialized() -> None:
         cursor = conn.execute("SELECT COUNT(*) FROM Users")
         total = cursor.fetchone()[0]
         if total == 0:
-            now = datetime.utcnow().isoformat()
+            now = _now_iso()
             seed_user = get_current_username()
             conn.execute(
                 "INSERT INTO Users (username, role, is_active, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
                 (seed_user, "admin", 1, now, now),
             )
-        conn.commit()
-    finally:
-        conn.close()
+    _INITIALIZED_DBS.add(USERS_DB_PATH)
 
 
+@functools.lru_cache(maxsize=64)
 def get_user_role(username: str) -> Optional[str]:
-    """Return the active role for the given user, if any."""
+    """Return the active role for the given user, if any.
 
-    conn = sqlite3.connect(make_long_path(USERS_DB_PATH))
-    try:
-        conn.row_factory = sqlite3.Row
+    Results are cached per process; the user writers clear the cache.
+    """
+
+    conn = get_conn(USERS_DB_PATH)
+    with conn:
         row = conn.execute(
             "SELECT role, is_active FROM Users WHERE username = ?", (username,)
         ).fetchone()
         if row and row["is_active"]:
             return str(row["role"])
         return None
-    finally:
-        conn.close()
 
 
 def list_users() -> List[Dict[str, Union[str, int]]]:
     """Return all users for admin display, including email if available."""
 
     ensure_user_settings_db_initialized()
-    conn = sqlite3.connect(make_long_path(USERS_DB_PATH))
-    settings_conn = sqlite3.connect(make_long_path(USER_SETTINGS_DB_PATH))
-    try:
-        conn.row_factory = sqlite3.Row
-        settings_conn.row_factory = sqlite3.Row
-        email_map = {
-            row["username"]: row["email"]
-            for row in settings_conn.execute("SELECT username, email FROM UserSettings")
-        }
-        rows = conn.execute("SELECT username, role, is_active FROM Users ORDER BY username").fetchall()
+    conn = get_conn(USERS_DB_PATH)
+    # The pooled connection keeps the settings database attached between calls.
+    attached = {row["name"] for row in conn.execute("PRAGMA database_list")}
+    if "settings" not in attached:
+        conn.execute("ATTACH DATABASE ? AS settings", (make_long_path(USER_SETTINGS_DB_PATH),))
+    with conn:
         return [
             {
                 "username": row["username"],
                 "role": row["role"],
                 "is_active": int(row["is_active"]),
-                "email": email_map.get(row["username"], ""),
+                "email": row["email"],
             }
-            for row in rows
+            for row in conn.execute(
+                """
+                SELECT u.username, u.role, u.is_active, COALESCE(s.email, '') AS email
+                FROM Users u
+                LEFT JOIN settings.UserSettings s ON s.username = u.username
+                ORDER BY u.username
+                """
+            )
         ]
-    finally:
-        settings_conn.close()
-        conn.close()
 
 
 def add_user(username: str, role: str) -> None:
     """Add a new active user entry."""
 
-    now = datetime.utcnow().isoformat()
-    conn = sqlite3.connect(make_long_path(USERS_DB_PATH))
-    try:
+    now = _now_iso()
+    conn = get_conn(USERS_DB_PATH)
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
         conn.execute(
             "INSERT INTO Users (username, role, is_active, created_at, updated_at) VALUES (?, ?, 1, ?, ?)",
             (username.strip(), role, now, now),
         )
-        conn.commit()
-    finally:
-        conn.close()
+    get_user_role.cache_clear()
 
 
 def update_user_record(username: str, *, role: Optional[str] = None, is_active: Optional[int] = None) -> None:
     """Update role and/or activation state for a user."""
 
-    now = datetime.utcnow().isoformat()
-    conn = sqlite3.connect(make_long_path(USERS_DB_PATH))
-    try:
-        if role is not None:
-            conn.execute(
-                "UPDATE Users SET role = ?, updated_at = ? WHERE username = ?",
-                (role, now, username),
-            )
-        if is_active is not None:
-            conn.execute(
-                "UPDATE Users SET is_active = ?, updated_at = ? WHERE username = ?",
-                (is_active, now, username),
-            )
-        conn.commit()
-    finally:
-        conn.close()
+    update_user_records([{"username": username, "role": role, "is_active": is_active}])
+
+
+def update_user_records(records: Sequence[Dict[str, Any]]) -> None:
+    """Update role and/or activation state for several users in one transaction.
+
+    Each record holds ``username`` plus optional ``role`` and ``is_active``;
+    missing or ``None`` fields are left unchanged.
+    """
+
+    now = _now_iso()
+    rows = [
+        (record.get("role"), record.get("is_active"), now, record["username"])
+        for record in records
+        if record.get("role") is not None or record.get("is_active") is not None
+    ]
+    if not rows:
+        return
+    conn = get_conn(USERS_DB_PATH)
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            "UPDATE Users SET role = COALESCE(?, role), is_active = COALESCE(?, is_active), updated_at = ? WHERE username = ?",
+            rows,
+        )
+    get_user_role.cache_clear()
 
 
 def ensure_user_settings_db_initialized() -> None:
     """Create the user settings table when missing."""
 
+    if USER_SETTINGS_DB_PATH in _INITIALIZED_DBS:
+        return
     ensure_server_directories()
-    conn = sqlite3.connect(make_long_path(USER_SETTINGS_DB_PATH))
-    try:
+    conn = get_conn(USER_SETTINGS_DB_PATH)
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS UserSettings (
@@ -558,18 +847,29 @@ def ensure_user_settings_db_initialized() -> None:
             conn.execute("ALTER TABLE UserSettings ADD COLUMN email TEXT NOT NULL DEFAULT ''")
         if "theme" not in columns:
             conn.execute("ALTER TABLE UserSettings ADD COLUMN theme TEXT NOT NULL DEFAULT 'auto'")
-        conn.commit()
-    finally:
-        conn.close()
+    _INITIALIZED_DBS.add(USER_SETTINGS_DB_PATH)
 
 
 def get_or_create_user_settings(username: str) -> Dict[str, str]:
-    """Fetch or create settings for a user."""
+    """Fetch or create settings for a user.
+
+    Results are cached for ``USER_SETTINGS_CACHE_TTL`` seconds and dropped by
+    ``update_user_settings``; treat the returned mapping as read-only.
+    """
 
+    cached = _settings_cache.get(username)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < USER_SETTINGS_CACHE_TTL:
+        return cached[1]
+    settings = _load_user_settings(username)
+    _settings_cache[username] = (now, settings)
+    return settings
+
+
+def _load_user_settings(username: str) -> Dict[str, str]:
     ensure_user_settings_db_initialized()
-    conn = sqlite3.connect(make_long_path(USER_SETTINGS_DB_PATH))
-    try:
-        conn.row_factory = sqlite3.Row
+    conn = get_conn(USER_SETTINGS_DB_PATH)
+    with conn:
         row = conn.execute(
             "SELECT username, language, email, theme FROM UserSettings WHERE username = ?",
             (username,),
@@ -581,17 +881,16 @@ def get_or_create_user_settings(username: str) -> Dict[str, str]:
                 "email": row["email"],
                 "theme": row["theme"] if "theme" in row.keys() else "auto",
             }
-        now = datetime.utcnow().isoformat()
+        now = _now_iso()
         default_language = "pt-BR"
         default_theme = "auto"
+        conn.execute("BEGIN IMMEDIATE")
         conn.execute(
-            "INSERT INTO UserSettings (username, language, email, theme, created_at, updated_at) VALUES (?, ?, '', ?, ?, ?)",
+            "INSERT INTO UserSettings (username, language, email, theme, created_at, updated_at) VALUES (?, ?, '', ?, ?, ?) "
+            "ON CONFLICT(username) DO NOTHING",
             (username, default_language, default_theme, now, now),
         )
-        conn.commit()
         return {"username": username, "language": default_language, "email": "", "theme": default_theme}
-    finally:
-        conn.close()
 
 
 def update_user_settings(username: str, **kwargs: str) -> None:
@@ -603,36 +902,39 @@ def update_user_settings(username: str, **kwargs: str) -> None:
     if not updates:
         return
 
-    now = datetime.utcnow().isoformat()
-    assignments = ", ".join(f"{field} = ?" for field in updates)
-    values = list(updates.values())
-    values.extend([now, username])
-
-    conn = sqlite3.connect(make_long_path(USER_SETTINGS_DB_PATH))
-    try:
+    now = _now_iso()
+    assignments = ", ".join(f"{field}=excluded.{field}" for field in updates)
+    conn = get_conn(USER_SETTINGS_DB_PATH)
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
         conn.execute(
-            f"UPDATE UserSettings SET {assignments}, updated_at = ? WHERE username = ?",
-            tuple(values),
+            f"""
+            INSERT INTO UserSettings (username, language, email, theme, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(username) DO UPDATE SET
+                {assignments},
+                updated_at=excluded.updated_at
+            """,
+            (
+                username,
+                updates.get("language", "pt-BR"),
+                updates.get("email", ""),
+                updates.get("theme", "auto"),
+                now,
+                now,
+            ),
         )
-        if conn.total_changes == 0:
-            default_language = updates.get("language", "pt-BR")
-            default_email = updates.get("email", "")
-            default_theme = updates.get("theme", "auto")
-            conn.execute(
-                "INSERT INTO UserSettings (username, language, email, theme, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
-                (username, default_language, default_email, default_theme, now, now),
-            )
-        conn.commit()
-    finally:
-        conn.close()
+    _settings_cache.pop(username, None)
 
 
 def ensure_released_db_initialized() -> None:
     """Create the Released table if needed."""
 
+    if RELEASED_DB_PATH in _INITIALIZED_DBS:
+        return
     ensure_server_directories()
-    conn = sqlite3.connect(make_long_path(RELEASED_DB_PATH))
-    try:
+    conn = get_conn(RELEASED_DB_PATH)
+    with conn:
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS Released (
@@ -648,40 +950,36 @@ def ensure_released_db_initialized() -> None:
             );
             """
         )
-        conn.commit()
-    finally:
-        conn.close()
+        # list_released_entries reads newest first; walk an index instead of sorting.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_released_created_at ON Released(created_at DESC)"
+        )
+    _INITIALIZED_DBS.add(RELEASED_DB_PATH)
 
 
 def list_released_entries() -> List[Dict[str, str]]:
     """Return all released ECR metadata."""
 
     ensure_released_db_initialized()
-    conn = sqlite3.connect(make_long_path(RELEASED_DB_PATH))
-    try:
-        conn.row_factory = sqlite3.Row
+    conn = get_conn(RELEASED_DB_PATH)
+    with conn:
         rows = conn.execute(
             "SELECT filename, name_file_old, revision_old, name_file_new, revision_new, created_by, created_at, source_result FROM Released ORDER BY created_at DESC"
         ).fetchall()
         return [dict(row) for row in rows]
-    finally:
-        conn.close()
 
 
 def find_released_entry(filename: str) -> Optional[Dict[str, str]]:
     """Return an existing released entry by filename if present."""
 
     ensure_released_db_initialized()
-    conn = sqlite3.connect(make_long_path(RELEASED_DB_PATH))
-    try:
-        conn.row_factory = sqlite3.Row
+    conn = get_conn(RELEASED_DB_PATH)
+    with conn:
         row = conn.execute(
             "SELECT filename, name_file_old, revision_old, name_file_new, revision_new, created_by, created_at, source_result FROM Released WHERE filename = ?",
             (filename,),
         ).fetchone()
         return dict(row) if row else None
-    finally:
-        conn.close()
 
 
 def record_released_entry(
@@ -696,11 +994,45 @@ def record_released_entry(
 ) -> None:
     """Insert or replace a released entry for the current user."""
 
+    record_released_entries(
+        [
+            {
+                "filename": filename,
+                "name_file_old": name_file_old,
+                "revision_old": revision_old,
+                "name_file_new": name_file_new,
+                "revision_new": revision_new,
+                "created_by": created_by,
+                "source_result": source_result,
+            }
+        ]
+    )
+
+
+def record_released_entries(entries: Sequence[Dict[str, str]]) -> None:
+    """Insert or replace several released entries in a single transaction."""
+
+    if not entries:
+        return
     ensure_released_db_initialized()
-    conn = sqlite3.connect(make_long_path(RELEASED_DB_PATH))
-    try:
-        now = datetime.utcnow().isoformat()
-        conn.execute(
+    now = _now_iso()
+    rows = [
+        (
+            entry["filename"],
+            entry["name_file_old"],
+            entry["revision_old"],
+            entry["name_file_new"],
+            entry["revision_new"],
+            entry["created_by"],
+            now,
+            entry["source_result"],
+        )
+        for entry in entries
+    ]
+    conn = get_conn(RELEASED_DB_PATH)
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
             """
             INSERT INTO Released (filename, name_file_old, revision_old, name_file_new, revision_new, created_by, created_at, source_result)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
@@ -713,36 +1045,31 @@ def record_released_entry(
                 created_at=excluded.created_at,
                 source_result=excluded.source_result
             """,
-            (
-                filename,
-                name_file_old,
-                revision_old,
-                name_file_new,
-                revision_new,
-                created_by,
-                now,
-                source_result,
-            ),
+            rows,
         )
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def delete_released_entry(filename: str) -> None:
     """Remove an entry from the released registry."""
 
     ensure_released_db_initialized()
-    conn = sqlite3.connect(make_long_path(RELEASED_DB_PATH))
-    try:
+    conn = get_conn(RELEASED_DB_PATH)
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
         conn.execute("DELETE FROM Released WHERE filename = ?", (filename,))
-        conn.commit()
-    finally:
-        conn.close()
 
 
 
 
+def write_dev_layout(path: Path, payload: str) -> None:
+    """Write a serialized developer layout, replacing the previous file in one step."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(payload, encoding="utf-8")
+    os.replace(temp_path, path)
+
+
 class LogEmitter(QObject):
     """Qt signal emitter for log messages."""
 
@@ -769,6 +1096,16 @@ class QtLogHandler(logging.Handler):
         self.emitter.message.emit(message)
 
 
+class EditableFlags(NamedTuple):
+    """Which override kinds a registered widget accepts."""
+
+    text: bool
+    style: bool
+    geometry: bool
+    icon: bool
+    action: bool
+
+
 class LayoutEditFilter(QObject):
     """Lightweight event filter enabling drag moves for target widgets."""
 
@@ -778,24 +1115,45 @@ class LayoutEditFilter(QObject):
         self.key = key
         self._dragging = False
         self._offset = QPoint()
+        # Parent origin in global coordinates, captured once per drag.
+        self._parent_origin = QPoint()
+        # Latest drag position; moves are applied at most once per frame.
+        self._drag_target: Optional[QWidget] = None
+        self._pending_pos: Optional[QPoint] = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(DRAG_REFRESH_MS)
+        self._move_timer.timeout.connect(self._flush_move)
+
+    def _flush_move(self) -> None:
+        if self._pending_pos is None or self._drag_target is None:
+            return
+        self._drag_target.move(self._pending_pos)
+        self._pending_pos = None
 
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # noqa: N802
         if not getattr(self.window, "layout_mode_enabled", False):
             return False
 
-        if event.type() == QEvent.MouseButtonPress and getattr(event, "button", lambda: None)() == Qt.LeftButton:
-            parent_origin = obj.parent().mapToGlobal(QPoint(0, 0)) if obj.parent() else QPoint(0, 0)
-            self._offset = event.globalPosition().toPoint() - parent_origin - obj.pos()
+        event_type = event.type()
+        if event_type == QEvent.MouseMove and self._dragging:
+            self._drag_target = obj
+            self._pending_pos = event.globalPosition().toPoint() - self._parent_origin - self._offset
+            if not self._move_timer.isActive():
+                self._move_timer.start()
+            return True
+        if event_type == QEvent.MouseButtonPress and getattr(event, "button", lambda: None)() == Qt.LeftButton:
+            parent = obj.parent()
+            self._parent_origin = parent.mapToGlobal(QPoint(0, 0)) if parent else QPoint(0, 0)
+            self._offset = event.globalPosition().toPoint() - self._parent_origin - obj.pos()
             self._dragging = True
             obj.setCursor(Qt.SizeAllCursor)
             return True
-        if event.type() == QEvent.MouseMove and self._dragging:
-            parent_origin = obj.parent().mapToGlobal(QPoint(0, 0)) if obj.parent() else QPoint(0, 0)
-            new_pos = event.globalPosition().toPoint() - parent_origin - self._offset
-            obj.move(new_pos)
-            return True
-        if event.type() == QEvent.MouseButtonRelease:
+        if event_type == QEvent.MouseButtonRelease:
             if self._dragging:
+                # Land exactly where the pointer was released.
+                self._move_timer.stop()
+                self._flush_move()
                 obj.setCursor(Qt.ArrowCursor)
             self._dragging = False
             return False
@@ -807,23 +1165,40 @@ class CompareSetWorker(QObject):
 
     finished = Signal(ComparisonResult)
     failed = Signal(str)
+    validation_failed = Signal(str)
     progress = Signal(int, int)
     cancelled = Signal()
 
-    def __init__(self, old_path: Path, new_path: Path) -> None:
+    def __init__(self, workers: Optional[int] = None) -> None:
         super().__init__()
-        self.old_path = old_path
-        self.new_path = new_path
+        self.workers = workers
         self._cancel_event = threading.Event()
 
-    @Slot()
-    def run(self) -> None:
+    def reset(self) -> None:
+        """Clear a cancellation left over from the previous comparison."""
+
+        self._cancel_event.clear()
+
+    @Slot(object, object)
+    def run(self, old_path: Path, new_path: Path) -> None:
         try:
+            # Resolving and stat-ing can stall on a slow share, so it happens
+            # here rather than on the GUI thread.
+            old_path = old_path.resolve()
+            new_path = new_path.resolve()
+            if not old_path.is_file():
+                self.validation_failed.emit("Please select a valid PDF for the old revision.")
+                return
+            if not new_path.is_file():
+                self.validation_failed.emit("Please select a valid PDF for the new revision.")
+                return
+            logger.info("Starting comparison: %s vs %s", old_path, new_path)
             result = run_comparison(
-                self.old_path,
-                self.new_path,
+                old_path,
+                new_path,
                 update_progress=self._emit_progress,
                 is_cancel_requested=self._cancel_event.is_set,
+                workers=self.workers,
             )
         except Exception as exc:  # pragma: no cover - Qt thread
             logger.exception("Comparison failed: %s", exc)
@@ -859,6 +1234,9 @@ class BackgroundTask(QObject):
             logger.exception("Background task failed: %s", exc)
             self.failed.emit(str(exc))
             return
+        finally:
+            # The thread ends with the task; don't leave its pooled handles behind.
+            csenv.close_thread_sqlite_connections()
         self.finished.emit(result)
 
 
@@ -878,6 +1256,20 @@ def _lock_widget_size(widget: QWidget) -> None:
     widget.resize(target_size)
 
 
+def open_with_default_application(path: Union[str, Path]) -> bool:
+    """Open ``path`` with the desktop's default handler for its file type."""
+
+    if not path:
+        return False
+    if not os.path.exists(path):
+        logger.warning("Cannot open missing file: %s", path)
+        return False
+    if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(path))):
+        logger.warning("No application available to open %s", path)
+        return False
+    return True
+
+
 def released_table_headers(language: str) -> List[str]:
     if language == "pt-BR":
         return [
@@ -904,6 +1296,16 @@ def released_table_headers(language: str) -> List[str]:
     ]
 
 
+def _list_directory_names(path: str) -> Set[str]:
+    """Return the entry names in ``path`` using a single directory scan."""
+
+    try:
+        with os.scandir(make_long_path(path)) as iterator:
+            return {item.name for item in iterator}
+    except OSError:
+        return set()
+
+
 class HistoryView(QWidget):
     """Embedded view showing previous comparisons for the current user."""
 
@@ -918,6 +1320,11 @@ class HistoryView(QWidget):
         self.entries: List[Dict[str, Union[str, datetime]]] = []
         self._loader_thread: Optional[QThread] = None
         self._loading_task: Optional[BackgroundTask] = None
+        self._release_thread: Optional[QThread] = None
+        self._release_task: Optional[BackgroundTask] = None
+        self._release_dialog: Optional[ReleaseDialog] = None
+        self._clear_thread: Optional[QThread] = None
+        self._clear_task: Optional[BackgroundTask] = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -942,8 +1349,11 @@ class HistoryView(QWidget):
         self.info_label = QLabel()
         card_layout.addWidget(self.info_label)
 
-        self.table = QTableWidget(0, 4)
+        self.table = QTableWidget(0, 3)
         self._configure_table_headers()
+        self.table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(self._show_entry_menu)
+        self.table.itemDoubleClicked.connect(self._open_entry_item)
         card_layout.addWidget(self.table)
 
         button_row = QHBoxLayout()
@@ -971,14 +1381,12 @@ class HistoryView(QWidget):
             tr(self.language, "history_table_date"),
             tr(self.language, "history_table_base"),
             tr(self.language, "history_table_file"),
-            tr(self.language, "history_actions"),
         ]
         self.table.setHorizontalHeaderLabels(headers)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
         self.table.verticalHeader().setVisible(False)
         self.table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.table.setSelectionBehavior(QTableWidget.SelectRows)
@@ -1011,6 +1419,7 @@ class HistoryView(QWidget):
         task.finished.connect(thread.quit)
         task.failed.connect(thread.quit)
         task.finished.connect(task.deleteLater)
+        task.failed.connect(task.deleteLater)
         thread.finished.connect(thread.deleteLater)
         self._loading_task = task
         self._loader_thread = thread
@@ -1034,8 +1443,6 @@ class HistoryView(QWidget):
         self._loading_task = None
 
     def _populate_history_table(self) -> None:
-        self.table.setRowCount(len(self.entries))
-
         if not self.entries:
             self.info_label.setText(tr(self.language, "history_empty"))
         else:
@@ -1043,60 +1450,98 @@ class HistoryView(QWidget):
                 tr(self.language, "history_showing").format(count=len(self.entries), user=self.username)
             )
 
+        rows = self._build_history_rows()
+        self.table.setUpdatesEnabled(False)
+        self.table.setSortingEnabled(False)
+        try:
+            self.table.setRowCount(len(rows))
+            for row_index, items in enumerate(rows):
+                for column, item in enumerate(items):
+                    self.table.setItem(row_index, column, item)
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self.table.resizeColumnsToContents()
+        self.table.resizeRowsToContents()
+
+    def _build_history_rows(self) -> List[Tuple[QTableWidgetItem, QTableWidgetItem, QTableWidgetItem]]:
+        """Create every row's items before any of them touch the table."""
+
+        rows = []
         for row_index, entry in enumerate(self.entries):
             timestamp_item = QTableWidgetItem(entry["display_time"])
-            timestamp_item.setData(Qt.UserRole, entry["timestamp"])
-            self.table.setItem(row_index, 0, timestamp_item)
-            self.table.setItem(row_index, 1, QTableWidgetItem(entry["base_name"]))
-            self.table.setItem(row_index, 2, QTableWidgetItem(entry["filename"]))
-
-            action_widget = QWidget()
-            action_layout = QHBoxLayout(action_widget)
-            action_layout.setContentsMargins(0, 0, 0, 0)
-            view_button = QPushButton(tr(self.language, "history_view"))
-            view_button.clicked.connect(
-                lambda _=False, p=entry["path"]: open_with_default_application(p)
+            timestamp_item.setData(Qt.UserRole, row_index)
+            rows.append(
+                (timestamp_item, QTableWidgetItem(entry["base_name"]), QTableWidgetItem(entry["filename"]))
             )
-            export_button = QPushButton(tr(self.language, "history_export"))
-            export_button.clicked.connect(
-                lambda _=False, p=entry["path"], fn=entry["filename"]: self.export_result(p, fn)
-            )
-            action_layout.addWidget(view_button)
-            action_layout.addWidget(export_button)
+        return rows
 
-            if entry.get("log_path") and self.role == "admin":
-                log_button = QPushButton(tr(self.language, "history_view_log"))
-                log_button.clicked.connect(
-                    lambda _=False, lp=entry["log_path"]: self.view_log(lp)
-                )
-                action_layout.addWidget(log_button)
+    def _entry_at_row(self, row: int) -> Optional[Dict[str, Union[str, datetime]]]:
+        item = self.table.item(row, 0)
+        index = item.data(Qt.UserRole) if item is not None else None
+        if index is None or not 0 <= index < len(self.entries):
+            return None
+        return self.entries[index]
 
-            action_layout.addStretch()
-            self.table.setCellWidget(row_index, 3, action_widget)
+    @Slot(QTableWidgetItem)
+    def _open_entry_item(self, item: QTableWidgetItem) -> None:
+        entry = self._entry_at_row(item.row())
+        if entry is not None:
+            open_with_default_application(entry["path"])
 
-        self.table.resizeColumnsToContents()
-        self.table.resizeRowsToContents()
+    @Slot(QPoint)
+    def _show_entry_menu(self, position: QPoint) -> None:
+        """Build the per-row actions on demand instead of one widget per row."""
+
+        item = self.table.itemAt(position)
+        entry = self._entry_at_row(item.row()) if item is not None else None
+        if entry is None:
+            return
+
+        menu = QMenu(self)
+        view_action = menu.addAction(tr(self.language, "history_view"))
+        export_action = menu.addAction(tr(self.language, "history_export"))
+        log_action = None
+        if entry.get("log_path") and self.role == "admin":
+            log_action = menu.addAction(tr(self.language, "history_view_log"))
+
+        chosen = menu.exec(self.table.viewport().mapToGlobal(position))
+        if chosen is None:
+            return
+        if chosen is view_action:
+            open_with_default_application(entry["path"])
+        elif chosen is export_action:
+            self.export_result(entry["path"], entry["filename"])
+        elif chosen is log_action:
+            self.view_log(entry["log_path"])
 
     def _collect_entries(self) -> List[Dict[str, Union[str, datetime]]]:
         entries: List[Dict[str, Union[str, datetime]]] = []
+        # One directory listing per log folder instead of a stat per entry.
+        log_names: Dict[str, Set[str]] = {}
         for raw_entry in load_history():
             try:
                 timestamp = datetime.fromisoformat(raw_entry.timestamp)
             except Exception:
                 timestamp = datetime.now()
-            result_path = Path(raw_entry.result_path_local)
-            entries.append(
-                {
-                    "base_name": result_path.stem,
-                    "timestamp": timestamp,
-                    "display_time": timestamp.strftime("%d/%m/%Y %H:%M:%S"),
-                    "filename": result_path.name,
-                    "path": str(result_path),
-                    "job_id": raw_entry.job_id,
-                    "log_status": raw_entry.server_log_status,
-                    "release_status": raw_entry.server_released_status,
-                }
-            )
+            result_path = raw_entry.result_path_local
+            filename = os.path.basename(result_path)
+            entry: Dict[str, Union[str, datetime]] = {
+                "base_name": os.path.splitext(filename)[0],
+                "timestamp": timestamp,
+                "display_time": timestamp.strftime("%d/%m/%Y %H:%M:%S"),
+                "filename": filename,
+                "path": result_path,
+                "job_id": raw_entry.job_id,
+                "log_status": raw_entry.server_log_status,
+                "release_status": raw_entry.server_released_status,
+            }
+            if raw_entry.server_log_status == "ENVIADO" and raw_entry.server_log_message:
+                log_dir, log_name = os.path.split(raw_entry.server_log_message)
+                if log_dir not in log_names:
+                    log_names[log_dir] = _list_directory_names(log_dir)
+                if log_name in log_names[log_dir]:
+                    entry["log_path"] = raw_entry.server_log_message
+            entries.append(entry)
 
         entries.sort(key=lambda item: item["timestamp"], reverse=True)
         return entries
@@ -1108,7 +1553,7 @@ class HistoryView(QWidget):
         if not target_path:
             return
         try:
-            shutil.copyfile(source_path, target_path)
+            server_io.copy_file(source_path, target_path)
             QMessageBox.information(
                 self,
                 "CompareSet",
@@ -1124,21 +1569,46 @@ class HistoryView(QWidget):
             QMessageBox.information(self, "CompareSet", "Log file not found.")
             return
         try:
-            with open(log_path, "r", encoding="utf-8", errors="ignore") as handle:
-                content = handle.read()
+            handle = open(log_path, "rb")
         except Exception as exc:
             QMessageBox.warning(
                 self, "CompareSet", f"Unable to read log: {exc}"
             )
             return
+        try:
+            size = os.fstat(handle.fileno()).st_size
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        except Exception as exc:
+            handle.close()
+            QMessageBox.warning(
+                self, "CompareSet", f"Unable to read log: {exc}"
+            )
+            return
 
         dialog = QDialog(self)
         dialog.setWindowTitle("Comparison Log")
         layout = QVBoxLayout(dialog)
         text_view = QTextEdit()
         text_view.setReadOnly(True)
-        text_view.setPlainText(content)
         layout.addWidget(text_view)
+
+        # Stream the mapped file in chunks so large logs never block the dialog.
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        cursor = QTextCursor(text_view.document())
+        state = {"offset": 0, "closed": False}
+
+        def load_next_chunk() -> None:
+            if state["closed"]:
+                return
+            start = state["offset"]
+            end = min(start + LOG_VIEW_CHUNK_BYTES, size)
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(decoder.decode(data[start:end], final=end >= size))
+            state["offset"] = end
+            if end < size:
+                QTimer.singleShot(0, load_next_chunk)
+
+        QTimer.singleShot(0, load_next_chunk)
         close_button = QPushButton(tr(self.language, "history_close"))
         close_button.clicked.connect(dialog.accept)
         button_row = QHBoxLayout()
@@ -1146,9 +1616,17 @@ class HistoryView(QWidget):
         button_row.addWidget(close_button)
         layout.addLayout(button_row)
         _lock_widget_size(dialog)
-        dialog.exec()
+        try:
+            dialog.exec()
+        finally:
+            state["closed"] = True
+            if size:
+                data.close()
+            handle.close()
 
     def send_selected_to_released(self) -> None:
+        if self._release_thread is not None and self._release_thread.isRunning():
+            return
         if self.table.currentRow() < 0 or self.table.currentRow() >= len(self.entries):
             QMessageBox.information(
                 self,
@@ -1158,7 +1636,10 @@ class HistoryView(QWidget):
             return
 
         entry = self.entries[self.table.currentRow()]
-        dialog = ReleaseDialog(self.language, self)
+        if self._release_dialog is None or self._release_dialog.language != self.language:
+            self._release_dialog = ReleaseDialog(self.language, self)
+        dialog = self._release_dialog
+        dialog.reload()
         dialog.name_file_old.setText(f"{entry['base_name']}.pdf")
         dialog.name_file_new.setText(f"{entry['base_name']}.pdf")
         if dialog.exec() != QDialog.Accepted:
@@ -1166,41 +1647,92 @@ class HistoryView(QWidget):
 
         data = dialog.data()
         job_id = entry.get("job_id", Path(entry["path"]).stem)
-        success, message = server_io.send_released_pdf(job_id, Path(entry["path"]))
-        update_entry_status(
-            job_id,
-            release_status="LIBERADO" if success else "ERRO",
-            release_message=message,
-        )
+
+        def release() -> Tuple[bool, str]:
+            success, message = server_io.send_released_pdf(job_id, Path(entry["path"]))
+            update_entry_status(
+                job_id,
+                release_status="LIBERADO" if success else "ERRO",
+                release_message=message,
+            )
+            return success, message
+
+        # The upload crosses the server share, so keep it off the UI thread.
+        self.released_button.setEnabled(False)
+        task = BackgroundTask(release)
+        thread = QThread(self)
+        task.moveToThread(thread)
+        thread.started.connect(task.run)
+        task.finished.connect(self._on_release_finished)
+        task.failed.connect(self._on_release_failed)
+        task.finished.connect(thread.quit)
+        task.failed.connect(thread.quit)
+        task.finished.connect(task.deleteLater)
+        task.failed.connect(task.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._release_task = task
+        self._release_thread = thread
+        thread.start()
+
+    @Slot(object)
+    def _on_release_finished(self, outcome: Tuple[bool, str]) -> None:
+        self._release_thread = None
+        self._release_task = None
+        self.released_button.setEnabled(True)
+        success, message = outcome
         if success:
             QMessageBox.information(self, "ECR Released", f"Arquivo liberado: {message}")
         else:
             QMessageBox.critical(self, "ECR Released", f"Erro ao liberar: {message}")
         self._start_loading_history()
 
+    @Slot(str)
+    def _on_release_failed(self, message: str) -> None:
+        self._release_thread = None
+        self._release_task = None
+        self.released_button.setEnabled(True)
+        QMessageBox.critical(self, "ECR Released", f"Erro ao liberar: {message}")
+
     def clear_history(self) -> None:
-        prompt = (
-            "Remover todos os resultados exibidos? Esta ação não pode ser desfeita."
-            if self.language == "pt-BR"
-            else "Remove all results? This action cannot be undone."
-        )
+        prompt = tr(self.language, "history_clear_prompt")
         if QMessageBox.question(self, tr(self.language, "history_title"), prompt) != QMessageBox.Yes:
             return
-        try:
-            clear_history_and_temp()
-            self._start_loading_history()
-            QMessageBox.information(
-                self,
-                tr(self.language, "history_title"),
-                "Histórico limpo." if self.language == "pt-BR" else "History cleared.",
-            )
-        except Exception as exc:
-            message = (
-                f"Erro ao limpar histórico: {exc}"
-                if self.language == "pt-BR"
-                else f"Unable to clear history: {exc}"
-            )
-            QMessageBox.critical(self, tr(self.language, "history_title"), message)
+        # Deleting many job folders is slow on a busy disk; keep it off the UI thread.
+        self._set_loading_state(True)
+        task = BackgroundTask(clear_history_and_temp)
+        thread = QThread(self)
+        task.moveToThread(thread)
+        thread.started.connect(task.run)
+        task.finished.connect(self._on_history_cleared)
+        task.failed.connect(self._on_history_clear_failed)
+        task.finished.connect(thread.quit)
+        task.failed.connect(thread.quit)
+        task.finished.connect(task.deleteLater)
+        task.failed.connect(task.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._clear_task = task
+        self._clear_thread = thread
+        thread.start()
+
+    @Slot(object)
+    def _on_history_cleared(self, _result: object) -> None:
+        self._clear_task = None
+        self._clear_thread = None
+        self._set_loading_state(False)
+        self._start_loading_history()
+        QMessageBox.information(
+            self,
+            tr(self.language, "history_title"),
+            tr(self.language, "history_cleared"),
+        )
+
+    @Slot(str)
+    def _on_history_clear_failed(self, message: str) -> None:
+        self._clear_task = None
+        self._clear_thread = None
+        self._set_loading_state(False)
+        text = tr(self.language, "history_clear_failed").format(message=message)
+        QMessageBox.critical(self, tr(self.language, "history_title"), text)
 
 
 class SettingsDialog(QDialog):
@@ -1245,10 +1777,11 @@ class SettingsDialog(QDialog):
         settings = get_or_create_user_settings(self.username)
         language = settings.get("language", "pt-BR")
         theme = settings.get("theme", "auto")
-        if language in {"pt-BR", "en-US"}:
-            self.language_combo.setCurrentText(language)
-        idx = self.theme_combo.findData(theme)
-        self.theme_combo.setCurrentIndex(max(idx, 0))
+        with QSignalBlocker(self.language_combo), QSignalBlocker(self.theme_combo):
+            if language in {"pt-BR", "en-US"}:
+                self.language_combo.setCurrentText(language)
+            idx = self.theme_combo.findData(theme)
+            self.theme_combo.setCurrentIndex(max(idx, 0))
 
     def save(self) -> None:
         update_user_settings(
@@ -1291,6 +1824,60 @@ class EmailPromptDialog(QDialog):
         return self.email_edit.text().strip()
 
 
+class UsersListModel(QAbstractListModel):
+    """List model over user rows for the administration view.
+
+    While ``set_placeholder`` text is set the model shows that single,
+    unselectable row instead of the users.
+    """
+
+    def __init__(self, language: str, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._language = language
+        self._users: List[Dict[str, Union[str, int]]] = []
+        self._placeholder: Optional[str] = None
+
+    def set_users(self, users: List[Dict[str, Union[str, int]]]) -> None:
+        self.beginResetModel()
+        self._users = users
+        self._placeholder = None
+        self.endResetModel()
+
+    def set_placeholder(self, text: str) -> None:
+        self.beginResetModel()
+        self._placeholder = text
+        self.endResetModel()
+
+    def set_language(self, language: str) -> None:
+        self._language = language
+        if self._users and self._placeholder is None:
+            self.dataChanged.emit(self.index(0), self.index(len(self._users) - 1), [Qt.DisplayRole])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        if parent.isValid():
+            return 0
+        return 1 if self._placeholder is not None else len(self._users)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if self._placeholder is not None:
+            return Qt.NoItemFlags
+        return super().flags(index)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if self._placeholder is not None:
+            return self._placeholder if role == Qt.DisplayRole else None
+        user = self._users[index.row()]
+        if role == Qt.DisplayRole:
+            status_key = "status_active" if user.get("is_active") else "status_inactive"
+            email = user.get("email") or ""
+            return f"{user['username']} - {email} - {user['role']} ({tr(self._language, status_key)})"
+        if role == Qt.UserRole:
+            return user
+        return None
+
+
 class AdminView(QWidget):
     """Embedded administration view inside the main window."""
 
@@ -1298,6 +1885,13 @@ class AdminView(QWidget):
         super().__init__(parent)
         self.language = language
         self._loader_thread: Optional[QThread] = None
+        self._loading_task: Optional[BackgroundTask] = None
+        # Set when a refresh is requested while a load is running; it reloads once that ends.
+        self._reload_pending = False
+        # Users as last read from the database; searches filter this list.
+        self._users_cache: List[Dict[str, Union[str, int]]] = []
+        # (search text, id of the cache) behind the rows currently shown.
+        self._last_filter_key: Optional[Tuple[str, int]] = None
 
         wrapper = QVBoxLayout(self)
         wrapper.setContentsMargins(0, 0, 0, 0)
@@ -1309,11 +1903,18 @@ class AdminView(QWidget):
         layout.setSpacing(14)
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText(tr(language, "search_user_placeholder"))
-        self.search_input.textChanged.connect(self.refresh_user_list)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_filter)
+        self.search_input.textChanged.connect(self._search_timer.start)
         layout.addWidget(self.search_input)
 
-        self.user_list = QListWidget()
-        self.user_list.currentItemChanged.connect(self.on_user_selected)
+        self.user_model = UsersListModel(language, self)
+        self.user_list = QListView()
+        self.user_list.setUniformItemSizes(True)
+        self.user_list.setModel(self.user_model)
+        self.user_list.selectionModel().currentChanged.connect(self.on_user_selected)
         layout.addWidget(self.user_list)
 
         self.admin_username_input = QLineEdit()
@@ -1350,34 +1951,95 @@ class AdminView(QWidget):
         self.admin_active_checkbox.setText(tr(language, "status_active"))
         self.add_user_button.setText(tr(language, "add_user"))
         self.update_user_button.setText(tr(language, "update_user"))
-        self.refresh_user_list()
+        self.user_model.set_language(language)
 
     def refresh_user_list(self) -> None:
-        try:
+        """Reload users from the database in the background and redisplay them."""
+
+        if self._loader_thread is not None:
+            # The running load may predate the caller's write; read again once it ends.
+            self._reload_pending = True
+            return
+        self._reload_pending = False
+
+        def load_users() -> List[Dict[str, Union[str, int]]]:
             users = list_users()
-        except Exception as exc:
-            QMessageBox.critical(self, tr(self.language, "admin_title"), f"Could not load users:\n{exc}")
+            for user in users:
+                user["_username_lc"] = str(user.get("username", "")).lower()
+            return users
+
+        self._set_loading_state(True)
+        task = BackgroundTask(load_users)
+        thread = QThread(self)
+        task.moveToThread(thread)
+        thread.started.connect(task.run)
+        task.finished.connect(self._on_users_loaded)
+        task.failed.connect(self._on_users_failed)
+        task.finished.connect(thread.quit)
+        task.failed.connect(thread.quit)
+        task.finished.connect(task.deleteLater)
+        task.failed.connect(task.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._loading_task = task
+        self._loader_thread = thread
+        thread.start()
+
+    def _set_loading_state(self, loading: bool) -> None:
+        self.user_list.setEnabled(not loading)
+        self.search_input.setEnabled(not loading)
+        if loading:
+            self.user_model.set_placeholder(tr(self.language, "admin_loading_users"))
+            self._last_filter_key = None
+
+    @Slot(object)
+    def _on_users_loaded(self, users: List[Dict[str, Union[str, int]]]) -> None:
+        self._loader_thread = None
+        self._loading_task = None
+        self._users_cache = users
+        self._set_loading_state(False)
+        self._apply_filter()
+        if self._reload_pending:
+            self.refresh_user_list()
+
+    @Slot(str)
+    def _on_users_failed(self, message: str) -> None:
+        self._loader_thread = None
+        self._loading_task = None
+        self._set_loading_state(False)
+        self._apply_filter()
+        if self._reload_pending:
+            self.refresh_user_list()
             return
-        self.user_list.clear()
+        QMessageBox.critical(self, tr(self.language, "admin_title"), f"Could not load users:\n{message}")
+
+    @Slot()
+    def _apply_filter(self) -> None:
         search_text = (self.search_input.text() or "").lower().strip()
-        for user in users:
-            if search_text and search_text not in str(user.get("username", "")).lower():
-                continue
-            status = tr(self.language, "status_active") if user.get("is_active") else tr(self.language, "status_inactive")
-            email = user.get("email") or ""
-            item = QListWidgetItem(f"{user['username']} - {email} - {user['role']} ({status})")
-            item.setData(Qt.UserRole, user)
-            self.user_list.addItem(item)
+        filter_key = (search_text, id(self._users_cache))
+        if filter_key == self._last_filter_key:
+            return
+        self._last_filter_key = filter_key
+        if not search_text:
+            users = self._users_cache
+        elif "*" in search_text or "?" in search_text:
+            # Wildcards match the whole name; a trailing "*" is implied, so
+            # "*silva" finds the text anywhere.
+            pattern = search_text if search_text.endswith("*") else search_text + "*"
+            users = [user for user in self._users_cache if fnmatch.fnmatchcase(user["_username_lc"], pattern)]
+        else:
+            users = [user for user in self._users_cache if user["_username_lc"].startswith(search_text)]
+        self.user_model.set_users(users)
 
-    def on_user_selected(
-        self, current: Optional[QListWidgetItem], previous: Optional[QListWidgetItem]
-    ) -> None:
-        if not current:
+    def on_user_selected(self, current: QModelIndex, previous: QModelIndex) -> None:
+        if not current.isValid():
             return
         data = current.data(Qt.UserRole) or {}
-        self.admin_username_input.setText(data.get("username", ""))
-        self.admin_role_combo.setCurrentText(str(data.get("role", "user")))
-        self.admin_active_checkbox.setChecked(bool(data.get("is_active", 0)))
+        with QSignalBlocker(self.admin_username_input), QSignalBlocker(self.admin_role_combo), QSignalBlocker(
+            self.admin_active_checkbox
+        ):
+            self.admin_username_input.setText(data.get("username", ""))
+            self.admin_role_combo.setCurrentText(str(data.get("role", "user")))
+            self.admin_active_checkbox.setChecked(bool(data.get("is_active", 0)))
         self.email_label.setText(data.get("email") or "")
 
     def on_add_user(self) -> None:
@@ -1398,7 +2060,7 @@ class AdminView(QWidget):
             )
 
     def on_update_user(self) -> None:
-        if not self.user_list or not self.user_list.currentItem():
+        if not self.user_list.currentIndex().isValid():
             QMessageBox.warning(self, tr(self.language, "admin_title"), "Select a user to update.")
             return
         username = self.admin_username_input.text().strip()
@@ -1410,7 +2072,13 @@ class AdminView(QWidget):
         try:
             update_user_record(username, role=role, is_active=is_active)
             QMessageBox.information(self, tr(self.language, "admin_title"), "User updated.")
-            self.refresh_user_list()
+            for user in self._users_cache:
+                if user["username"] == username:
+                    user["role"] = role
+                    user["is_active"] = is_active
+            # The cache was patched in place, so its id no longer marks a change.
+            self._last_filter_key = None
+            self._apply_filter()
         except Exception as exc:
             QMessageBox.critical(
                 self, tr(self.language, "admin_title"), f"Unable to update user: {exc}"
@@ -1453,6 +2121,12 @@ class ReleaseDialog(QDialog):
         wrapper.addWidget(card)
         _lock_widget_size(self)
 
+    def reload(self) -> None:
+        """Clear the fields so the dialog can be reused for another release."""
+
+        for field in (self.name_file_old, self.rev_old, self.name_file_new, self.rev_new):
+            field.clear()
+
     def _validate(self) -> None:
         fields = [
             self.name_file_old.text().strip(),
@@ -1478,6 +2152,194 @@ class ReleaseDialog(QDialog):
         }
 
 
+class ReleasedTableModel(QAbstractTableModel):
+    """Table model over released entries; the last column hosts the row actions."""
+
+    COLUMNS = (
+        "created_at",
+        "name_file_old",
+        "revision_old",
+        "name_file_new",
+        "revision_new",
+        "created_by",
+        "status",
+        "filename",
+        "actions",
+    )
+    ACTIONS_COLUMN = len(COLUMNS) - 1
+    STRETCH_COLUMNS = (1, 3)
+    DEFAULT_WIDTHS = {0: 140, 2: 80, 4: 80, 5: 110, 6: 90, 7: 220, 8: 220}
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._entries: List[Dict[str, str]] = []
+        self._display_times: List[str] = []
+        self._search_keys: List[str] = []
+        self._headers: List[str] = [""] * len(self.COLUMNS)
+        self._status_text = ""
+
+    def set_entries(self, entries: List[Dict[str, str]]) -> None:
+        self.beginResetModel()
+        self._entries = entries
+        self._display_times = []
+        # Lower-cased "filename\ncreated_by"; the newline keeps a search from
+        # matching across the two fields.
+        self._search_keys = [
+            f"{entry.get('filename', '')}\n{entry.get('created_by', '')}".lower() for entry in entries
+        ]
+        for entry in entries:
+            created_at = entry.get("created_at", "")
+            try:
+                self._display_times.append(datetime.fromisoformat(created_at).strftime("%d/%m/%Y %H:%M:%S"))
+            except Exception:
+                self._display_times.append(created_at)
+        self.endResetModel()
+
+    def set_labels(self, headers: List[str], status_text: str) -> None:
+        self._headers = headers
+        self._status_text = status_text
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.COLUMNS) - 1)
+        if self._entries:
+            status_column = self.COLUMNS.index("status")
+            self.dataChanged.emit(
+                self.index(0, status_column), self.index(len(self._entries) - 1, status_column)
+            )
+
+    def entry(self, row: int) -> Dict[str, str]:
+        return self._entries[row]
+
+    def search_key(self, row: int) -> str:
+        return self._search_keys[row]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.UserRole:
+            return self._entries[index.row()]
+        if role != Qt.DisplayRole:
+            return None
+        column = self.COLUMNS[index.column()]
+        if column == "created_at":
+            return self._display_times[index.row()]
+        if column == "status":
+            return self._status_text
+        if column == "actions":
+            return None
+        return self._entries[index.row()].get(column, "")
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:  # noqa: N802
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+
+
+class ReleasedFilterProxy(QSortFilterProxyModel):
+    """Filter released entries by file name or creator, case-insensitively."""
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._search_text = ""
+
+    def set_search_text(self, text: str) -> None:
+        text = text.lower().strip()
+        if text != self._search_text:
+            self._search_text = text
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:  # noqa: N802
+        return not self._search_text or self._search_text in self.sourceModel().search_key(source_row)
+
+
+class ReleasedActionsDelegate(QStyledItemDelegate):
+    """Paint the row action buttons and dispatch clicks without per-row widgets."""
+
+    BUTTON_SPACING = 6
+    BUTTON_PADDING = 24
+
+    def __init__(self, view: QTableView, on_action) -> None:
+        super().__init__(view)
+        self._on_action = on_action
+        self._actions: List[Tuple[str, str]] = []
+        # Never shown; lets the stylesheet's QPushButton rules style the painted buttons.
+        self._button_style_source = QPushButton(view)
+        self._button_style_source.hide()
+
+    def set_actions(self, actions: List[Tuple[str, str]]) -> None:
+        """Set the ``(action, label)`` pairs shown on every row."""
+
+        self._actions = actions
+
+    def _button_rects(self, rect: QRect) -> List[QRect]:
+        metrics = self._button_style_source.fontMetrics()
+        height = max(min(rect.height() - 4, metrics.height() + 12), 0)
+        top = rect.top() + (rect.height() - height) // 2
+        left = rect.left() + 2
+        rects = []
+        for _, label in self._actions:
+            width = metrics.horizontalAdvance(label) + self.BUTTON_PADDING
+            rects.append(QRect(left, top, width, height))
+            left += width + self.BUTTON_SPACING
+        return rects
+
+    def paint(self, painter, option, index: QModelIndex) -> None:
+        super().paint(painter, option, index)
+        style = self._button_style_source.style()
+        for (_, label), rect in zip(self._actions, self._button_rects(option.rect)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = label
+            button.state = QStyle.State_Enabled | QStyle.State_Raised
+            button.palette = option.palette
+            style.drawControl(QStyle.CE_PushButton, button, painter, self._button_style_source)
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:  # noqa: N802
+        metrics = self._button_style_source.fontMetrics()
+        width = sum(metrics.horizontalAdvance(label) + self.BUTTON_PADDING for _, label in self._actions)
+        width += self.BUTTON_SPACING * max(len(self._actions) - 1, 0) + 4
+        return QSize(width, metrics.height() + 16)
+
+    def editorEvent(self, event: QEvent, model, option, index: QModelIndex) -> bool:  # noqa: N802
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return False
+        position = event.position().toPoint()
+        for (action, _), rect in zip(self._actions, self._button_rects(option.rect)):
+            if rect.contains(position):
+                self._on_action(action, index.data(Qt.UserRole))
+                return True
+        return False
+
+
+def _setup_released_table(table: QTableView) -> None:
+    """Apply the shared column sizing and selection behaviour of released tables.
+
+    Columns start at fixed widths instead of ``ResizeToContents``, which
+    re-measures every row on each model reset; ``_fit_released_columns`` sizes
+    them to the data once after the first load.
+    """
+
+    header = table.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.Interactive)
+    for column in ReleasedTableModel.STRETCH_COLUMNS:
+        header.setSectionResizeMode(column, QHeaderView.Stretch)
+    for column, width in ReleasedTableModel.DEFAULT_WIDTHS.items():
+        table.setColumnWidth(column, width)
+    table.verticalHeader().setVisible(False)
+    table.setEditTriggers(QTableView.NoEditTriggers)
+    table.setSelectionBehavior(QTableView.SelectRows)
+    table.setSelectionMode(QTableView.SingleSelection)
+
+
+def _fit_released_columns(table: QTableView) -> None:
+    for column in ReleasedTableModel.DEFAULT_WIDTHS:
+        table.resizeColumnToContents(column)
+
+
 class ReleasedDialog(QDialog):
     """Dialog showing all released ECRs with search and actions."""
 
@@ -1496,11 +2358,15 @@ class ReleasedDialog(QDialog):
         card_layout = QVBoxLayout(card)
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by file or user…")
-        self.search_input.textChanged.connect(self._apply_filter)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_filter)
+        self.search_input.textChanged.connect(self._search_timer.start)
         card_layout.addWidget(self.search_input)
 
-        self.table = QTableWidget(0, 9)
-        self.table.setHorizontalHeaderLabels(
+        self.model = ReleasedTableModel(self)
+        self.model.set_labels(
             [
                 "Date/Time",
                 "Name File OLD",
@@ -1511,22 +2377,20 @@ class ReleasedDialog(QDialog):
                 "Status",
                 "File name",
                 "Actions",
-            ]
+            ],
+            "Released",
         )
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.Stretch)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(6, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(7, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(8, QHeaderView.ResizeToContents)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.proxy = ReleasedFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.actions_delegate = ReleasedActionsDelegate(self.table, self._on_entry_action)
+        actions = [("view", tr(language, "released_view")), ("export", tr(language, "released_export"))]
+        if self.role == "admin":
+            actions.append(("delete", tr(language, "released_delete")))
+        self.actions_delegate.set_actions(actions)
+        self.table.setItemDelegateForColumn(ReleasedTableModel.ACTIONS_COLUMN, self.actions_delegate)
+        _setup_released_table(self.table)
         card_layout.addWidget(self.table)
 
         close_button = QPushButton(tr(language, "released_close"))
@@ -1540,6 +2404,7 @@ class ReleasedDialog(QDialog):
 
         self._loader_thread: Optional[QThread] = None
         self._loading_task: Optional[BackgroundTask] = None
+        self._columns_fitted = False
         self._start_loading_entries()
         _lock_widget_size(self)
 
@@ -1556,7 +2421,7 @@ class ReleasedDialog(QDialog):
             return
 
         self._all_entries = []
-        self.table.setRowCount(0)
+        self.model.set_entries([])
         self._set_loading_state(True)
 
         task = BackgroundTask(list_released_entries)
@@ -1568,6 +2433,7 @@ class ReleasedDialog(QDialog):
         task.finished.connect(thread.quit)
         task.failed.connect(thread.quit)
         task.finished.connect(task.deleteLater)
+        task.failed.connect(task.deleteLater)
         thread.finished.connect(thread.deleteLater)
         self._loading_task = task
         self._loader_thread = thread
@@ -1576,6 +2442,10 @@ class ReleasedDialog(QDialog):
     @Slot(object)
     def _on_entries_loaded(self, entries: List[Dict[str, str]]) -> None:
         self._all_entries = entries
+        self.model.set_entries(entries)
+        if not self._columns_fitted and entries:
+            _fit_released_columns(self.table)
+            self._columns_fitted = True
         self._set_loading_state(False)
         self._apply_filter()
         self._loader_thread = None
@@ -1585,7 +2455,7 @@ class ReleasedDialog(QDialog):
     @Slot(str)
     def _on_entries_failed(self, message: str) -> None:
         self._all_entries = []
-        self.table.setRowCount(0)
+        self.model.set_entries([])
         self.search_input.setPlaceholderText(f"Unable to load: {message}")
         self._set_loading_state(False)
         self._loader_thread = None
@@ -1594,57 +2464,17 @@ class ReleasedDialog(QDialog):
 
     @Slot()
     def _apply_filter(self) -> None:
-        if not self._all_entries and (self._loader_thread is None or not self._loader_thread.isRunning()):
-            self.table.setRowCount(0)
-        search_text = (self.search_input.text() or "").lower().strip()
-        entries = self._all_entries
-        if search_text:
-            entries = [
-                entry
-                for entry in entries
-                if search_text in entry.get("filename", "").lower()
-                or search_text in entry.get("created_by", "").lower()
-            ]
-        self._populate_table(entries)
-
-    def _populate_table(self, entries: List[Dict[str, str]]) -> None:
-        self.table.setRowCount(len(entries))
-        for row_index, entry in enumerate(entries):
-            created_at = entry.get("created_at", "")
-            try:
-                display_time = datetime.fromisoformat(created_at).strftime("%d/%m/%Y %H:%M:%S")
-            except Exception:
-                display_time = created_at
-            self.table.setItem(row_index, 0, QTableWidgetItem(display_time))
-            self.table.setItem(row_index, 1, QTableWidgetItem(entry.get("name_file_old", "")))
-            self.table.setItem(row_index, 2, QTableWidgetItem(entry.get("revision_old", "")))
-            self.table.setItem(row_index, 3, QTableWidgetItem(entry.get("name_file_new", "")))
-            self.table.setItem(row_index, 4, QTableWidgetItem(entry.get("revision_new", "")))
-            self.table.setItem(row_index, 5, QTableWidgetItem(entry.get("created_by", "")))
-            self.table.setItem(row_index, 6, QTableWidgetItem("Released"))
-            self.table.setItem(row_index, 7, QTableWidgetItem(entry.get("filename", "")))
-
-            actions = QWidget()
-            actions_layout = QHBoxLayout(actions)
-            actions_layout.setContentsMargins(0, 0, 0, 0)
-            view_btn = QPushButton(tr(self.language, "released_view"))
-            export_btn = QPushButton(tr(self.language, "released_export"))
-            view_btn.clicked.connect(
-                lambda _=False, p=entry.get("source_result", ""): open_with_default_application(p)
-            )
-            export_btn.clicked.connect(
-                lambda _=False, p=entry.get("source_result", ""), fn=entry.get("filename", ""): self.export_file(p, fn)
-            )
-            actions_layout.addWidget(view_btn)
-            actions_layout.addWidget(export_btn)
-            if self.role == "admin":
-                delete_btn = QPushButton(tr(self.language, "released_delete"))
-                delete_btn.clicked.connect(
-                    lambda _=False, e=entry: self.delete_entry(e)
-                )
-                actions_layout.addWidget(delete_btn)
-                actions_layout.addStretch()
-            self.table.setCellWidget(row_index, 8, actions)
+        self.proxy.set_search_text(self.search_input.text() or "")
+
+    def _on_entry_action(self, action: str, entry: Optional[Dict[str, str]]) -> None:
+        if not entry:
+            return
+        if action == "view":
+            open_with_default_application(entry.get("source_result", ""))
+        elif action == "export":
+            self.export_file(entry.get("source_result", ""), entry.get("filename", ""))
+        elif action == "delete":
+            self.delete_entry(entry)
 
     def export_file(self, source_path: str, filename: str) -> None:
         if not source_path:
@@ -1656,7 +2486,7 @@ class ReleasedDialog(QDialog):
         if not target_path:
             return
         try:
-            shutil.copyfile(source_path, target_path)
+            server_io.copy_file(source_path, target_path)
             QMessageBox.information(self, "ECR Released", f"File exported to:\n{target_path}")
         except Exception as exc:
             QMessageBox.critical(self, "ECR Released", f"Unable to export file:\n{exc}")
@@ -1691,6 +2521,7 @@ class ReleasedView(QWidget):
         self._all_entries: List[Dict[str, str]] = []
         self._loader_thread: Optional[QThread] = None
         self._loading_task: Optional[BackgroundTask] = None
+        self._columns_fitted = False
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -1714,10 +2545,21 @@ class ReleasedView(QWidget):
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText(tr(language, "released_search_placeholder"))
-        self.search_input.textChanged.connect(self._apply_filter)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_filter)
+        self.search_input.textChanged.connect(self._search_timer.start)
         card_layout.addWidget(self.search_input)
 
-        self.table = QTableWidget(0, 9)
+        self.model = ReleasedTableModel(self)
+        self.proxy = ReleasedFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.actions_delegate = ReleasedActionsDelegate(self.table, self._on_entry_action)
+        self.table.setItemDelegateForColumn(ReleasedTableModel.ACTIONS_COLUMN, self.actions_delegate)
+        _setup_released_table(self.table)
         self._configure_table_headers()
         card_layout.addWidget(self.table)
 
@@ -1730,7 +2572,6 @@ class ReleasedView(QWidget):
         self.refresh_button.setText(tr(language, "refresh"))
         self.search_input.setPlaceholderText(tr(language, "released_search_placeholder"))
         self._configure_table_headers()
-        self._apply_filter()
 
     def refresh(self) -> None:
         self._start_loading_entries()
@@ -1743,21 +2584,15 @@ class ReleasedView(QWidget):
             self._loading_task = None
 
     def _configure_table_headers(self) -> None:
-        self.table.setHorizontalHeaderLabels(released_table_headers(self.language))
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.Stretch)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(6, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(7, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(8, QHeaderView.ResizeToContents)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.model.set_labels(released_table_headers(self.language), tr(self.language, "released"))
+        actions = [("view", tr(self.language, "released_view")), ("export", tr(self.language, "released_export"))]
+        if self.role == "admin":
+            actions.append(("delete", tr(self.language, "released_delete")))
+        self.actions_delegate.set_actions(actions)
+        if self._columns_fitted:
+            # Status and button labels change with the language.
+            _fit_released_columns(self.table)
+        self.table.viewport().update()
 
     def _set_loading_state(self, loading: bool) -> None:
         self.table.setEnabled(not loading)
@@ -1772,7 +2607,7 @@ class ReleasedView(QWidget):
             return
 
         self._all_entries = []
-        self.table.setRowCount(0)
+        self.model.set_entries([])
         self._set_loading_state(True)
 
         task = BackgroundTask(list_released_entries)
@@ -1784,6 +2619,7 @@ class ReleasedView(QWidget):
         task.finished.connect(thread.quit)
         task.failed.connect(thread.quit)
         task.finished.connect(task.deleteLater)
+        task.failed.connect(task.deleteLater)
         thread.finished.connect(thread.deleteLater)
         self._loading_task = task
         self._loader_thread = thread
@@ -1792,6 +2628,10 @@ class ReleasedView(QWidget):
     @Slot(object)
     def _on_entries_loaded(self, entries: List[Dict[str, str]]) -> None:
         self._all_entries = entries
+        self.model.set_entries(entries)
+        if not self._columns_fitted and entries:
+            _fit_released_columns(self.table)
+            self._columns_fitted = True
         self._set_loading_state(False)
         self._apply_filter()
         self._loader_thread = None
@@ -1800,7 +2640,7 @@ class ReleasedView(QWidget):
     @Slot(str)
     def _on_entries_failed(self, message: str) -> None:
         self._all_entries = []
-        self.table.setRowCount(0)
+        self.model.set_entries([])
         self.search_input.setPlaceholderText(f"Unable to load: {message}")
         self._set_loading_state(False)
         self._loader_thread = None
@@ -1808,57 +2648,17 @@ class ReleasedView(QWidget):
 
     @Slot()
     def _apply_filter(self) -> None:
-        if not self._all_entries and (self._loader_thread is None or not self._loader_thread.isRunning()):
-            self.table.setRowCount(0)
-        search_text = (self.search_input.text() or "").lower().strip()
-        entries = self._all_entries
-        if search_text:
-            entries = [
-                entry
-                for entry in entries
-                if search_text in entry.get("filename", "").lower()
-                or search_text in entry.get("created_by", "").lower()
-            ]
-        self._populate_table(entries)
-
-    def _populate_table(self, entries: List[Dict[str, str]]) -> None:
-        self.table.setRowCount(len(entries))
-        for row_index, entry in enumerate(entries):
-            created_at = entry.get("created_at", "")
-            try:
-                display_time = datetime.fromisoformat(created_at).strftime("%d/%m/%Y %H:%M:%S")
-            except Exception:
-                display_time = created_at
-            self.table.setItem(row_index, 0, QTableWidgetItem(display_time))
-            self.table.setItem(row_index, 1, QTableWidgetItem(entry.get("name_file_old", "")))
-            self.table.setItem(row_index, 2, QTableWidgetItem(entry.get("revision_old", "")))
-            self.table.setItem(row_index, 3, QTableWidgetItem(entry.get("name_file_new", "")))
-            self.table.setItem(row_index, 4, QTableWidgetItem(entry.get("revision_new", "")))
-            self.table.setItem(row_index, 5, QTableWidgetItem(entry.get("created_by", "")))
-            self.table.setItem(row_index, 6, QTableWidgetItem(tr(self.language, "released")))
-            self.table.setItem(row_index, 7, QTableWidgetItem(entry.get("filename", "")))
-
-            actions = QWidget()
-            actions_layout = QHBoxLayout(actions)
-            actions_layout.setContentsMargins(0, 0, 0, 0)
-            view_btn = QPushButton(tr(self.language, "released_view"))
-            export_btn = QPushButton(tr(self.language, "released_export"))
-            view_btn.clicked.connect(
-                lambda _=False, p=entry.get("source_result", ""): open_with_default_application(p)
-            )
-            export_btn.clicked.connect(
-                lambda _=False, p=entry.get("source_result", ""), fn=entry.get("filename", ""): self.export_file(p, fn)
-            )
-            actions_layout.addWidget(view_btn)
-            actions_layout.addWidget(export_btn)
-            if self.role == "admin":
-                delete_btn = QPushButton(tr(self.language, "released_delete"))
-                delete_btn.clicked.connect(
-                    lambda _=False, e=entry: self.delete_entry(e)
-                )
-                actions_layout.addWidget(delete_btn)
-                actions_layout.addStretch()
-            self.table.setCellWidget(row_index, 8, actions)
+        self.proxy.set_search_text(self.search_input.text() or "")
+
+    def _on_entry_action(self, action: str, entry: Optional[Dict[str, str]]) -> None:
+        if not entry:
+            return
+        if action == "view":
+            open_with_default_application(entry.get("source_result", ""))
+        elif action == "export":
+            self.export_file(entry.get("source_result", ""), entry.get("filename", ""))
+        elif action == "delete":
+            self.delete_entry(entry)
 
     def export_file(self, source_path: str, filename: str) -> None:
         if not source_path:
@@ -1870,7 +2670,7 @@ class ReleasedView(QWidget):
         if not target_path:
             return
         try:
-            shutil.copyfile(source_path, target_path)
+            server_io.copy_file(source_path, target_path)
             QMessageBox.information(self, "ECR Released", f"File exported to:\n{target_path}")
         except Exception as exc:
             QMessageBox.critical(self, "ECR Released", f"Unable to export file:\n{exc}")
@@ -1954,6 +2754,8 @@ class OfflineDialog(QDialog):
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    comparison_requested = Signal(object, object)
+
     def __init__(
         self,
         username: str,
@@ -1987,17 +2789,39 @@ class MainWindow(QMainWindow):
         logger.addHandler(self._log_handler)
         self._log_emitter.message.connect(self.append_log)
 
+        # Comparison thread and worker are created on first use and kept;
+        # ``_worker`` is only set while a comparison is running.
         self._thread: Optional[QThread] = None
+        self._compare_worker: Optional[CompareSetWorker] = None
         self._worker: Optional[CompareSetWorker] = None
 
         # Mapping of widgets that can be styled or text-edited without touching code.
         self._editable_widgets: Dict[str, Dict[str, Union[QWidget, str, bool]]] = {}
+        # The same allow_* flags, resolved once for the override hot path.
+        self._editable_flags: Dict[str, EditableFlags] = {}
+        # Routes every action-enabled button's click to _invoke_custom_action by key.
+        self._action_mapper = QSignalMapper(self)
+        self._action_mapper.mappedString.connect(self._invoke_custom_action)
+        # Built-in custom actions that take no target, by action type.
+        self._action_dispatch: Dict[str, Callable[[], Any]] = {
+            "history": self.open_history,
+            "released": self.open_released,
+            "settings": self.open_settings_dialog,
+            "compare": self.start_comparison,
+            "cancel": self.request_cancel,
+        }
         self._widget_defaults: Dict[str, Dict[str, Optional[str]]] = {}
         self._widget_overrides: Dict[str, Dict[str, str]] = {}
         self._geometry_overrides: Dict[str, Dict[str, int]] = {}
         self._widget_actions: Dict[str, Dict[str, str]] = {}
+        # Icon path last set through apply_widget_overrides, so reapplying skips reloading it.
+        self._applied_icons: Dict[str, str] = {}
         self._dynamic_button_defs: Dict[str, Dict[str, Any]] = {}
         self._dynamic_buttons: Dict[str, QPushButton] = {}
+        # Buttons released by _clear_dynamic_buttons wait here, hidden, to be reused.
+        self._dynamic_button_pool: List[QPushButton] = []
+        self._dynamic_button_holder = QWidget(self)
+        self._dynamic_button_holder.hide()
         self._area_components: Dict[str, List[str]] = {}
         self._preview_windows: List[QMainWindow] = []
 
@@ -2056,6 +2880,12 @@ class MainWindow(QMainWindow):
         self._connection_blocked = False
         self._status_hide_timer = QTimer(self)
         self._status_hide_timer.setSingleShot(True)
+        # Page progress is coalesced and applied at most once per interval.
+        self._pending_progress: Optional[Tuple[int, int]] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_REFRESH_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
         self.offline_banner = QLabel()
         self.offline_banner.setAlignment(Qt.AlignCenter)
         self.offline_banner.setVisible(False)
@@ -2068,10 +2898,21 @@ class MainWindow(QMainWindow):
         self.version_banner.clicked.connect(self._open_update_link)
         self._update_download_url: Optional[str] = None
 
-        self._log_history: List[str] = []
+        self._log_history: Deque[str] = deque(maxlen=LOG_HISTORY_LIMIT)
         self._dev_dialog: Optional[DeveloperToolsDialog] = None
+        # Built on first use and reused while the language stays the same.
+        self._settings_dialog: Optional[SettingsDialog] = None
+        self._applied_theme: Optional[str] = None
+        self._style_hints: Optional[QStyleHints] = None
+        self._applied_language: Optional[str] = None
         self._update_thread: Optional[QThread] = None
         self._update_task: Optional[BackgroundTask] = None
+        self._layout_save_thread: Optional[QThread] = None
+        self._layout_save_task: Optional[BackgroundTask] = None
+        # Newest layout requested while a previous save was still writing.
+        self._pending_layout_payload: Optional[str] = None
+        # Reset requested while a save was writing; the file is removed once it ends.
+        self._pending_layout_reset = False
 
         self._last_old_path: Optional[Path] = None
         self._last_new_path: Optional[Path] = None
@@ -2303,6 +3144,24 @@ class MainWindow(QMainWindow):
         status_bar.addWidget(self.offline_banner, 1)
 
         self.setStatusBar(status_bar)
+        # Widgets whose text is exactly one translation key.
+        self._translated_texts: Dict[QWidget, str] = {
+            self.title_label: "app_title",
+            self.subtitle_label: "main_subtitle",
+            self.status_header: "status",
+            self.old_label: "old_label",
+            self.new_label: "new_label",
+            self.old_browse_button: "browse",
+            self.new_browse_button: "browse",
+            self.nav_compare_button: "comparison_view",
+            self.compare_button: "compare",
+            self.cancel_button: "cancel",
+            self.history_button: "history",
+            self.released_button: "released",
+            self.settings_button: "settings",
+        }
+        if self.admin_button is not None:
+            self._translated_texts[self.admin_button] = "admin"
         self.show_comparison_environment()
         self.apply_language_setting()
         self.apply_theme_setting()
@@ -2437,8 +3296,9 @@ class MainWindow(QMainWindow):
         if SERVER_ONLINE:
             self._check_for_updates()
         self.connection_monitor = ConnectionMonitor(parent=self)
-        self.connection_monitor.status_changed.connect(self._on_connection_status_changed)
-        self.connection_monitor.check_failed.connect(self._on_connection_error)
+        # The monitor emits from its own checker thread.
+        self.connection_monitor.status_changed.connect(self._on_connection_status_changed, Qt.QueuedConnection)
+        self.connection_monitor.check_failed.connect(self._on_connection_error, Qt.QueuedConnection)
         self.connection_monitor.start()
         self.show_offline_warning_once()
         self.prompt_for_email_if_missing()
@@ -2447,8 +3307,7 @@ class MainWindow(QMainWindow):
     @Slot(str)
     def append_log(self, message: str) -> None:
         self._log_history.append(message)
-        self._log_history = self._log_history[-500:]
-        if self._dev_dialog is not None:
+        if self._dev_dialog is not None and self._dev_dialog.isVisible():
             self._dev_dialog.set_log_messages(list(self._log_history))
 
     def show_status(self, message: str, *, determinate: bool = False) -> None:
@@ -2492,6 +3351,7 @@ class MainWindow(QMainWindow):
         if self._worker is not None:
             logger.info("Cancellation requested by user.")
             self._worker.request_cancel()
+            self._discard_pending_progress()
             self.cancel_button.setEnabled(False)
             self.progress_bar.setRange(0, 0)
             self.status_label.setText(tr(self.current_language, "cancelling"))
@@ -2501,47 +3361,52 @@ class MainWindow(QMainWindow):
             translations = self._connection_texts()
             QMessageBox.warning(self, "CompareSet", translations["offline_status"])
             return
-        old_path = Path(self.old_path_edit.text()).expanduser().resolve()
-        new_path = Path(self.new_path_edit.text()).expanduser().resolve()
-
-        if not old_path.is_file() or old_path.suffix.lower() != ".pdf":
+        old_text = self.old_path_edit.text().strip()
+        new_text = self.new_path_edit.text().strip()
+        # Only the cheap name checks run here; the worker confirms the files exist.
+        if not old_text or not old_text.lower().endswith(".pdf"):
             QMessageBox.warning(self, "Invalid file", "Please select a valid PDF for the old revision.")
             return
-        if not new_path.is_file() or new_path.suffix.lower() != ".pdf":
+        if not new_text or not new_text.lower().endswith(".pdf"):
             QMessageBox.warning(self, "Invalid file", "Please select a valid PDF for the new revision.")
             return
+        old_path = Path(old_text).expanduser()
+        new_path = Path(new_text).expanduser()
 
         self.toggle_controls(False)
         self.status_header.setText(tr(self.current_language, "status"))
         self.show_status(tr(self.current_language, "status_comparing"), determinate=False)
         self.cancel_button.setEnabled(True)
-        logger.info("Starting comparison: %s vs %s", old_path, new_path)
 
         self._last_old_path = old_path
         self._last_new_path = new_path
 
-        self._thread = QThread(self)
-        self._worker = CompareSetWorker(old_path, new_path)
-        self._worker.moveToThread(self._thread)
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self.on_comparison_finished)
-        self._worker.failed.connect(self.on_comparison_failed)
-        self._worker.cancelled.connect(self.on_comparison_cancelled)
-        self._worker.progress.connect(self.on_progress_update)
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.failed.connect(self._thread.quit)
-        self._worker.cancelled.connect(self._thread.quit)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
-        self._thread.start()
+        self._worker = self._ensure_comparison_worker()
+        self._worker.reset()
+        self.comparison_requested.emit(old_path, new_path)
+
+    def _ensure_comparison_worker(self) -> CompareSetWorker:
+        if self._compare_worker is None:
+            thread = QThread(self)
+            worker = CompareSetWorker()
+            worker.moveToThread(thread)
+            # Both directions cross threads; queue explicitly rather than
+            # leaving Qt to decide per emission.
+            self.comparison_requested.connect(worker.run, Qt.QueuedConnection)
+            worker.finished.connect(self.on_comparison_finished, Qt.QueuedConnection)
+            worker.failed.connect(self.on_comparison_failed, Qt.QueuedConnection)
+            worker.validation_failed.connect(self.on_comparison_invalid, Qt.QueuedConnection)
+            worker.cancelled.connect(self.on_comparison_cancelled, Qt.QueuedConnection)
+            worker.progress.connect(self.on_progress_update, Qt.QueuedConnection)
+            thread.finished.connect(worker.deleteLater)
+            thread.start()
+            self._thread = thread
+            self._compare_worker = worker
+        return self._compare_worker
 
     @Slot(ComparisonResult)
     def on_comparison_finished(self, result: ComparisonResult) -> None:
-        self.progress_bar.setRange(0, 1)
-        self.progress_bar.setValue(0)
-        self.toggle_controls(True)
-        self.show_status(tr(self.current_language, "ready"), determinate=True)
-        self.cancel_button.setEnabled(False)
+        self._reset_after_job(tr(self.current_language, "ready"))
         logger.info("Comparison finished.")
         if result.server_result_path:
             logger.info("Result stored at %s", result.server_result_path)
@@ -2596,43 +3461,61 @@ class MainWindow(QMainWindow):
         except Exception as exc:
             logger.error("Failed to record history: %s", exc)
 
-        self._worker = None
-        self._thread = None
         self.hide_status(1200)
 
     @Slot(str)
     def on_comparison_failed(self, message: str) -> None:
-        self.progress_bar.setRange(0, 1)
-        self.progress_bar.setValue(0)
-        self.toggle_controls(True)
-        failure_message = "Falha na comparação." if self.current_language == "pt-BR" else "Comparison failed."
-        self.show_status(failure_message, determinate=True)
-        self.cancel_button.setEnabled(False)
+        self._reset_after_job(tr(self.current_language, "comparison_failed"))
         QMessageBox.critical(self, "CompareSet", f"Comparison failed:\n{message}")
-        self._worker = None
-        self._thread = None
         self.hide_status(1500)
 
+    @Slot(str)
+    def on_comparison_invalid(self, message: str) -> None:
+        self._reset_after_job(tr(self.current_language, "ready"))
+        QMessageBox.warning(self, "Invalid file", message)
+        self.hide_status()
+
     @Slot()
     def on_comparison_cancelled(self) -> None:
+        self._reset_after_job(tr(self.current_language, "ready"))
+        QMessageBox.information(self, "CompareSet", "Comparison was cancelled.")
+        self.hide_status(1200)
+
+    def _reset_after_job(self, status: str) -> None:
+        """Return the controls to idle once a comparison has ended, however it ended."""
+
+        self._discard_pending_progress()
+        self._worker = None
         self.progress_bar.setRange(0, 1)
         self.progress_bar.setValue(0)
         self.toggle_controls(True)
-        self.show_status(tr(self.current_language, "ready"), determinate=True)
+        self.show_status(status, determinate=True)
         self.cancel_button.setEnabled(False)
-        QMessageBox.information(self, "CompareSet", "Comparison was cancelled.")
-        self._worker = None
-        self._thread = None
-        self.hide_status(1200)
 
     @Slot(int, int)
     def on_progress_update(self, page_index: int, total_pages: int) -> None:
-        self.progress_bar.setRange(0, max(1, total_pages))
+        self._pending_progress = (page_index, total_pages)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    @Slot()
+    def _flush_progress(self) -> None:
+        if self._pending_progress is None:
+            return
+        page_index, total_pages = self._pending_progress
+        self._pending_progress = None
+        maximum = max(1, total_pages)
+        if self.progress_bar.minimum() != 0 or self.progress_bar.maximum() != maximum:
+            self.progress_bar.setRange(0, maximum)
         self.progress_bar.setValue(page_index)
         self.status_label.setText(
             tr(self.current_language, "processing_page").format(current=page_index, total=total_pages)
         )
 
+    def _discard_pending_progress(self) -> None:
+        self._progress_timer.stop()
+        self._pending_progress = None
+
     def on_language_changed(self, language: str) -> None:
         self.user_settings["language"] = language
         update_user_settings(self.username, language=language)
@@ -2640,24 +3523,14 @@ class MainWindow(QMainWindow):
         self.apply_language_setting()
 
     def apply_language_setting(self) -> None:
-        self.title_label.setText(tr(self.current_language, "app_title"))
-        self.subtitle_label.setText(tr(self.current_language, "main_subtitle"))
-        self.status_header.setText(tr(self.current_language, "status"))
-        self.old_label.setText(tr(self.current_language, "old_label"))
-        self.new_label.setText(tr(self.current_language, "new_label"))
+        if self.current_language == self._applied_language:
+            return
+        self._applied_language = self.current_language
+        for widget, key in self._translated_texts.items():
+            widget.setText(tr(self.current_language, key))
         placeholder = tr(self.current_language, "no_file_selected")
         self.old_path_edit.setPlaceholderText(placeholder)
         self.new_path_edit.setPlaceholderText(placeholder)
-        self.old_browse_button.setText(tr(self.current_language, "browse"))
-        self.new_browse_button.setText(tr(self.current_language, "browse"))
-        self.nav_compare_button.setText(tr(self.current_language, "comparison_view"))
-        self.compare_button.setText(tr(self.current_language, "compare"))
-        self.cancel_button.setText(tr(self.current_language, "cancel"))
-        self.history_button.setText(tr(self.current_language, "history"))
-        self.released_button.setText(tr(self.current_language, "released"))
-        self.settings_button.setText(tr(self.current_language, "settings"))
-        if self.admin_button is not None:
-            self.admin_button.setText(tr(self.current_language, "admin"))
         self.back_button.setText("← " + tr(self.current_language, "back"))
         current_page = self.content_stack.currentWidget()
         if current_page is self.released_view:
@@ -2675,7 +3548,7 @@ class MainWindow(QMainWindow):
         self.history_view.set_language(self.current_language)
         self.admin_view.set_language(self.current_language)
         self._refresh_widget_defaults_for_language()
-        self._reapply_widget_overrides()
+        self._reapply_text_overrides()
 
     def _system_theme(self) -> str:
         if sys.platform.startswith("win") and winreg is not None:
@@ -2689,7 +3562,9 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
         try:
-            scheme = QApplication.instance().styleHints().colorScheme()
+            if self._style_hints is None:
+                self._style_hints = QApplication.instance().styleHints()
+            scheme = self._style_hints.colorScheme()
             return "dark" if scheme == Qt.ColorScheme.Dark else "light"
         except Exception:
             return "light"
@@ -2702,189 +3577,23 @@ class MainWindow(QMainWindow):
             effective = desired
         else:
             effective = "light"
+        if effective == self._applied_theme:
+            return
+        self._applied_theme = effective
         logger.info("Applying theme: %s (requested=%s)", effective, desired)
-        palette = QPalette()
-        if effective == "dark":
-            palette.setColor(QPalette.Window, QColor(53, 53, 53))
-            palette.setColor(QPalette.WindowText, Qt.white)
-            palette.setColor(QPalette.Base, QColor(35, 35, 35))
-            palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-            palette.setColor(QPalette.ToolTipBase, Qt.white)
-            palette.setColor(QPalette.ToolTipText, Qt.white)
-            palette.setColor(QPalette.Text, Qt.white)
-            palette.setColor(QPalette.Button, QColor(53, 53, 53))
-            palette.setColor(QPalette.ButtonText, Qt.white)
-            palette.setColor(QPalette.Highlight, QColor(ACCENT_COLOR))
-            palette.setColor(QPalette.HighlightedText, Qt.black)
-        else:
-            palette.setColor(QPalette.Window, QColor(240, 243, 249))
-            palette.setColor(QPalette.WindowText, QColor(31, 41, 55))
-            palette.setColor(QPalette.Base, QColor(253, 254, 255))
-            palette.setColor(QPalette.AlternateBase, QColor(245, 248, 253))
-            palette.setColor(QPalette.ToolTipBase, QColor(253, 254, 255))
-            palette.setColor(QPalette.ToolTipText, QColor(31, 41, 55))
-            palette.setColor(QPalette.Text, QColor(31, 41, 55))
-            palette.setColor(QPalette.Button, QColor(232, 237, 247))
-            palette.setColor(QPalette.ButtonText, QColor(31, 41, 55))
-            palette.setColor(QPalette.Highlight, QColor(ACCENT_COLOR))
-            palette.setColor(QPalette.HighlightedText, Qt.white)
-        QApplication.instance().setPalette(palette)
-        if effective == "dark":
-            card_bg = "#242424"
-            canvas_bg = "#1c1c1c"
-            text_color = "#f3f3f3"
-            panel_bg = "#2a2a2a"
-            border = "#3a3a3a"
-            input_bg = "#1f1f1f"
-            button_bg = "#2c2c2c"
-            button_hover = "#343434"
-            button_pressed = "#2a2a2a"
-            button_border = "#3d3d3d"
-            disabled_bg = "#222222"
-            disabled_text = "#7f7f7f"
-            disabled_border = "#2f2f2f"
-            accent = ACCENT_COLOR
-            accent_hover = ACCENT_COLOR_HOVER
-            accent_pressed = ACCENT_COLOR_PRESSED
-            muted_text = "#b8b8b8"
-        else:
-            card_bg = "#fdfefe"
-            canvas_bg = "#eef2f8"
-            text_color = "#1f2937"
-            panel_bg = "#f8fbff"
-            border = "#d6deeb"
-            input_bg = "#f4f6fb"
-            button_bg = "#e8edf7"
-            button_hover = "#dfe7f6"
-            button_pressed = "#d2dcf0"
-            button_border = "#c7d4ea"
-            disabled_bg = "#e6ebf5"
-            disabled_text = "#8c94a6"
-            disabled_border = "#d5deed"
-            accent = ACCENT_COLOR
-            accent_hover = ACCENT_COLOR_HOVER
-            accent_pressed = ACCENT_COLOR_PRESSED
-            muted_text = "#4b5563"
-        self.layout_canvas.setStyleSheet(
-            f"""
-            QWidget#layout_canvas {{
-                background-color: {canvas_bg};
-                color: {text_color};
-                font-family: 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
-            }}
-            QFrame#main_card {{
-                background-color: {card_bg};
-                border-radius: 18px;
-                border: 1px solid {border};
-            }}
-            QFrame#dialog_card {{
-                background-color: {panel_bg};
-                border: 1px solid {border};
-                border-radius: 12px;
-            }}
-            QFrame#top_toolbar, QFrame#progress_panel, QFrame#file_group, QFrame#navigation_bar, QFrame#back_bar {{
-                background-color: {panel_bg};
-                border: 1px solid {border};
-                border-radius: 12px;
-            }}
-            QLabel#title_label {{
-                font-size: 24px;
-                font-weight: 700;
-                letter-spacing: 0.2px;
-            }}
-            QLabel[class="section_label"] {{
-                font-size: 14px;
-                font-weight: 600;
-                letter-spacing: 0.3px;
-            }}
-            QLabel[class="field_label"] {{
-                color: {muted_text};
-                font-size: 13px;
-            }}
-            QLabel#version_label {{
-                color: {muted_text};
-            }}
-            QLineEdit {{
-                padding: 8px 10px;
-                border-radius: 10px;
-                border: 1px solid {border};
-                background-color: {input_bg};
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {accent};
-                outline: none;
-            }}
-            QPushButton {{
-                padding: 8px 14px;
-                border-radius: 10px;
-                border: 1px solid {button_border};
-                background-color: {button_bg};
-                color: {text_color};
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {button_hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {button_pressed};
-            }}
-            QPushButton:disabled {{
-                color: {disabled_text};
-                background-color: {disabled_bg};
-                border-color: {disabled_border};
-            }}
-            QPushButton#compare_button {{
-                background-color: {accent};
-                color: #ffffff;
-                border: none;
-            }}
-            QPushButton#compare_button:hover {{
-                background-color: {accent_hover};
-            }}
-            QPushButton#compare_button:pressed {{
-                background-color: {accent_pressed};
-            }}
-            QPushButton#cancel_button {{
-                border-color: {border};
-            }}
-            QFrame#navigation_bar QPushButton,
-            QFrame#back_bar QPushButton {{
-                border-radius: 16px;
-                padding: 8px 16px;
-            }}
-            QFrame#navigation_bar QPushButton:checked,
-            QFrame#navigation_bar QPushButton:disabled {{
-                background-color: {accent};
-                color: #ffffff;
-                border-color: {accent};
-            }}
-            QFrame#navigation_bar QPushButton:checked:hover,
-            QFrame#navigation_bar QPushButton:disabled:hover {{
-                background-color: {accent_hover};
-            }}
-            QFrame#navigation_bar QPushButton:checked:pressed,
-            QFrame#navigation_bar QPushButton:disabled:pressed {{
-                background-color: {accent_pressed};
-            }}
-            QProgressBar {{
-                border: 1px solid {border};
-                border-radius: 8px;
-                background-color: {input_bg};
-                height: 12px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {accent};
-                border-radius: 8px;
-            }}
-        """
-        )
+        app = QApplication.instance()
+        palette = theme_palette(effective)
+        if app.palette() != palette:
+            app.setPalette(palette)
+        stylesheet = THEME_QSS_DARK if effective == "dark" else THEME_QSS_LIGHT
+        # One application-wide sheet serves every window, preview copies included.
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
 
     def _connection_texts(self) -> Dict[str, str]:
-        return {
-            "offline_status": tr(self.current_language, "offline_status"),
-            "offline_info": tr(self.current_language, "offline_info"),
-            "update_available": tr(self.current_language, "update_available"),
-        }
+        """Return the shared, read-only connection strings for the current language."""
+
+        return _CONNECTION_TEXTS.get(self.current_language) or _CONNECTION_TEXTS["pt-BR"]
 
     def update_connection_banner(self) -> None:
         translations = self._connection_texts()
@@ -2901,7 +3610,8 @@ class MainWindow(QMainWindow):
     def _apply_connection_state(self, online: bool) -> None:
         previous_state = SERVER_ONLINE
         set_connection_state(online)
-        if SERVER_ONLINE or is_offline_tester(CURRENT_USER):
+        # Startup already created the directories; only a reconnect needs them again.
+        if SERVER_ONLINE != previous_state and (SERVER_ONLINE or is_offline_tester(CURRENT_USER)):
             try:
                 ensure_server_directories()
             except Exception:
@@ -2970,12 +3680,14 @@ class MainWindow(QMainWindow):
         if not self.preview_mode and self.role != "admin" and self.admin_button is not None:
             self.admin_button.setEnabled(False)
 
+    @Slot(bool)
     def _on_connection_status_changed(self, online: bool) -> None:
         self._apply_connection_state(online)
         if online:
             self._check_for_updates()
         self.show_offline_warning_once()
 
+    @Slot(str)
     def _on_connection_error(self, message: str) -> None:
         logger.warning("Connection check failed: %s", message)
 
@@ -3016,6 +3728,7 @@ class MainWindow(QMainWindow):
         task.finished.connect(thread.quit)
         task.failed.connect(thread.quit)
         task.finished.connect(task.deleteLater)
+        task.failed.connect(task.deleteLater)
         thread.finished.connect(thread.deleteLater)
         self._update_task = task
         self._update_thread = thread
@@ -3071,7 +3784,9 @@ class MainWindow(QMainWindow):
         self.show_released_environment()
 
     def open_settings_dialog(self) -> None:
-        dialog = SettingsDialog(self.username, self.current_language, self)
+        if self._settings_dialog is None or self._settings_dialog.language != self.current_language:
+            self._settings_dialog = SettingsDialog(self.username, self.current_language, self)
+        dialog = self._settings_dialog
         dialog.load()
         if dialog.exec() == QDialog.Accepted:
             dialog.save()
@@ -3131,6 +3846,7 @@ class MainWindow(QMainWindow):
         self._enter_environment(self.history_view, "history_title")
 
     def show_admin_environment(self) -> None:
+        self.admin_view.refresh_user_list()
         self._enter_environment(self.admin_view, "admin_title")
 
     def _stop_comparison_thread(self) -> None:
@@ -3143,6 +3859,7 @@ class MainWindow(QMainWindow):
             self._thread.quit()
             self._thread.wait(3000)
         self._thread = None
+        self._compare_worker = None
         self._worker = None
 
     def _stop_update_thread(self) -> None:
@@ -3160,6 +3877,7 @@ class MainWindow(QMainWindow):
             logger.exception("Failed to stop connection monitor")
         self._stop_comparison_thread()
         self._stop_update_thread()
+        self._stop_layout_save_thread()
         if hasattr(self, "released_view"):
             self.released_view.stop_loading()
         super().closeEvent(event)
@@ -3188,8 +3906,13 @@ class MainWindow(QMainWindow):
         allow_icon: bool = False,
         allow_action: bool = False,
     ) -> None:
-        """Mark a widget as editable inside the no-code layout designer."""
+        """Mark a widget as editable inside the no-code layout designer.
 
+        Preview windows cannot open the designer, so they skip registration.
+        """
+
+        if self.preview_mode:
+            return
         self._editable_widgets[key] = {
             "widget": widget,
             "display_name": display_name or key,
@@ -3199,26 +3922,37 @@ class MainWindow(QMainWindow):
             "allow_icon": allow_icon,
             "allow_action": allow_action,
         }
+        self._editable_flags[key] = EditableFlags(
+            bool(allow_text), bool(allow_style), bool(allow_geometry), bool(allow_icon), bool(allow_action)
+        )
         default_text = widget.text() if hasattr(widget, "text") else None
+        default_style = widget.styleSheet() or ""
         self._widget_defaults[key] = {
             "text": default_text,
-            "style": widget.styleSheet() or "",
+            "style": default_style,
+            # Compared against every style override; stripped once here.
+            "style_stripped": default_style.strip(),
             "icon": None,
             "action": None,
         }
         if allow_action and isinstance(widget, QPushButton):
-            widget.clicked.connect(lambda checked=False, k=key: self._invoke_custom_action(k))
+            self._action_mapper.setMapping(widget, key)
+            widget.clicked.connect(self._action_mapper.map)
 
     def _refresh_widget_defaults_for_language(self) -> None:
         """Refresh baseline texts when the UI language changes."""
 
         for key, defaults in self._widget_defaults.items():
-            if key in self._widget_overrides and self._widget_overrides[key].get("text"):
+            overrides = self._widget_overrides.get(key)
+            if overrides and overrides.get("text"):
                 continue
-            widget = self._editable_widgets.get(key, {}).get("widget")
+            widget = self._editable_widget(key)
             if widget is None:
                 continue
-            if hasattr(widget, "text"):
+            text_key = self._translated_texts.get(widget)
+            if text_key is not None:
+                defaults["text"] = tr(self.current_language, text_key)
+            elif hasattr(widget, "text"):
                 defaults["text"] = widget.text()
 
     def apply_widget_overrides(self, key: str, overrides: Dict[str, str]) -> None:
@@ -3229,32 +3963,35 @@ class MainWindow(QMainWindow):
             return
         widget: QWidget = info.get("widget")  # type: ignore[assignment]
         defaults = self._widget_defaults.get(key, {"text": None, "style": ""})
-        allow_text = bool(info.get("allow_text", True))
-        allow_style = bool(info.get("allow_style", True))
-        allow_icon = bool(info.get("allow_icon", False))
-        allow_action = bool(info.get("allow_action", False))
+        allow_text, allow_style, allow_geometry, allow_icon, allow_action = self._editable_flags[key]
 
         text_override = overrides.get("text") if allow_text else None
         style_override = overrides.get("style") if allow_style else None
         icon_override = overrides.get("icon") if allow_icon else None
-        geometry_override = overrides.get("geometry") if info.get("allow_geometry", True) else None
+        geometry_override = overrides.get("geometry") if allow_geometry else None
         action_override = overrides.get("action") if allow_action else None
 
         text_value = text_override if text_override is not None else defaults.get("text")
         if allow_text and text_value is not None and hasattr(widget, "setText"):
-            widget.setText(str(text_value))
+            # Unchanged values are skipped: each set re-polishes the widget.
+            if not hasattr(widget, "text") or widget.text() != str(text_value):
+                widget.setText(str(text_value))
 
         style_value = style_override if style_override is not None else defaults.get("style", "")
-        if allow_style:
+        if allow_style and widget.styleSheet() != (style_value or ""):
             widget.setStyleSheet(style_value or "")
 
         if allow_icon and isinstance(widget, QPushButton):
+            icon_path: Optional[str] = None
             if isinstance(icon_override, str) and icon_override:
-                widget.setIcon(QIcon(icon_override))
+                icon_path = icon_override
             elif icon_override == "":
-                widget.setIcon(QIcon())
+                icon_path = ""
             elif isinstance(defaults.get("icon"), str) and defaults.get("icon"):
-                widget.setIcon(QIcon(str(defaults.get("icon"))))
+                icon_path = str(defaults.get("icon"))
+            if icon_path is not None and self._applied_icons.get(key) != icon_path:
+                widget.setIcon(QIcon(icon_path) if icon_path else QIcon())
+                self._applied_icons[key] = icon_path
 
         if geometry_override:
             self.apply_geometry_override(key, geometry_override)
@@ -3268,8 +4005,12 @@ class MainWindow(QMainWindow):
         cleaned: Dict[str, str] = {}
         if text_override is not None and text_override != defaults.get("text"):
             cleaned["text"] = str(text_override)
-        if style_override is not None and style_override.strip() != (defaults.get("style") or "").strip():
-            cleaned["style"] = str(style_override)
+        if style_override is not None:
+            default_stripped = defaults.get("style_stripped")
+            if default_stripped is None:
+                default_stripped = (defaults.get("style") or "").strip()
+            if style_override.strip() != default_stripped:
+                cleaned["style"] = str(style_override)
         if allow_icon and icon_override is not None:
             cleaned["icon"] = str(icon_override)
         if allow_action and isinstance(action_override, dict):
@@ -3291,8 +4032,28 @@ class MainWindow(QMainWindow):
                 self._dynamic_button_defs[key]["action"] = action_override
 
     def _reapply_widget_overrides(self) -> None:
-        for key, overrides in list(self._widget_overrides.items()):
-            self.apply_widget_overrides(key, overrides)
+        # One repaint for the whole pass; nested batches leave the outer one in charge.
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            # apply_widget_overrides stores or drops each key, so walk a snapshot.
+            for key, overrides in list(self._widget_overrides.items()):
+                self.apply_widget_overrides(key, overrides)
+        finally:
+            if updates_enabled:
+                self.setUpdatesEnabled(True)
+
+    def _reapply_text_overrides(self) -> None:
+        """Restore custom texts after a language change; only texts are translated."""
+
+        for key, overrides in self._widget_overrides.items():
+            text = overrides.get("text")
+            info = self._editable_widgets.get(key)
+            if not text or not info or not self._editable_flags[key].text:
+                continue
+            widget = info.get("widget")
+            if hasattr(widget, "setText"):
+                widget.setText(str(text))
 
     def _normalize_geometry(self, widget: QWidget, geometry_data: Dict[str, Any]) -> Optional[QRect]:
         try:
@@ -3308,20 +4069,16 @@ class MainWindow(QMainWindow):
         return rect
 
     def apply_geometry_override(self, key: str, geometry_data: Dict[str, Any]) -> None:
-        widget = self._editable_widgets.get(key, {}).get("widget") or self._layout_targets.get(key)
+        widget = self._editable_widget(key) or self._layout_targets.get(key)
         if widget is None:
             return
         rect = self._normalize_geometry(widget, geometry_data)
         if rect is None:
             return
         widget.setGeometry(rect)
-        widget.setMinimumSize(rect.width(), rect.height())
-        self._geometry_overrides[key] = {
-            "x": rect.x(),
-            "y": rect.y(),
-            "width": rect.width(),
-            "height": rect.height(),
-        }
+        x, y, width, height = rect.getRect()
+        widget.setMinimumSize(width, height)
+        self._geometry_overrides[key] = {"x": x, "y": y, "width": width, "height": height}
         if key in self._widget_overrides:
             self._widget_overrides[key]["geometry"] = self._geometry_overrides[key]
         else:
@@ -3343,7 +4100,15 @@ class MainWindow(QMainWindow):
         if layout is None:
             return None
         button_id = definition.get("id") or f"dynamic_{len(self._dynamic_button_defs) + 1}"
-        button = QPushButton()
+        if self._dynamic_button_pool:
+            # Reused buttons start blank so nothing carries over from their previous definition.
+            button = self._dynamic_button_pool.pop()
+            button.setText("")
+            button.setIcon(QIcon())
+            button.setStyleSheet("")
+            button.setMinimumSize(0, 0)
+        else:
+            button = QPushButton()
         button.setObjectName(button_id)
         display_mode = definition.get("display_mode", "text")
         button_text = definition.get("text") or "Novo botão"
@@ -3380,8 +4145,18 @@ class MainWindow(QMainWindow):
         return button
 
     def _clear_dynamic_buttons(self) -> None:
-        for button in self._dynamic_buttons.values():
-            button.setParent(None)
+        for button_id, button in self._dynamic_buttons.items():
+            self._action_mapper.removeMappings(button)
+            self._editable_widgets.pop(button_id, None)
+            self._editable_flags.pop(button_id, None)
+            self._widget_defaults.pop(button_id, None)
+            self._applied_icons.pop(button_id, None)
+            if not self.preview_mode:
+                # Registration connected it; a reused button must not fire twice.
+                button.clicked.disconnect(self._action_mapper.map)
+            button.hide()
+            button.setParent(self._dynamic_button_holder)
+            self._dynamic_button_pool.append(button)
         self._dynamic_buttons.clear()
         for key in list(self._widget_overrides.keys()):
             if key.startswith("dynamic_") or key in self._dynamic_button_defs:
@@ -3391,10 +4166,16 @@ class MainWindow(QMainWindow):
             self._area_components[area_key] = [w for w in widgets if not w.startswith("dynamic_")]
 
     def _rebuild_dynamic_buttons(self, definitions: List[Dict[str, Any]]) -> None:
-        self._clear_dynamic_buttons()
-        for definition in definitions:
-            if isinstance(definition, dict):
-                self._create_dynamic_button(definition)
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self._clear_dynamic_buttons()
+            for definition in definitions:
+                if isinstance(definition, dict):
+                    self._create_dynamic_button(definition)
+        finally:
+            if updates_enabled:
+                self.setUpdatesEnabled(True)
 
     def create_dynamic_button(self, definition: Dict[str, Any]) -> Optional[str]:
         button = self._create_dynamic_button(definition)
@@ -3406,16 +4187,16 @@ class MainWindow(QMainWindow):
     def get_dynamic_parents(self) -> List[str]:
         return [key for key, layout in self._dynamic_parent_layouts.items() if layout is not None]
 
-    def get_layout_areas(self) -> List[Dict[str, str]]:
+    def get_layout_areas(self) -> Iterator[Dict[str, str]]:
+        """Yield the designer areas; the developer tools only iterate them once."""
+
         labels = {
             "top_toolbar": "Toolbar",
             "progress_panel": "Status / Product bar",
         }
-        return [
-            {"key": key, "label": labels.get(key, key)}
-            for key in self._dynamic_parent_layouts
-            if self._dynamic_parent_layouts.get(key) is not None
-        ]
+        for key, layout in self._dynamic_parent_layouts.items():
+            if layout is not None:
+                yield {"key": key, "label": labels.get(key, key)}
 
     def _layout_order_for_area(self, area_key: str) -> List[str]:
         layout = self._dynamic_parent_layouts.get(area_key)
@@ -3435,53 +4216,49 @@ class MainWindow(QMainWindow):
         return order
 
     def get_area_components(self, area_key: str) -> List[Dict[str, Any]]:
-        components: List[Dict[str, Any]] = []
         order = self._layout_order_for_area(area_key)
+        positions: Dict[str, int] = {}
+        for index, widget_key in enumerate(order):
+            positions.setdefault(widget_key, index)
+        unplaced = len(order)
+        return sorted(self._iter_area_components(area_key), key=lambda item: positions.get(item.get("id"), unplaced))
+
+    def _iter_area_components(self, area_key: str) -> Iterator[Dict[str, Any]]:
         for widget_key in self._area_components.get(area_key, []):
+            if widget_key in self._dynamic_button_defs:
+                # Listed from their definitions below.
+                continue
             widget_info = self._editable_widgets.get(widget_key, {})
             widget = widget_info.get("widget")
             if widget is None:
                 continue
-            components.append(
-                {
-                    "id": widget_key,
-                    "text": widget.text() if hasattr(widget, "text") else widget_info.get("display_name", widget_key),
-                    "display_name": widget_info.get("display_name", widget_key),
-                    "icon": None,
-                    "display_mode": "text_icon",
-                    "action": self._widget_actions.get(widget_key, {}),
-                    "min_width": widget.minimumWidth(),
-                    "min_height": widget.minimumHeight(),
-                }
-            )
+            yield {
+                "id": widget_key,
+                "text": widget.text() if hasattr(widget, "text") else widget_info.get("display_name", widget_key),
+                "display_name": widget_info.get("display_name", widget_key),
+                "icon": None,
+                "display_mode": "text_icon",
+                "action": self._widget_actions.get(widget_key, {}),
+                "min_width": widget.minimumWidth(),
+                "min_height": widget.minimumHeight(),
+            }
         for button_id, definition in self._dynamic_button_defs.items():
             if definition.get("parent", "top_toolbar") != area_key:
                 continue
             widget = self._dynamic_buttons.get(button_id)
-            components.append(
-                {
-                    "id": button_id,
-                    "text": definition.get("text") or (widget.text() if widget else ""),
-                    "display_name": definition.get("display_name") or definition.get("text") or button_id,
-                    "icon": definition.get("icon", ""),
-                    "display_mode": definition.get("display_mode", "text"),
-                    "action": definition.get("action", {}),
-                    "min_width": definition.get("min_width") or (widget.minimumWidth() if widget else 0),
-                    "min_height": definition.get("min_height") or (widget.minimumHeight() if widget else 0),
-                }
-            )
-        components.sort(key=lambda item: order.index(item.get("id")) if item.get("id") in order else len(order))
-        return components
+            yield {
+                "id": button_id,
+                "text": definition.get("text") or (widget.text() if widget else ""),
+                "display_name": definition.get("display_name") or definition.get("text") or button_id,
+                "icon": definition.get("icon", ""),
+                "display_mode": definition.get("display_mode", "text"),
+                "action": definition.get("action", {}),
+                "min_width": definition.get("min_width") or (widget.minimumWidth() if widget else 0),
+                "min_height": definition.get("min_height") or (widget.minimumHeight() if widget else 0),
+            }
 
     def get_registered_actions(self) -> Dict[str, str]:
-        return {
-            "Nenhuma": "none",
-            "Abrir histórico": "history",
-            "Abrir liberados": "released",
-            "Abrir configurações": "settings",
-            "Iniciar comparação": "compare",
-            "Cancelar comparação": "cancel",
-        }
+        return _REGISTERED_ACTIONS
 
     def add_developer_button(self, area_key: Optional[str]) -> Optional[str]:
         target_area = area_key or "top_toolbar"
@@ -3508,8 +4285,10 @@ class MainWindow(QMainWindow):
             widget.setText(definition.get("text") or "Novo botão")
         if display_mode in {"icon", "text_icon"} and icon_value:
             widget.setIcon(QIcon(str(icon_value)))
+            self._applied_icons.pop(button_id, None)
         elif display_mode == "text":
             widget.setIcon(QIcon())
+            self._applied_icons.pop(button_id, None)
         min_width = updates.get("min_width")
         min_height = updates.get("min_height")
         if isinstance(min_width, int) and min_width > 0:
@@ -3565,30 +4344,33 @@ class MainWindow(QMainWindow):
         return True
 
     def _export_dynamic_buttons(self) -> List[Dict[str, Any]]:
+        definitions = self._dynamic_button_defs
         ordered: List[Dict[str, Any]] = []
+        # Exported entries are copies, so track them by id rather than identity.
+        seen_ids: Set[str] = set()
         for area_key in self._dynamic_parent_layouts:
-            order = self._layout_order_for_area(area_key)
-            for button_id in order:
-                if button_id not in self._dynamic_button_defs:
+            for button_id in self._layout_order_for_area(area_key):
+                if button_id not in definitions or button_id in seen_ids:
                     continue
-                ordered.append(dict(self._dynamic_button_defs[button_id]))
-        for button_id, definition in self._dynamic_button_defs.items():
-            if all(definition is not d for d in ordered):
+                seen_ids.add(button_id)
+                ordered.append(dict(definitions[button_id]))
+        for button_id, definition in definitions.items():
+            if button_id not in seen_ids:
+                seen_ids.add(button_id)
                 ordered.append(dict(definition))
         return ordered
 
-    def export_layout_snapshot(self) -> Dict[str, Any]:
-        frames = {}
+    def _layout_frames(self) -> Dict[str, Dict[str, int]]:
+        frames: Dict[str, Dict[str, int]] = {}
         for key, widget in self._layout_targets.items():
-            geom = widget.geometry()
-            frames[key] = {
-                "x": geom.x(),
-                "y": geom.y(),
-                "width": geom.width(),
-                "height": geom.height(),
-            }
+            # getRect() hands back all four values in one call.
+            x, y, width, height = widget.geometry().getRect()
+            frames[key] = {"x": x, "y": y, "width": width, "height": height}
+        return frames
+
+    def export_layout_snapshot(self) -> Dict[str, Any]:
         return {
-            "frames": frames,
+            "frames": self._layout_frames(),
             "widgets": self._widget_overrides,
             "dynamic_buttons": self._export_dynamic_buttons(),
         }
@@ -3611,22 +4393,15 @@ class MainWindow(QMainWindow):
         if not action:
             return
         action_type = action.get("type")
+        handler = self._action_dispatch.get(action_type)
         target = action.get("value") or action.get("target")
         try:
-            if action_type == "url" and target:
+            if handler is not None:
+                handler()
+            elif action_type == "url" and target:
                 QDesktopServices.openUrl(QUrl(str(target)))
             elif action_type == "file" and target:
                 QDesktopServices.openUrl(QUrl.fromLocalFile(str(target)))
-            elif action_type == "history":
-                self.open_history()
-            elif action_type == "released":
-                self.open_released()
-            elif action_type == "settings":
-                self.open_settings_dialog()
-            elif action_type == "compare":
-                self.start_comparison()
-            elif action_type == "cancel":
-                self.request_cancel()
             elif action_type in {"method", "dialog"} and target:
                 func = getattr(self, str(target), None)
                 if callable(func):
@@ -3636,13 +4411,17 @@ class MainWindow(QMainWindow):
         except Exception:
             logger.exception("Failed to execute custom action for %s", key)
 
+    def _editable_widget(self, key: str) -> Optional[QWidget]:
+        info = self._editable_widgets.get(key)
+        return info["widget"] if info else None  # type: ignore[return-value]
+
     def get_editable_widget_catalog(self) -> Dict[str, Dict[str, Union[QWidget, str, bool]]]:
         """Expose editable widget metadata to the layout designer dialog."""
 
         return self._editable_widgets
 
     def get_widget_state(self, key: str) -> Dict[str, Any]:
-        widget = self._editable_widgets.get(key, {}).get("widget") or self._layout_targets.get(key)
+        widget = self._editable_widget(key) or self._layout_targets.get(key)
         return {
             "widget": widget,
             "defaults": self._widget_defaults.get(key, {}),
@@ -3653,6 +4432,8 @@ class MainWindow(QMainWindow):
 
     def _register_layout_target(self, key: str, widget: QWidget) -> None:
         widget.setAttribute(Qt.WA_StyledBackground, True)
+        if self.preview_mode:
+            return
         self._layout_targets[key] = widget
         self._original_styles[key] = widget.styleSheet()
         handler = LayoutEditFilter(self, key)
@@ -3660,6 +4441,8 @@ class MainWindow(QMainWindow):
         self._layout_filters[key] = handler
 
     def _register_area_component(self, area_key: str, widget_key: str) -> None:
+        if self.preview_mode:
+            return
         components = self._area_components.setdefault(area_key, [])
         if widget_key not in components:
             components.append(widget_key)
@@ -3691,10 +4474,16 @@ class MainWindow(QMainWindow):
     def _apply_saved_widget_overrides(self, widget_data: Dict[str, Dict[str, str]]) -> None:
         self._widget_overrides = {}
         self._geometry_overrides = {}
-        for key, overrides in widget_data.items():
-            if not isinstance(overrides, dict):
-                continue
-            self.apply_widget_overrides(key, overrides)
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            for key, overrides in widget_data.items():
+                if not isinstance(overrides, dict):
+                    continue
+                self.apply_widget_overrides(key, overrides)
+        finally:
+            if updates_enabled:
+                self.setUpdatesEnabled(True)
 
     def reset_widget_overrides(self) -> None:
         self._widget_overrides = {}
@@ -3711,15 +4500,7 @@ class MainWindow(QMainWindow):
     def save_dev_layout(self) -> None:
         if not self._is_developer_enabled():
             return
-        layout_data: Dict[str, Any] = {"frames": {}, "widgets": {}, "dynamic_buttons": []}
-        for key, widget in self._layout_targets.items():
-            geom = widget.geometry()
-            layout_data["frames"][key] = {
-                "x": geom.x(),
-                "y": geom.y(),
-                "width": geom.width(),
-                "height": geom.height(),
-            }
+        layout_data: Dict[str, Any] = {"frames": self._layout_frames(), "widgets": {}, "dynamic_buttons": []}
         for key in self._editable_widgets:
             overrides = dict(self._widget_overrides.get(key, {}))
             if key in self._geometry_overrides:
@@ -3728,10 +4509,88 @@ class MainWindow(QMainWindow):
                 layout_data["widgets"][key] = overrides
         if self._dynamic_button_defs:
             layout_data["dynamic_buttons"] = self._export_dynamic_buttons()
-        DEV_LAYOUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(DEV_LAYOUT_PATH, "w", encoding="utf-8") as handle:
-            json.dump(layout_data, handle, indent=2)
-        QMessageBox.information(self, "Layout", "Developer layout saved.")
+        if os.getenv(DEV_LAYOUT_PRETTY_ENV, "").strip():
+            payload = json.dumps(layout_data, indent=2, ensure_ascii=False)
+        else:
+            payload = json.dumps(layout_data, separators=(",", ":"), ensure_ascii=False)
+        if self._layout_save_thread is not None:
+            # Only the newest layout matters; it is written when the running save ends.
+            self._pending_layout_payload = payload
+            self._pending_layout_reset = False
+            return
+        self._start_layout_save(payload)
+
+    def _start_layout_save(self, payload: str) -> None:
+        # Serialising is cheap; the disk write (often a slow share) runs off the UI thread.
+        task = BackgroundTask(functools.partial(write_dev_layout, DEV_LAYOUT_PATH, payload))
+        thread = QThread(self)
+        task.moveToThread(thread)
+        thread.started.connect(task.run)
+        task.finished.connect(self._on_layout_saved)
+        task.failed.connect(self._on_layout_save_failed)
+        task.finished.connect(thread.quit)
+        task.failed.connect(thread.quit)
+        task.finished.connect(task.deleteLater)
+        task.failed.connect(task.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._layout_save_task = task
+        self._layout_save_thread = thread
+        thread.start()
+
+    @Slot(object)
+    def _on_layout_saved(self, _result: object) -> None:
+        self._layout_save_thread = None
+        self._layout_save_task = None
+        if self._pending_layout_payload is not None:
+            payload = self._pending_layout_payload
+            self._pending_layout_payload = None
+            self._start_layout_save(payload)
+            return
+        if self._pending_layout_reset:
+            self._pending_layout_reset = False
+            self._remove_dev_layout_file()
+            return
+        self.status_label.setText("Developer layout saved.")
+        logger.info("Developer layout saved to %s", DEV_LAYOUT_PATH)
+
+    @Slot(str)
+    def _on_layout_save_failed(self, message: str) -> None:
+        self._layout_save_thread = None
+        self._layout_save_task = None
+        self._pending_layout_payload = None
+        if self._pending_layout_reset:
+            self._pending_layout_reset = False
+            self._remove_dev_layout_file()
+            return
+        QMessageBox.warning(self, "Layout", f"Unable to save developer layout: {message}")
+
+    def _stop_layout_save_thread(self) -> None:
+        thread = self._layout_save_thread
+        if thread is not None and thread.isRunning():
+            thread.quit()
+            if not thread.wait(3000):
+                # The running write still owns the temp file; never race it with a second writer.
+                logger.warning("Developer layout save still running on close; newer changes were not saved")
+                self._pending_layout_payload = None
+                self._pending_layout_reset = False
+        self._layout_save_thread = None
+        self._layout_save_task = None
+        if self._pending_layout_payload is not None:
+            payload = self._pending_layout_payload
+            self._pending_layout_payload = None
+            try:
+                write_dev_layout(DEV_LAYOUT_PATH, payload)
+            except Exception:
+                logger.exception("Failed to save developer layout on close")
+        elif self._pending_layout_reset:
+            self._pending_layout_reset = False
+            self._remove_dev_layout_file()
+
+    def _remove_dev_layout_file(self) -> None:
+        try:
+            DEV_LAYOUT_PATH.unlink(missing_ok=True)
+        except Exception:
+            pass
 
     def load_dev_layout(self) -> None:
         if not self._is_developer_enabled():
@@ -3744,12 +4603,18 @@ class MainWindow(QMainWindow):
             if not isinstance(data, dict):
                 raise ValueError("Layout file corrupted")
             frame_data = data.get("frames") if "frames" in data else data
-            widget_data = data.get("widgets", {}) if isinstance(data.get("widgets", {}), dict) else {}
-            geometry_data = data.get("widget_geometries", {}) if isinstance(data.get("widget_geometries", {}), dict) else {}
-            dynamic_defs = data.get("dynamic_buttons", []) if isinstance(data.get("dynamic_buttons", []), list) else []
-            self._clear_dynamic_buttons()
-            if dynamic_defs:
+            # Each section is read once and dropped when it has the wrong shape.
+            widget_data = data.get("widgets")
+            if not isinstance(widget_data, dict):
+                widget_data = {}
+            geometry_data = data.get("widget_geometries")
+            if not isinstance(geometry_data, dict):
+                geometry_data = {}
+            dynamic_defs = data.get("dynamic_buttons")
+            if dynamic_defs and isinstance(dynamic_defs, list):
                 self._rebuild_dynamic_buttons(dynamic_defs)
+            else:
+                self._clear_dynamic_buttons()
             if isinstance(frame_data, dict):
                 self._apply_saved_layout({k: v for k, v in frame_data.items() if isinstance(v, dict)})
             if widget_data:
@@ -3763,11 +4628,12 @@ class MainWindow(QMainWindow):
             self._apply_default_layout_geometry()
 
     def reset_dev_layout(self) -> None:
-        if DEV_LAYOUT_PATH.exists():
-            try:
-                DEV_LAYOUT_PATH.unlink()
-            except Exception:
-                pass
+        self._pending_layout_payload = None
+        if self._layout_save_thread is not None:
+            # A save is still writing; drop the file after it ends so it cannot bring the old layout back.
+            self._pending_layout_reset = True
+        else:
+            self._remove_dev_layout_file()
         self._clear_dynamic_buttons()
         self._apply_default_layout_geometry()
         self.reset_widget_overrides()
@@ -3869,6 +4735,8 @@ class MainWindow(QMainWindow):
             log_messages=list(self._log_history),
         )
         dialog.update_connection_text(SERVER_ONLINE)
+        dialog.save_layout_requested.connect(self.save_dev_layout)
+        dialog.reset_layout_requested.connect(self.reset_dev_layout)
         self._dev_dialog = dialog
         dialog.finished.connect(lambda _: setattr(self, "_dev_dialog", None))
         dialog.setModal(False)
@@ -3932,6 +4800,7 @@ def main() -> None:
     ensure_server_directories()
     ensure_users_db_initialized()
     ensure_released_db_initialized()
+    csenv.start_sqlite_checkpointer()
 
     role = get_user_role(username)
 
@@ -3961,6 +4830,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Page comparison runs in spawned worker processes; required for frozen builds.
+    multiprocessing.freeze_support()
     main()
 try:
     import winreg
@@ -11,19 +11,29 @@ existing interface while internal helpers are organized for clarity.
 from __future__ import annotations
 
 import getpass
+import hashlib
+import heapq
+import json
 import logging
+import logging.handlers
 import math
+import mmap
+import multiprocessing
 import os
+import re
 import shutil
 import sqlite3
 import sys
+import threading
 import time
 import traceback
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from importlib import util
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import cv2
 import fitz
@@ -87,7 +97,17 @@ ABSMEAN_MAX_UNCHANGED_TXT = 8.0
 EDGE_OVERLAP_MIN = 0.92
 LINE_MIN_LEN = 10
 ECC_EPS = 1e-4
-ECC_ITERS = 300
+# ECC runs on a two-level pyramid: a long solve on the coarse level, then a
+# short refinement seeded from it at the working scale.
+ECC_COARSE_ITERS = 200
+ECC_REFINE_ITERS = 50
+# Pages whose phase-correlation shift (at the alignment working scale) stays
+# below this many pixels, with a confident peak, skip ECC entirely.
+ALIGN_IDENTITY_MAX_SHIFT = 0.5
+ALIGN_IDENTITY_MIN_RESPONSE = 0.6
+# Pages whose change mask covers less than this fraction of the page skip the
+# SSIM refinement pass.
+SSIM_SKIP_MAX_FRACTION = 0.0005
 STROKE_WIDTH_PT = 1.1
 STROKE_OPACITY = 0.55
 RED = (1.0, 0.0, 0.0)
@@ -108,6 +128,23 @@ MAX_CANDIDATES_PER_REMOVED = 5
 MAX_BOXES_FOR_MOVEMENT_SUPPRESSION = 1200
 PATCH_SIM_SIZE = 48
 
+# Page-level parallelism; ``COMPARESET_THREADS`` overrides the default of
+# one worker process per CPU core minus one.
+PAGE_WORKERS_ENV = "COMPARESET_THREADS"
+# Starting the worker processes costs several seconds, so shorter documents
+# are compared in-process.
+PARALLEL_MIN_PAGES = 6
+# How often the parent checks for cancellation while waiting on a worker.
+PAGE_CANCEL_POLL_SECONDS = 0.1
+
+TEXT_INDEX_CELL_PX = 256
+TEXT_SPAN_CACHE_SIZE = 256
+
+# Finished comparisons are cached on disk by content hash of both inputs and
+# of this module; least recently used entries go once the cap is exceeded.
+RESULT_CACHE_ENABLED = True
+RESULT_CACHE_MAX_BYTES = 1 << 30
+
 MAX_COMPONENTS_PER_PAGE = 1600
 MIN_COMPONENT_AREA = 6
 LINE_LENGTH_THRESHOLD = 15
@@ -118,6 +155,16 @@ KERNEL_RECT_2 = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
 KERNEL_RECT_7X1 = cv2.getStructuringElement(cv2.MORPH_RECT, (7, 1))
 KERNEL_RECT_1X7 = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 7))
 KERNEL_RECT_2X2 = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+# ``N`` iterations with a ``k x k`` rectangle equal one pass with a
+# ``((k - 1) * N + 1)`` rectangle, so repeated dilate/erode runs collapse into
+# a single call over the image.
+KERNEL_MORPH = cv2.getStructuringElement(cv2.MORPH_RECT, (MORPH_KERNEL, MORPH_KERNEL))
+KERNEL_DILATE = cv2.getStructuringElement(
+    cv2.MORPH_RECT, ((MORPH_KERNEL - 1) * DILATE_ITERS + 1,) * 2
+)
+KERNEL_ERODE = cv2.getStructuringElement(
+    cv2.MORPH_RECT, ((MORPH_KERNEL - 1) * ERODE_ITERS + 1,) * 2
+)
 
 
 SERVER_ROOT = r"\\SV10351\Drawing Center\Apps\CompareSet"
@@ -137,6 +184,7 @@ LOCAL_LOG_DIR = os.path.join(LOCAL_BASE_DIR, "logs")
 LOCAL_OUTPUT_DIR = os.path.join(LOCAL_BASE_DIR, "output")
 LOCAL_CONFIG_DIR = os.path.join(LOCAL_BASE_DIR, "config")
 LOCAL_RELEASED_DIR = os.path.join(LOCAL_BASE_DIR, "released")
+LOCAL_RESULT_CACHE_DIR = os.path.join(LOCAL_BASE_DIR, "cache", "results")
 
 OFFLINE_ALLOWED_USERS = {"doliveira12"}
 CURRENT_USER = getpass.getuser()
@@ -209,12 +257,20 @@ if _ssim_spec is not None:  # pragma: no cover - optional dependency
 else:  # pragma: no cover - optional dependency
     structural_similarity = None  # type: ignore
 
+_numba_spec = util.find_spec("numba")
+if _numba_spec is not None:
+    from numba import njit  # type: ignore
+else:  # pragma: no cover - optional dependency
+    njit = None  # type: ignore
+
 Rect = Tuple[float, float, float, float]
 WordBox = Tuple[str, Rect, int]
 Zoom = Union[float, Tuple[float, float]]
 
 
 LOG_FILE: Optional[str] = None
+# Set inside page worker processes; their log lines go to the parent instead.
+_WORKER_LOG_QUEUE = None
 
 
 def make_long_path(path: str) -> str:
@@ -598,6 +654,44 @@ class CancellationRequested(Exception):
     """Raised when the user requests cancellation."""
 
 
+class ScratchBuffers(threading.local):
+    """Per-thread full-page work arrays reused across pages of the same size."""
+
+    def __init__(self) -> None:
+        self._buffers: Dict[str, np.ndarray] = {}
+
+    def get(self, name: str, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """Return the named buffer, reallocating only when shape or dtype change."""
+
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer
+
+
+_SCRATCH = ScratchBuffers()
+
+# Parsed rawdict text per (file identity, page number); see _page_text_spans.
+_TEXT_SPAN_CACHE: "OrderedDict[Tuple[Tuple[str, int, int], int], Tuple[Tuple[str, Rect], ...]]" = OrderedDict()
+_TEXT_SPAN_CACHE_LOCK = threading.Lock()
+
+# One helper thread runs the OLD half of independent OpenCV stages while the
+# calling thread handles the NEW half (OpenCV releases the GIL). PyMuPDF is not
+# thread-safe, so rendering and text extraction stay on the calling thread.
+_PAIR_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="compareset-pair")
+
+
+def run_pair(
+    func: Callable[[np.ndarray, str], np.ndarray], old_img: np.ndarray, new_img: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Evaluate ``func(image, role)`` for the OLD and NEW images concurrently."""
+
+    old_future = _PAIR_EXECUTOR.submit(func, old_img, "old")
+    new_result = func(new_img, "new")
+    return old_future.result(), new_result
+
+
 
 @dataclass
 class TextGroup:
@@ -661,6 +755,10 @@ def init_log(base_name: str) -> str:
 def write_log(message: str) -> None:
     """Append a message to the persistent log, flushing immediately."""
 
+    if _WORKER_LOG_QUEUE is not None:
+        # Page workers hand their lines to the parent, the log file's only writer.
+        _WORKER_LOG_QUEUE.put_nowait(logging.makeLogRecord({"msg": message, "raw_log_line": True}))
+        return
     if not LOG_FILE:
         return
 
@@ -718,22 +816,21 @@ def build_output_filename(old_path: Path) -> str:
     return f"ECR-{base_name}_{timestamp}.pdf"
 
 
+# Stem of a result PDF as written by build_output_filename.
+_RESULT_FILENAME_RE = re.compile(r"^ECR-(.*)_(\d{8}-\d{6})$")
+
+
 def parse_result_filename(path: Path) -> Optional[Tuple[str, datetime]]:
     """Parse a result PDF filename into its base name and timestamp."""
 
-    stem = path.stem
-    if not stem.startswith("ECR-"):
+    match = _RESULT_FILENAME_RE.match(path.stem)
+    if match is None:
         return None
     try:
-        base_and_timestamp = stem[4:]
-        base_name, timestamp_text = base_and_timestamp.rsplit("_", 1)
+        timestamp = datetime.strptime(match.group(2), "%Y%m%d-%H%M%S")
     except ValueError:
         return None
-    try:
-        timestamp = datetime.strptime(timestamp_text, "%Y%m%d-%H%M%S")
-    except ValueError:
-        return None
-    return base_name, timestamp
+    return match.group(1), timestamp
 
 
 def map_pdf_rect_to_pixels(rect: fitz.Rect, zoom: Zoom) -> Tuple[int, int, int, int]:
@@ -818,6 +915,50 @@ class PageProcessingResult:
     preview_skipped: bool = False
 
 
+class TextGroupIndex(list):
+    """Read-only list of text groups with a uniform grid for rectangle queries."""
+
+    def __init__(self, groups: Iterable[TextGroup] = (), cell_size: float = TEXT_INDEX_CELL_PX):
+        super().__init__(groups)
+        self.cell_size = float(cell_size)
+        # Column views of the groups for vectorised filtering and ordering.
+        self.boxes = np.array([group.bbox for group in self], dtype=np.float64).reshape(-1, 4)
+        self.texts = np.empty(len(self), dtype=object)
+        self.texts[:] = [group.text for group in self]
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        for index, group in enumerate(self):
+            cx1, cy1, cx2, cy2 = self._cell_range(group.bbox)
+            for cx in range(cx1, cx2 + 1):
+                for cy in range(cy1, cy2 + 1):
+                    self._cells.setdefault((cx, cy), []).append(index)
+
+    def _cell_range(self, rect: Rect) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            int(rect[0] // size),
+            int(rect[1] // size),
+            int(rect[2] // size),
+            int(rect[3] // size),
+        )
+
+    def candidate_indices(self, rect: Rect) -> np.ndarray:
+        """Return indices of groups sharing a grid cell with ``rect``, ascending."""
+
+        cx1, cy1, cx2, cy2 = self._cell_range(rect)
+        if (cx2 - cx1 + 1) * (cy2 - cy1 + 1) >= len(self._cells):
+            return np.arange(len(self))
+        hits: set[int] = set()
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                hits.update(self._cells.get((cx, cy), ()))
+        return np.array(sorted(hits), dtype=np.intp)
+
+    def candidates(self, rect: Rect) -> List[TextGroup]:
+        """Return groups sharing a grid cell with ``rect``, in list order."""
+
+        return [self[index] for index in self.candidate_indices(rect)]
+
+
 @dataclass
 class PageTextGroups:
     """Text-group information for a page pair."""
@@ -826,12 +967,244 @@ class PageTextGroups:
     new_groups: List[TextGroup]
 
 
+def resolve_page_workers(requested: Optional[int] = None) -> int:
+    """Return how many worker processes should compare pages in parallel."""
+
+    if requested is None:
+        env_value = os.getenv(PAGE_WORKERS_ENV, "").strip()
+        if env_value:
+            try:
+                requested = int(env_value)
+            except ValueError:
+                logger.warning("Ignoring invalid %s value: %r", PAGE_WORKERS_ENV, env_value)
+    if requested is None:
+        requested = (os.cpu_count() or 1) - 1
+    return max(1, requested)
+
+
+def _run_page(
+    old_doc: fitz.Document,
+    new_doc: fitz.Document,
+    index: int,
+    *,
+    is_cancel_requested: Optional[Callable[[], bool]] = None,
+) -> PageProcessingResult:
+    """Rasterize and diff a single page pair of two open documents."""
+
+    write_log(f"[Page {index + 1}] Rasterization start")
+    page_start = time.perf_counter()
+    old_page = old_doc.load_page(index)
+    new_page = new_doc.load_page(index)
+    with Timer(f"page {index + 1} total"):
+        result = process_page_pair(
+            old_page,
+            new_page,
+            index,
+            is_cancel_requested=is_cancel_requested,
+        )
+    write_log(
+        f"[Page {index + 1}] Rasterization complete in {time.perf_counter() - page_start:.3f}s"
+    )
+    return result
+
+
+_WORKER_DOCS: Optional[Tuple[fitz.Document, fitz.Document]] = None
+_WORKER_CANCEL = None
+
+
+def _init_page_worker(old_path: str, new_path: str, log_queue, cancel_event) -> None:
+    """Open both PDFs once per worker process (fitz documents are not picklable).
+
+    Log output goes to ``log_queue`` for the parent to write, and pages stop
+    early once the parent sets ``cancel_event``.
+    """
+
+    global _WORKER_DOCS, _WORKER_CANCEL, _WORKER_LOG_QUEUE, LOG_FILE
+
+    LOG_FILE = None
+    _WORKER_LOG_QUEUE = log_queue
+    _WORKER_CANCEL = cancel_event
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    old_doc = fitz.open(old_path)
+    new_doc = fitz.open(new_path)
+    remove_signature_widgets(old_doc)
+    remove_signature_widgets(new_doc)
+    _WORKER_DOCS = (old_doc, new_doc)
+
+
+def _process_one(index: int) -> Tuple[int, PageProcessingResult]:
+    """Process page ``index`` inside a worker process."""
+
+    if _WORKER_DOCS is None:
+        raise RuntimeError("Page worker used before initialization.")
+    old_doc, new_doc = _WORKER_DOCS
+    cancel_check = _WORKER_CANCEL.is_set if _WORKER_CANCEL is not None else None
+    return index, _run_page(old_doc, new_doc, index, is_cancel_requested=cancel_check)
+
+
+class _WorkerLogRelay(logging.Handler):
+    """Write records forwarded by page workers from the parent process."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if getattr(record, "raw_log_line", False):
+            write_log(record.getMessage())
+        else:
+            logger.handle(record)
+
+
+def _iter_page_futures(
+    futures: Sequence[Future], is_cancel_requested: Callable[[], bool]
+) -> Iterator[Tuple[int, PageProcessingResult]]:
+    """Yield worker results in page order, checking for cancellation while waiting."""
+
+    for future in futures:
+        while not wait([future], timeout=PAGE_CANCEL_POLL_SECONDS).done:
+            if is_cancel_requested():
+                raise CancellationRequested()
+        yield future.result()
+
+
+def _file_sha256(path: Union[str, Path]) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+    return digest.hexdigest()
+
+
+_ENGINE_VERSION: Optional[str] = None
+
+
+def engine_version() -> str:
+    """Return an identifier of this engine build, used to invalidate cached results.
+
+    It pairs the application version with a hash of this module's source or,
+    in frozen builds where the source is not on disk, with the size and
+    modification time of the executable, so every release gets its own keys.
+    """
+
+    global _ENGINE_VERSION
+
+    if _ENGINE_VERSION is None:
+        # Imported here so page worker processes never load the environment module.
+        from compareset_env import APP_VERSION
+
+        try:
+            build = _file_sha256(__file__)[:16]
+        except OSError:
+            try:
+                stat = os.stat(sys.executable)
+                build = f"{stat.st_size:x}-{int(stat.st_mtime):x}"
+            except OSError:
+                build = "unknown"
+        _ENGINE_VERSION = f"{APP_VERSION}-{build}"
+    return _ENGINE_VERSION
+
+
+def _check_page_counts(old_doc: fitz.Document, new_doc: fitz.Document) -> int:
+    """Return the shared page count, raising when the documents cannot be compared."""
+
+    if old_doc.page_count != new_doc.page_count:
+        raise ValueError("OLD and NEW PDFs must have the same number of pages for comparison.")
+    if old_doc.page_count == 0:
+        raise ValueError("No pages available for comparison.")
+    return old_doc.page_count
+
+
+def result_cache_key(old_path: Path, new_path: Path) -> str:
+    """Return the cache key for comparing ``old_path`` against ``new_path``."""
+
+    return f"{_file_sha256(old_path)}_{_file_sha256(new_path)}_{engine_version()}"
+
+
+def load_cached_result(
+    key: str, page_count: Optional[int] = None
+) -> Optional[Tuple[bytes, List[PageDiffSummary]]]:
+    """Return cached PDF bytes and page summaries for ``key``, if present.
+
+    With ``page_count``, an entry recorded for a different page count is
+    treated as missing.
+    """
+
+    pdf_path = os.path.join(LOCAL_RESULT_CACHE_DIR, f"{key}.pdf")
+    summary_path = os.path.join(LOCAL_RESULT_CACHE_DIR, f"{key}.json")
+    try:
+        with open(summary_path, "r", encoding="utf-8") as handle:
+            metadata = json.load(handle)
+        if page_count is not None and metadata["page_count"] != page_count:
+            return None
+        summaries = [PageDiffSummary(**item) for item in metadata["summaries"]]
+        with open(pdf_path, "rb") as handle:
+            pdf_bytes = handle.read()
+        os.utime(pdf_path)
+        os.utime(summary_path)
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    return pdf_bytes, summaries
+
+
+def store_cached_result(
+    key: str,
+    pdf_bytes: bytes,
+    summaries: Sequence[PageDiffSummary],
+    page_count: Optional[int] = None,
+) -> None:
+    """Store a finished comparison and evict the oldest entries beyond the size cap.
+
+    ``page_count`` is the input page count the run covered; pages it skipped
+    have no summary, so it defaults to the number of summaries.
+    """
+
+    os.makedirs(LOCAL_RESULT_CACHE_DIR, exist_ok=True)
+    pdf_path = os.path.join(LOCAL_RESULT_CACHE_DIR, f"{key}.pdf")
+    summary_path = os.path.join(LOCAL_RESULT_CACHE_DIR, f"{key}.json")
+    # Write to temporaries first so a concurrent reader never sees half a file.
+    with open(pdf_path + ".tmp", "wb") as handle:
+        handle.write(pdf_bytes)
+    os.replace(pdf_path + ".tmp", pdf_path)
+    with open(summary_path + ".tmp", "w", encoding="utf-8") as handle:
+        json.dump(
+            {
+                "page_count": len(summaries) if page_count is None else page_count,
+                "summaries": [asdict(summary) for summary in summaries],
+            },
+            handle,
+        )
+    os.replace(summary_path + ".tmp", summary_path)
+
+    entries = []
+    total = 0
+    with os.scandir(LOCAL_RESULT_CACHE_DIR) as scan:
+        for entry in scan:
+            if not entry.is_file() or not entry.name.endswith(".pdf"):
+                continue
+            stat = entry.stat()
+            total += stat.st_size
+            entries.append((stat.st_mtime, entry.path))
+    entries.sort()
+    for _mtime, path in entries:
+        if total <= RESULT_CACHE_MAX_BYTES:
+            break
+        if path == pdf_path:
+            continue
+        try:
+            total -= os.path.getsize(path)
+            os.remove(path)
+            os.remove(path[: -len(".pdf")] + ".json")
+        except OSError:
+            pass
+
+
 def run_comparison(
     old_path: Path,
     new_path: Path,
     *,
     update_progress: Optional[Callable[[int, int], None]] = None,
     is_cancel_requested: Optional[Callable[[], bool]] = None,
+    workers: Optional[int] = None,
 ) -> ComparisonResult:
     """Execute the raster diff comparison workflow."""
 
@@ -863,16 +1236,38 @@ def run_comparison(
         write_log(f"OLD file: {old_path}")
         write_log(f"NEW file: {new_path}")
 
+        cache_key: Optional[str] = None
+        if RESULT_CACHE_ENABLED:
+            try:
+                cache_key = result_cache_key(old_path, new_path)
+            except OSError:
+                logger.warning("Could not hash inputs; result cache disabled for this run")
+            if cache_key:
+                # Same checks as a fresh run, plus that the entry was recorded
+                # for this many pages; skipped pages leave no summary behind.
+                with fitz.open(old_path) as old_doc, fitz.open(new_path) as new_doc:
+                    page_count = _check_page_counts(old_doc, new_doc)
+                cached = load_cached_result(cache_key, page_count)
+            else:
+                cached = None
+            if cached is not None:
+                pdf_bytes, summaries = cached
+                with open(server_result_path, "wb") as output_handle:
+                    output_handle.write(pdf_bytes)
+                update_progress(len(summaries), len(summaries))
+                write_log(f"Result cache hit: {cache_key}")
+                write_log("Comparison finished successfully")
+                return ComparisonResult(
+                    pdf_bytes=pdf_bytes, server_result_path=server_result_path, summaries=summaries
+                )
+
         summaries: List[PageDiffSummary] = []
         output_doc = fitz.open()
 
         diff_found = False
 
         with fitz.open(old_path) as old_doc, fitz.open(new_path) as new_doc:
-            if old_doc.page_count != new_doc.page_count:
-                raise ValueError("OLD and NEW PDFs must have the same number of pages for comparison.")
-            if old_doc.page_count == 0:
-                raise ValueError("No pages available for comparison.")
+            _check_page_counts(old_doc, new_doc)
 
             write_log(f"Total pages: {old_doc.page_count}")
             removed_old = remove_signature_widgets(old_doc)
@@ -881,130 +1276,162 @@ def run_comparison(
                 f"Signature widgets removed - OLD: {removed_old} NEW: {removed_new}"
             )
 
-            for index in range(old_doc.page_count):
-                _check_cancel()
-                write_log(f"[Page {index + 1}] Rasterization start")
-                page_start = time.perf_counter()
-                old_page = old_doc.load_page(index)
-                new_page = new_doc.load_page(index)
-                with Timer(f"page {index + 1} total"):
-                    result = process_page_pair(
-                        old_page,
-                        new_page,
+            page_count = old_doc.page_count
+            worker_count = min(resolve_page_workers(workers), page_count)
+            if page_count < PARALLEL_MIN_PAGES:
+                worker_count = 1
+            executor: Optional[ProcessPoolExecutor] = None
+            futures: List[Future] = []
+            cancel_event = None
+            log_listener: Optional[logging.handlers.QueueListener] = None
+            if worker_count > 1:
+                write_log(f"Page workers: {worker_count}")
+                context = multiprocessing.get_context("spawn")
+                cancel_event = context.Event()
+                log_queue = context.Queue()
+                log_listener = logging.handlers.QueueListener(log_queue, _WorkerLogRelay())
+                log_listener.start()
+                executor = ProcessPoolExecutor(
+                    max_workers=worker_count,
+                    mp_context=context,
+                    initializer=_init_page_worker,
+                    initargs=(str(old_path), str(new_path), log_queue, cancel_event),
+                )
+                futures = [executor.submit(_process_one, index) for index in range(page_count)]
+                page_results = _iter_page_futures(futures, is_cancel_requested)
+            else:
+                page_results = (
+                    (
                         index,
-                        is_cancel_requested=is_cancel_requested,
+                        _run_page(
+                            old_doc,
+                            new_doc,
+                            index,
+                            is_cancel_requested=is_cancel_requested,
+                        ),
                     )
-                write_log(
-                    f"[Page {index + 1}] Rasterization complete in {time.perf_counter() - page_start:.3f}s"
+                    for index in range(page_count)
                 )
 
-                if result.preview_skipped:
-                    logger.info("Page %d alignment: %s", index + 1, result.alignment_method)
-                    logger.info("Page %d: no change (preview)", index + 1)
-                    write_log(f"[Page {index + 1}] Preview skip, no diffs")
-                else:
-                    logger.info("Page %d alignment: %s", index + 1, result.alignment_method)
-                    if not result.old_boxes and not result.new_boxes:
-                        logger.info("Page %d: No diffs detected.", index + 1)
-                        write_log(f"[Page {index + 1}] No diffs detected")
+            try:
+                for index, result in page_results:
+                    _check_cancel()
+                    if result.preview_skipped:
+                        logger.info("Page %d alignment: %s", index + 1, result.alignment_method)
+                        logger.info("Page %d: no change (preview)", index + 1)
+                        write_log(f"[Page {index + 1}] Preview skip, no diffs")
                     else:
-                        diff_found = True
-                        logger.info(
-                            "Page %d OLD boxes: raw=%d merged=%d",
-                            index + 1,
-                            result.old_raw,
-                            len(result.old_boxes),
-                        )
-                        logger.info(
-                            "Page %d NEW boxes: raw=%d merged=%d",
-                            index + 1,
-                            result.new_raw,
-                            len(result.new_boxes),
-                        )
-                        write_log(
-                            f"[Page {index + 1}] Boxes OLD raw={result.old_raw} merged={len(result.old_boxes)}"
-                        )
-                        write_log(
-                            f"[Page {index + 1}] Boxes NEW raw={result.new_raw} merged={len(result.new_boxes)}"
-                        )
+                        logger.info("Page %d alignment: %s", index + 1, result.alignment_method)
+                        if not result.old_boxes and not result.new_boxes:
+                            logger.info("Page %d: No diffs detected.", index + 1)
+                            write_log(f"[Page {index + 1}] No diffs detected")
+                        else:
+                            diff_found = True
+                            logger.info(
+                                "Page %d OLD boxes: raw=%d merged=%d",
+                                index + 1,
+                                result.old_raw,
+                                len(result.old_boxes),
+                            )
+                            logger.info(
+                                "Page %d NEW boxes: raw=%d merged=%d",
+                                index + 1,
+                                result.new_raw,
+                                len(result.new_boxes),
+                            )
+                            write_log(
+                                f"[Page {index + 1}] Boxes OLD raw={result.old_raw} merged={len(result.old_boxes)}"
+                            )
+                            write_log(
+                                f"[Page {index + 1}] Boxes NEW raw={result.new_raw} merged={len(result.new_boxes)}"
+                            )
 
-                old_insert_index: Optional[int] = None
-                new_insert_index: Optional[int] = None
+                    old_insert_index: Optional[int] = None
+                    new_insert_index: Optional[int] = None
+
+                    try:
+                        if 0 <= index < old_doc.page_count:
+                            old_insert_index = output_doc.page_count
+                            output_doc.insert_pdf(
+                                old_doc,
+                                from_page=index,
+                                to_page=min(index, old_doc.page_count - 1),
+                                start_at=old_insert_index,
+                            )
 
-                try:
-                    if 0 <= index < old_doc.page_count:
-                        old_insert_index = output_doc.page_count
-                        output_doc.insert_pdf(
-                            old_doc,
-                            from_page=index,
-                            to_page=min(index, old_doc.page_count - 1),
-                            start_at=old_insert_index,
+                        if 0 <= index < new_doc.page_count:
+                            new_insert_index = output_doc.page_count
+                            output_doc.insert_pdf(
+                                new_doc,
+                                from_page=index,
+                                to_page=min(index, new_doc.page_count - 1),
+                                start_at=new_insert_index,
+                            )
+                    except IndexError:
+                        write_log(
+                            f"[Page {index + 1}] Insert PDF failed due to invalid page range"
                         )
+                        logger.exception("Insert PDF failed")
+                        continue
 
-                    if 0 <= index < new_doc.page_count:
-                        new_insert_index = output_doc.page_count
-                        output_doc.insert_pdf(
-                            new_doc,
-                            from_page=index,
-                            to_page=min(index, new_doc.page_count - 1),
-                            start_at=new_insert_index,
-                        )
-                except IndexError:
-                    write_log(
-                        f"[Page {index + 1}] Insert PDF failed due to invalid page range"
-                    )
-                    logger.exception("Insert PDF failed")
-                    continue
+                    write_log(f"[Page {index + 1}] Spotlight rendering")
+                    if old_insert_index is not None and result.old_boxes:
+                        old_page_out = output_doc.load_page(old_insert_index)
+                        apply_dimming_overlay(old_page_out, result.old_boxes, result.pixel_scale)
+                        for rect in result.old_boxes:
+                            pdf_rect = fitz.Rect(
+                                rect[0] / result.pixel_scale,
+                                rect[1] / result.pixel_scale,
+                                rect[2] / result.pixel_scale,
+                                rect[3] / result.pixel_scale,
+                            )
+                            old_page_out.draw_rect(
+                                pdf_rect,
+                                color=RED,
+                                fill=None,
+                                width=STROKE_WIDTH_PT,
+                                stroke_opacity=STROKE_OPACITY,
+                            )
 
-                write_log(f"[Page {index + 1}] Spotlight rendering")
-                if old_insert_index is not None and result.old_boxes:
-                    old_page_out = output_doc.load_page(old_insert_index)
-                    apply_dimming_overlay(old_page_out, result.old_boxes, result.pixel_scale)
-                    for rect in result.old_boxes:
-                        pdf_rect = fitz.Rect(
-                            rect[0] / result.pixel_scale,
-                            rect[1] / result.pixel_scale,
-                            rect[2] / result.pixel_scale,
-                            rect[3] / result.pixel_scale,
-                        )
-                        old_page_out.draw_rect(
-                            pdf_rect,
-                            color=RED,
-                            fill=None,
-                            width=STROKE_WIDTH_PT,
-                            stroke_opacity=STROKE_OPACITY,
-                        )
+                    if new_insert_index is not None and result.new_boxes:
+                        new_page_out = output_doc.load_page(new_insert_index)
+                        apply_dimming_overlay(new_page_out, result.new_boxes, result.pixel_scale)
+                        for rect in result.new_boxes:
+                            pdf_rect = fitz.Rect(
+                                rect[0] / result.pixel_scale,
+                                rect[1] / result.pixel_scale,
+                                rect[2] / result.pixel_scale,
+                                rect[3] / result.pixel_scale,
+                            )
+                            new_page_out.draw_rect(
+                                pdf_rect,
+                                color=GREEN,
+                                fill=None,
+                                width=STROKE_WIDTH_PT,
+                                stroke_opacity=STROKE_OPACITY,
+                            )
 
-                if new_insert_index is not None and result.new_boxes:
-                    new_page_out = output_doc.load_page(new_insert_index)
-                    apply_dimming_overlay(new_page_out, result.new_boxes, result.pixel_scale)
-                    for rect in result.new_boxes:
-                        pdf_rect = fitz.Rect(
-                            rect[0] / result.pixel_scale,
-                            rect[1] / result.pixel_scale,
-                            rect[2] / result.pixel_scale,
-                            rect[3] / result.pixel_scale,
-                        )
-                        new_page_out.draw_rect(
-                            pdf_rect,
-                            color=GREEN,
-                            fill=None,
-                            width=STROKE_WIDTH_PT,
-                            stroke_opacity=STROKE_OPACITY,
+                    write_log(f"[Page {index + 1}] Page output complete")
+                    summaries.append(
+                        PageDiffSummary(
+                            index=index + 1,
+                            alignment_method=result.alignment_method,
+                            old_boxes_raw=result.old_raw,
+                            old_boxes_merged=len(result.old_boxes),
+                            new_boxes_raw=result.new_raw,
+                            new_boxes_merged=len(result.new_boxes),
                         )
-
-                write_log(f"[Page {index + 1}] Page output complete")
-                summaries.append(
-                    PageDiffSummary(
-                        index=index + 1,
-                        alignment_method=result.alignment_method,
-                        old_boxes_raw=result.old_raw,
-                        old_boxes_merged=len(result.old_boxes),
-                        new_boxes_raw=result.new_raw,
-                        new_boxes_merged=len(result.new_boxes),
                     )
-                )
-                update_progress(index + 1, old_doc.page_count)
+                    update_progress(index + 1, old_doc.page_count)
+            finally:
+                if executor is not None:
+                    # Stops pages already running in the workers; a no-op after success.
+                    cancel_event.set()
+                    for future in futures:
+                        future.cancel()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                if log_listener is not None:
+                    log_listener.stop()
 
         if not diff_found:
             logger.info("No diffs")
@@ -1014,6 +1441,11 @@ def run_comparison(
         output_doc.close()
         with open(server_result_path, "wb") as output_handle:
             output_handle.write(pdf_bytes)
+        if cache_key:
+            try:
+                store_cached_result(cache_key, pdf_bytes, summaries, page_count)
+            except OSError:
+                logger.warning("Could not store result in cache", exc_info=True)
         logger.info("Generated diff with %d page pair(s).", len(summaries))
         logger.info("Output document pages: %d", output_pages)
         write_log("Comparison finished successfully")
@@ -1089,8 +1521,11 @@ def process_page_pair(
     with Timer(f"page {page_index + 1} preview"):
         preview_zoom = compute_zoom(old_page.rect, PREVIEW_DPI)
         preview_scale = preview_zoom / old_zoom_high if old_zoom_high else 1.0
-        preview_old = downsample_to_working_resolution(old_high, scale_factor=preview_scale)
-        preview_new = downsample_to_working_resolution(new_high, scale_factor=preview_scale)
+        preview_old, preview_new = run_pair(
+            lambda image, _role: downsample_to_working_resolution(image, scale_factor=preview_scale),
+            old_high,
+            new_high,
+        )
     perf_after_preview = time.perf_counter()
     preview_diff = cv2.absdiff(preview_old, preview_new)
     _, preview_mask = cv2.threshold(preview_diff, 20, 255, cv2.THRESH_BINARY)
@@ -1099,6 +1534,7 @@ def process_page_pair(
     write_log(
         f"[Page {page_index + 1}] Preview stats mean={preview_mean:.2f} change_ratio={nonzero_ratio:.5f}"
     )
+    del preview_old, preview_new, preview_diff, preview_mask
     if nonzero_ratio < 0.00035 and preview_mean < 3.5:
         logger.info("unchanged-text suppressed: 0 on OLD, 0 on NEW")
         write_log(f"[Page {page_index + 1}] Preview skip after {perf_after_preview - perf_after_render:.3f}s")
@@ -1115,6 +1551,8 @@ def process_page_pair(
     _check_cancel()
     with Timer(f"page {page_index + 1} alignment"):
         aligned_new_high, alignment_method, warp_matrix = align_images(old_high, new_high)
+    # Only the aligned copy is needed from here on; drop the unaligned render.
+    del new_high
     perf_after_align = time.perf_counter()
     translation_x = float(warp_matrix[0, 2]) if warp_matrix is not None else 0.0
     translation_y = float(warp_matrix[1, 2]) if warp_matrix is not None else 0.0
@@ -1130,10 +1568,16 @@ def process_page_pair(
     _check_cancel()
     write_log(f"[Page {page_index + 1}] Diff mask creation")
     with Timer(f"page {page_index + 1} masks"):
-        blur_old = cv2.GaussianBlur(old_high, (BLUR_KSIZE, BLUR_KSIZE), 0)
-        blur_new = cv2.GaussianBlur(aligned_new_high, (BLUR_KSIZE, BLUR_KSIZE), 0)
+        shape = old_high.shape
+        blur_old, blur_new = run_pair(
+            lambda image, role: cv2.GaussianBlur(
+                image, (BLUR_KSIZE, BLUR_KSIZE), 0, dst=_SCRATCH.get(f"blur_{role}", shape)
+            ),
+            old_high,
+            aligned_new_high,
+        )
 
-        diff = cv2.absdiff(blur_old, blur_new)
+        diff = cv2.absdiff(blur_old, blur_new, dst=_SCRATCH.get("diff", shape))
 
         intensity_mask = compute_intensity_mask(diff)
         edge_old, edge_new, edge_mask = compute_edge_mask(blur_old, blur_new)
@@ -1142,20 +1586,36 @@ def process_page_pair(
 
         change_mask = cv2.bitwise_and(intensity_mask, cv2.bitwise_or(edge_mask, line_emphasis))
 
-        ssim_mask = compute_ssim_mask(blur_old, blur_new)
-        if ssim_mask is not None:
-            change_mask = cv2.bitwise_and(change_mask, ssim_mask)
-
-        _, old_ink = cv2.threshold(blur_old, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-        _, new_ink = cv2.threshold(blur_new, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-
-        old_bin = (old_ink > 0).astype(np.uint8)
-        new_bin = (new_ink > 0).astype(np.uint8)
+        # SSIM only prunes the change mask; when almost nothing changed the
+        # full-page pass costs more than the few pixels it could remove.
+        changed_pixels = cv2.countNonZero(change_mask)
+        if changed_pixels >= SSIM_SKIP_MAX_FRACTION * change_mask.size:
+            ssim_mask = compute_ssim_mask(blur_old, blur_new)
+            if ssim_mask is not None:
+                change_mask = cv2.bitwise_and(change_mask, ssim_mask)
+            del ssim_mask
+        else:
+            write_log(f"[Page {page_index + 1}] SSIM skipped ({changed_pixels} changed px)")
+
+        otsu_inv = cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU
+        old_ink, new_ink = run_pair(
+            lambda image, role: cv2.threshold(
+                image, 0, 255, otsu_inv, dst=_SCRATCH.get(f"{role}_ink", shape)
+            )[1],
+            blur_old,
+            blur_new,
+        )
 
-        removed_mask = np.where(np.logical_and(old_bin == 1, new_bin == 0), 255, 0).astype(np.uint8)
-        added_mask = np.where(np.logical_and(new_bin == 1, old_bin == 0), 255, 0).astype(np.uint8)
+        # Ink masks are 0/255, so "ink in one page only" is a masked bitwise_not.
+        not_ink = _SCRATCH.get("not_ink", shape)
+        removed_mask = cv2.bitwise_and(
+            old_ink, cv2.bitwise_not(new_ink, dst=not_ink), dst=_SCRATCH.get("removed", shape)
+        )
+        added_mask = cv2.bitwise_and(
+            new_ink, cv2.bitwise_not(old_ink, dst=not_ink), dst=_SCRATCH.get("added", shape)
+        )
 
-        ink_union = cv2.bitwise_or(old_ink, new_ink)
+        ink_union = cv2.bitwise_or(old_ink, new_ink, dst=_SCRATCH.get("ink_union", shape))
         change_mask = cv2.bitwise_and(change_mask, ink_union)
 
         # Ensure thin line work is not suppressed by intensity gating and preserve added / removed ink explicitly.
@@ -1164,6 +1624,7 @@ def process_page_pair(
             cv2.bitwise_or(removed_mask, added_mask),
         )
         change_mask = cv2.bitwise_or(change_mask, cv2.bitwise_and(line_emphasis, ink_union))
+        del intensity_mask, edge_mask, line_emphasis, ink_union
 
     log_mask_stats(page_index, "Change mask", change_mask)
     log_mask_stats(page_index, "Removed ink mask", removed_mask)
@@ -1189,18 +1650,18 @@ def process_page_pair(
 
     removed_regions = cv2.bitwise_and(change_mask, removed_detection)
     added_regions = cv2.bitwise_and(change_mask, added_detection)
+    del change_mask, removed_mask, added_mask
 
     line_diff_mask = cv2.bitwise_xor(edge_old, edge_new)
     line_diff_mask = cv2.dilate(line_diff_mask, KERNEL_RECT_3, iterations=1)
-    change_mask = cv2.morphologyEx(change_mask, cv2.MORPH_CLOSE, KERNEL_RECT_3, iterations=1)
     line_removed_regions = cv2.bitwise_and(line_diff_mask, removed_detection)
     line_added_regions = cv2.bitwise_and(line_diff_mask, added_detection)
+    del line_diff_mask, removed_detection, added_detection
 
     with Timer(f"page {page_index + 1} region_extraction"):
         old_filtered_main, old_kept_main, old_raw_components, old_after_noise = extract_regions(
             removed_regions,
             diff,
-            old_high,
             old_ink,
             groups.old_groups,
             groups.new_groups,
@@ -1212,7 +1673,6 @@ def process_page_pair(
         new_filtered_main, new_kept_main, new_raw_components, new_after_noise = extract_regions(
             added_regions,
             diff,
-            aligned_new_high,
             new_ink,
             groups.old_groups,
             groups.new_groups,
@@ -1225,7 +1685,6 @@ def process_page_pair(
         old_line_filtered, old_line_kept, old_line_raw, old_line_after_noise = extract_regions(
             line_removed_regions,
             diff,
-            old_high,
             old_ink,
             groups.old_groups,
             groups.new_groups,
@@ -1237,7 +1696,6 @@ def process_page_pair(
         new_line_filtered, new_line_kept, new_line_raw, new_line_after_noise = extract_regions(
             line_added_regions,
             diff,
-            aligned_new_high,
             new_ink,
             groups.old_groups,
             groups.new_groups,
@@ -1246,6 +1704,7 @@ def process_page_pair(
             line_boost,
             "new_line",
         )
+    del removed_regions, added_regions, line_removed_regions, line_added_regions, line_boost
 
     old_filtered = old_filtered_main + old_line_filtered
     new_filtered = new_filtered_main + new_line_filtered
@@ -1357,14 +1816,29 @@ def compute_zoom(rect: fitz.Rect, dpi: int) -> float:
     return max(1e-3, min(base_zoom, max_zoom_w, max_zoom_h))
 
 
+class _PixmapView:
+    """Expose pixmap samples to numpy without copying them."""
+
+    def __init__(self, pix: fitz.Pixmap) -> None:
+        # Hand numpy the raw sample pointer so this view becomes the array's
+        # base and keeps the pixmap (and its buffer) alive.
+        self._pixmap = pix
+        self.__array_interface__ = {
+            "shape": (pix.height, pix.stride),
+            "typestr": "|u1",
+            "data": (pix.samples_ptr, False),
+            "version": 3,
+        }
+
+
 def render_page_to_gray(page: fitz.Page, scale_x: float, scale_y: Optional[float] = None) -> np.ndarray:
     """Render a page to a grayscale numpy array using explicit scaling."""
 
     sy = scale_y if scale_y is not None else scale_x
     matrix = fitz.Matrix(scale_x, sy)
     pix = page.get_pixmap(matrix=matrix, colorspace=fitz.csGRAY, alpha=False)
-    array = np.frombuffer(pix.samples, dtype=np.uint8)
-    return array.reshape(pix.height, pix.width)
+    # Rows may be padded past ``width``; slice the padding off the view.
+    return np.asarray(_PixmapView(pix))[:, : pix.width]
 
 
 def render_normalized_pages(
@@ -1400,41 +1874,67 @@ def align_images(old_img: np.ndarray, new_img: np.ndarray) -> Tuple[np.ndarray,
         max(1, int(round(old_img.shape[1] * scale))),
         max(1, int(round(old_img.shape[0] * scale))),
     )
-    old_small = cv2.resize(old_img, target_size, interpolation=cv2.INTER_AREA)
-    new_small = cv2.resize(new_img, target_size, interpolation=cv2.INTER_AREA)
-
-    old_norm = old_small.astype(np.float32) / 255.0
-    new_norm = new_small.astype(np.float32) / 255.0
+    def shrink(image: np.ndarray, _role: str) -> np.ndarray:
+        return cv2.resize(image, target_size, interpolation=cv2.INTER_AREA)
+
+    # ECC normalises its inputs itself, so the working images stay uint8;
+    # only phase correlation needs a float copy.
+    old_norm, new_norm = run_pair(shrink, old_img, new_img)
+
+    # Phase correlation is far cheaper than ECC; already-aligned pages stop here
+    # and the measured shift seeds ECC otherwise.
+    shift, response = cv2.phaseCorrelate(np.float32(old_norm), np.float32(new_norm))
+    if (
+        math.hypot(shift[0], shift[1]) < ALIGN_IDENTITY_MAX_SHIFT
+        and response >= ALIGN_IDENTITY_MIN_RESPONSE
+    ):
+        return new_img, "identity", np.eye(2, 3, dtype=np.float32)
 
     best_cc = -1.0
     best_warp: Optional[np.ndarray] = None
     best_method = ""
 
-    def try_ecc(mode: int, iterations: int) -> Tuple[float, Optional[np.ndarray]]:
+    old_coarse = cv2.pyrDown(old_norm)
+    new_coarse = cv2.pyrDown(new_norm)
+
+    def try_ecc(
+        template: np.ndarray, image: np.ndarray, seed: np.ndarray, mode: int, iterations: int
+    ) -> Tuple[float, Optional[np.ndarray]]:
         criteria = (
             cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT,
             iterations,
             ECC_EPS,
         )
-        warp = np.eye(2, 3, dtype=np.float32)
         try:
-            cc, warp = cv2.findTransformECC(old_norm, new_norm, warp, mode, criteria)
+            cc, warp = cv2.findTransformECC(template, image, seed.copy(), mode, criteria)
         except cv2.error:
             return -1.0, None
         return float(cc), warp
 
-    cc, warp = try_ecc(cv2.MOTION_EUCLIDEAN, ECC_ITERS)
+    def try_pyramid_ecc(mode: int) -> Tuple[float, Optional[np.ndarray]]:
+        seed = np.eye(2, 3, dtype=np.float32)
+        seed[0, 2] = shift[0] / 2.0
+        seed[1, 2] = shift[1] / 2.0
+        coarse_cc, coarse_warp = try_ecc(old_coarse, new_coarse, seed, mode, ECC_COARSE_ITERS)
+        if coarse_warp is not None:
+            seed = coarse_warp.copy()
+        seed[:, 2] *= 2.0
+        cc, warp = try_ecc(old_norm, new_norm, seed, mode, ECC_REFINE_ITERS)
+        if warp is None and coarse_warp is not None:
+            return coarse_cc, seed
+        return cc, warp
+
+    cc, warp = try_pyramid_ecc(cv2.MOTION_EUCLIDEAN)
     if warp is not None:
         best_cc, best_warp, best_method = cc, warp, "euclidean_ecc"
     if best_cc < 0.90:
-        cc_affine, warp_affine = try_ecc(cv2.MOTION_AFFINE, 200)
+        cc_affine, warp_affine = try_pyramid_ecc(cv2.MOTION_AFFINE)
         if warp_affine is not None and cc_affine > best_cc:
             best_cc, best_warp, best_method = cc_affine, warp_affine, "affine_ecc"
 
     scale_factor = old_img.shape[1] / float(target_size[0]) if target_size[0] else 1.0
 
     if best_warp is None:
-        shift, _ = cv2.phaseCorrelate(old_norm, new_norm)
         warp_matrix = np.array(
             [[1.0, 0.0, shift[0] * scale_factor], [0.0, 1.0, shift[1] * scale_factor]],
             dtype=np.float32,
@@ -1486,39 +1986,79 @@ def compute_intensity_mask(diff: np.ndarray) -> np.ndarray:
     adaptive = mean_val + std_val * ADAPTIVE_DIFF_STD_FACTOR + ADAPTIVE_DIFF_MIN_INCREASE
     threshold_value = max(THRESH, adaptive)
     _, coarse = cv2.threshold(diff, threshold_value, 255, cv2.THRESH_BINARY)
-    kernel = KERNEL_RECT_3 if MORPH_KERNEL == 3 else cv2.getStructuringElement(
-        cv2.MORPH_RECT, (MORPH_KERNEL, MORPH_KERNEL)
-    )
-    coarse = cv2.morphologyEx(coarse, cv2.MORPH_CLOSE, kernel)
+    cv2.morphologyEx(coarse, cv2.MORPH_CLOSE, KERNEL_MORPH, dst=coarse)
     if DILATE_ITERS:
-        coarse = cv2.dilate(coarse, kernel, iterations=DILATE_ITERS)
+        cv2.dilate(coarse, KERNEL_DILATE, dst=coarse)
     if ERODE_ITERS:
-        coarse = cv2.erode(coarse, kernel, iterations=ERODE_ITERS)
+        cv2.erode(coarse, KERNEL_ERODE, dst=coarse)
     if std_val < 4.0:
-        cleaner = KERNEL_RECT_2
-        coarse = cv2.morphologyEx(coarse, cv2.MORPH_OPEN, cleaner)
+        cv2.morphologyEx(coarse, cv2.MORPH_OPEN, KERNEL_RECT_2, dst=coarse)
     return coarse
 
 
+def _scharr_magnitude_opencv(image: np.ndarray, out: np.ndarray) -> np.ndarray:
+    # 3x3 Scharr on 8-bit input fits in int16; the L1 magnitude is halved so
+    # it stays in uint8 and only feeds an Otsu threshold anyway.
+    shape = image.shape
+    grad_x = _SCRATCH.get("grad_x", shape, np.int16)
+    grad_y = _SCRATCH.get("grad_y", shape, np.int16)
+    cv2.Scharr(image, cv2.CV_16S, 1, 0, dst=grad_x)
+    cv2.Scharr(image, cv2.CV_16S, 0, 1, dst=grad_y)
+    abs_x = cv2.convertScaleAbs(grad_x, dst=_SCRATCH.get("abs_x", shape))
+    abs_y = cv2.convertScaleAbs(grad_y, dst=_SCRATCH.get("abs_y", shape))
+    return cv2.addWeighted(abs_x, 0.5, abs_y, 0.5, 0, dst=out)
+
+
+if njit is not None:
+
+    @njit(cache=True, nogil=True)
+    def _scharr_magnitude_kernel(image, out):  # pragma: no cover - optional dependency
+        # nogil lets the OLD and NEW halves from run_pair execute in parallel.
+        height, width = image.shape
+        for y in range(height):
+            # BORDER_REFLECT_101, the OpenCV default for Scharr.
+            ya = y - 1 if y > 0 else min(1, height - 1)
+            yb = y + 1 if y < height - 1 else max(height - 2, 0)
+            for x in range(width):
+                xa = x - 1 if x > 0 else min(1, width - 1)
+                xb = x + 1 if x < width - 1 else max(width - 2, 0)
+                top_a = np.int32(image[ya, xa])
+                top_x = np.int32(image[ya, x])
+                top_b = np.int32(image[ya, xb])
+                bot_a = np.int32(image[yb, xa])
+                bot_x = np.int32(image[yb, x])
+                bot_b = np.int32(image[yb, xb])
+                gx = 3 * (top_b - top_a + bot_b - bot_a) + 10 * (np.int32(image[y, xb]) - np.int32(image[y, xa]))
+                gy = 3 * (bot_a - top_a + bot_b - top_b) + 10 * (bot_x - top_x)
+                # Halve with round-half-to-even, as addWeighted does.
+                total = min(abs(gx), 255) + min(abs(gy), 255)
+                out[y, x] = (total + ((total >> 1) & total & 1)) >> 1
+        return out
+
+    def _scharr_magnitude(image: np.ndarray, out: np.ndarray) -> np.ndarray:  # pragma: no cover - optional dependency
+        return _scharr_magnitude_kernel(np.ascontiguousarray(image), out)
+
+else:  # pragma: no cover - optional dependency
+    _scharr_magnitude = _scharr_magnitude_opencv
+
+
 def compute_edge_mask(old_img: np.ndarray, new_img: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Compute edge representations and a mask highlighting structural changes."""
 
-    grad_old_x = cv2.Scharr(old_img, cv2.CV_32F, 1, 0)
-    grad_old_y = cv2.Scharr(old_img, cv2.CV_32F, 0, 1)
-    grad_new_x = cv2.Scharr(new_img, cv2.CV_32F, 1, 0)
-    grad_new_y = cv2.Scharr(new_img, cv2.CV_32F, 0, 1)
-
-    mag_old = cv2.magnitude(grad_old_x, grad_old_y)
-    mag_new = cv2.magnitude(grad_new_x, grad_new_y)
+    shape = old_img.shape
 
-    mag_old_u8 = cv2.convertScaleAbs(mag_old)
-    mag_new_u8 = cv2.convertScaleAbs(mag_new)
+    def edge_map(image: np.ndarray, role: str) -> np.ndarray:
+        # Gradients and magnitude are fused into one pass when numba is
+        # available; otherwise OpenCV fills the per-thread int16 buffers.
+        edges = _scharr_magnitude(image, _SCRATCH.get(f"edge_{role}", shape))
+        cv2.threshold(edges, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=edges)
+        return edges
 
-    _, edge_old = cv2.threshold(mag_old_u8, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    _, edge_new = cv2.threshold(mag_new_u8, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    # Each half runs on its own thread, so the per-thread buffers never collide.
+    edge_old, edge_new = run_pair(edge_map, old_img, new_img)
 
-    edge_diff = cv2.absdiff(edge_old, edge_new)
-    edge_mask = np.where(edge_diff > 0, 255, 0).astype(np.uint8)
+    edge_diff = cv2.absdiff(edge_old, edge_new, dst=_SCRATCH.get("edge_mask", shape))
+    _, edge_mask = cv2.threshold(edge_diff, 0, 255, cv2.THRESH_BINARY, dst=edge_diff)
     return edge_old, edge_new, edge_mask
 
 
@@ -1536,11 +2076,35 @@ def compute_line_boost(diff_img: np.ndarray) -> np.ndarray:
     return dilated
 
 
+SSIM_WINDOW = 7
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+
+def compute_ssim_map(old_img: np.ndarray, new_img: np.ndarray) -> np.ndarray:
+    """Return the local SSIM map of two uint8 images using box-filtered statistics."""
+
+    window = (SSIM_WINDOW, SSIM_WINDOW)
+    # Sample covariance normalization, matching skimage's default behaviour.
+    cov_norm = SSIM_WINDOW * SSIM_WINDOW / (SSIM_WINDOW * SSIM_WINDOW - 1.0)
+    x = old_img.astype(np.float32)
+    y = new_img.astype(np.float32)
+    mu1 = cv2.boxFilter(x, cv2.CV_32F, window)
+    mu2 = cv2.boxFilter(y, cv2.CV_32F, window)
+    mu1_sq = mu1 * mu1
+    mu2_sq = mu2 * mu2
+    mu1_mu2 = mu1 * mu2
+    sigma1_sq = (cv2.boxFilter(x * x, cv2.CV_32F, window) - mu1_sq) * cov_norm
+    sigma2_sq = (cv2.boxFilter(y * y, cv2.CV_32F, window) - mu2_sq) * cov_norm
+    sigma12 = (cv2.boxFilter(x * y, cv2.CV_32F, window) - mu1_mu2) * cov_norm
+    numerator = (2.0 * mu1_mu2 + SSIM_C1) * (2.0 * sigma12 + SSIM_C2)
+    denominator = (mu1_sq + mu2_sq + SSIM_C1) * (sigma1_sq + sigma2_sq + SSIM_C2)
+    return numerator / denominator
+
+
 def compute_ssim_mask(old_img: np.ndarray, new_img: np.ndarray) -> Optional[np.ndarray]:
     """Optional SSIM-based refinement mask."""
 
-    if structural_similarity is None:
-        return None
     # Skip SSIM when images are extremely large to avoid heavy CPU cost; the
     # subsequent patch-similarity pruning will handle stability checks.
     if old_img.size > 5_000_000 or new_img.size > 5_000_000:
@@ -1548,11 +2112,11 @@ def compute_ssim_mask(old_img: np.ndarray, new_img: np.ndarray) -> Optional[np.n
     try:
         reduced_old = cv2.resize(old_img, (0, 0), fx=0.45, fy=0.45, interpolation=cv2.INTER_AREA)
         reduced_new = cv2.resize(new_img, (0, 0), fx=0.45, fy=0.45, interpolation=cv2.INTER_AREA)
-        _, ssim_map = structural_similarity(reduced_old, reduced_new, full=True)
-    except Exception:  # pragma: no cover - optional dependency runtime errors
+        ssim_map = compute_ssim_map(reduced_old, reduced_new)
+    except cv2.error:  # pragma: no cover - defensive
         return None
 
-    diff_map = np.clip((1.0 - ssim_map) * 255.0, 0, 255).astype(np.uint8)
+    diff_map = cv2.convertScaleAbs(ssim_map, alpha=-255.0, beta=255.0)
     upsampled = cv2.resize(diff_map, (old_img.shape[1], old_img.shape[0]), interpolation=cv2.INTER_LINEAR)
     _, mask = cv2.threshold(upsampled, THRESH, 255, cv2.THRESH_BINARY)
     return mask
@@ -1571,33 +2135,54 @@ def prepare_page_text_groups(
     old_groups = extract_text_groups(old_page, old_scale, old_scale)
     new_high_groups = extract_text_groups(new_page, new_scales[0], new_scales[1])
 
-    aligned_new: List[TextGroup] = []
-    for group in new_high_groups:
-        transformed = transform_rect(group.bbox, warp_matrix)
-        scaled = tuple(coord * scale_factor for coord in transformed)
-        aligned_new.append(TextGroup(group.text, scaled))
+    bounds = transform_rects([group.bbox for group in new_high_groups], warp_matrix) * scale_factor
+    aligned_new = [
+        TextGroup(group.text, tuple(row)) for group, row in zip(new_high_groups, bounds.tolist())
+    ]
 
-    return PageTextGroups(old_groups=old_groups, new_groups=aligned_new)
+    return PageTextGroups(
+        old_groups=TextGroupIndex(old_groups), new_groups=TextGroupIndex(aligned_new)
+    )
 
 
 def align_word_boxes(words: Sequence[WordBox], warp_matrix: np.ndarray, scale_factor: float) -> List[WordBox]:
     """Align new-page word boxes to the old page coordinate space."""
 
+    bounds = transform_rects([rect for _text, rect, _baseline in words], warp_matrix) * scale_factor
     aligned: List[WordBox] = []
-    for text, rect, _baseline in words:
-        transformed = transform_rect(rect, warp_matrix)
-        scaled = tuple(coord * scale_factor for coord in transformed)
+    for (text, _rect, _baseline), scaled in zip(words, bounds.tolist()):
         baseline = int(round(max(0.0, scaled[3])))
         aligned.append((text, (scaled[0], scaled[1], scaled[2], scaled[3]), baseline))
     return aligned
 
 
-def extract_text_groups(page: fitz.Page, scale_x: float, scale_y: Optional[float] = None) -> List[TextGroup]:
-    """Extract grouped text regions from a PDF page at the specified scale."""
+def _document_cache_key(page: fitz.Page) -> Optional[Tuple[str, int, int]]:
+    """Identify the file behind a page so cached text survives re-opening it."""
+
+    name = getattr(page.parent, "name", "") or ""
+    if not name:
+        return None
+    try:
+        info = os.stat(name)
+    except OSError:
+        return None
+    return os.path.abspath(name), info.st_mtime_ns, info.st_size
+
+
+def _page_text_spans(page: fitz.Page) -> Tuple[Tuple[str, Rect], ...]:
+    """Return the page's whitespace-separated text runs in PDF points, cached per file."""
+
+    doc_key = _document_cache_key(page)
+    cache_key = (doc_key, page.number) if doc_key is not None else None
+    if cache_key is not None:
+        with _TEXT_SPAN_CACHE_LOCK:
+            cached = _TEXT_SPAN_CACHE.get(cache_key)
+            if cached is not None:
+                _TEXT_SPAN_CACHE.move_to_end(cache_key)
+                return cached
 
     text = page.get_text("rawdict")
-    scale_y_val = scale_y if scale_y is not None else scale_x
-    groups: List[TextGroup] = []
+    groups: List[Tuple[str, Rect]] = []
     for block in text.get("blocks", []):
         if block.get("type") != 0:
             continue
@@ -1613,17 +2198,7 @@ def extract_text_groups(page: fitz.Page, scale_x: float, scale_y: Optional[float
                         continue
                     if c.isspace():
                         if current_text:
-                            groups.append(
-                                TextGroup(
-                                    "".join(current_text),
-                                    (
-                                        min_x * scale_x,
-                                        min_y * scale_y_val,
-                                        max_x * scale_x,
-                                        max_y * scale_y_val,
-                                    ),
-                                )
-                            )
+                            groups.append(("".join(current_text), (min_x, min_y, max_x, max_y)))
                             current_text = []
                             min_x, min_y = float("inf"), float("inf")
                             max_x, max_y = float("-inf"), float("-inf")
@@ -1635,18 +2210,25 @@ def extract_text_groups(page: fitz.Page, scale_x: float, scale_y: Optional[float
                     max_x = max(max_x, x1)
                     max_y = max(max_y, y1)
                 if current_text:
-                    groups.append(
-                        TextGroup(
-                            "".join(current_text),
-                            (
-                                min_x * scale_x,
-                                min_y * scale_y_val,
-                                max_x * scale_x,
-                                max_y * scale_y_val,
-                            ),
-                        )
-                    )
-    return groups
+                    groups.append(("".join(current_text), (min_x, min_y, max_x, max_y)))
+
+    spans = tuple(groups)
+    if cache_key is not None:
+        with _TEXT_SPAN_CACHE_LOCK:
+            _TEXT_SPAN_CACHE[cache_key] = spans
+            while len(_TEXT_SPAN_CACHE) > TEXT_SPAN_CACHE_SIZE:
+                _TEXT_SPAN_CACHE.popitem(last=False)
+    return spans
+
+
+def extract_text_groups(page: fitz.Page, scale_x: float, scale_y: Optional[float] = None) -> List[TextGroup]:
+    """Extract grouped text regions from a PDF page at the specified scale."""
+
+    scale_y_val = scale_y if scale_y is not None else scale_x
+    return [
+        TextGroup(text, (x1 * scale_x, y1 * scale_y_val, x2 * scale_x, y2 * scale_y_val))
+        for text, (x1, y1, x2, y2) in _page_text_spans(page)
+    ]
 
 
 def transform_rect(rect: Rect, matrix: np.ndarray) -> Rect:
@@ -1667,10 +2249,20 @@ def transform_rect(rect: Rect, matrix: np.ndarray) -> Rect:
     return float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())
 
 
+def transform_rects(rects: Sequence[Rect], matrix: np.ndarray) -> np.ndarray:
+    """Batched :func:`transform_rect`, returning an ``(N, 4)`` array of bounds."""
+
+    boxes = np.asarray(rects, dtype=np.float32).reshape(-1, 4)
+    corners = np.ones((len(boxes), 4, 3), dtype=np.float32)
+    corners[:, :, 0] = boxes[:, [0, 2, 0, 2]]
+    corners[:, :, 1] = boxes[:, [1, 1, 3, 3]]
+    transformed = corners @ matrix.T
+    return np.concatenate((transformed.min(axis=1), transformed.max(axis=1)), axis=1).astype(np.float64)
+
+
 def extract_regions(
     mask: np.ndarray,
     diff_img: np.ndarray,
-    base_img: np.ndarray,
     ink_mask: np.ndarray,
     old_groups: Sequence[TextGroup],
     new_groups: Sequence[TextGroup],
@@ -1681,7 +2273,7 @@ def extract_regions(
 ) -> Tuple[List[Rect], int, int, int]:
     """Extract filtered bounding boxes from a binary mask."""
 
-    if mask is None or not np.any(mask):
+    if mask is None or cv2.countNonZero(mask) == 0:
         return [], 0, 0, 0
 
     num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
@@ -1696,29 +2288,22 @@ def extract_regions(
         global_std = 0.0
 
     kernel = np.ones((3, 3), np.uint8)
-    raw_components = list(range(1, num_labels))
-    filtered_indices: List[int] = []
-
-    for label_idx in raw_components:
-        x = stats[label_idx, cv2.CC_STAT_LEFT]
-        y = stats[label_idx, cv2.CC_STAT_TOP]
-        w_box = stats[label_idx, cv2.CC_STAT_WIDTH]
-        h_box = stats[label_idx, cv2.CC_STAT_HEIGHT]
-
-        area = w_box * h_box
-        longest_side = max(w_box, h_box)
-        aspect_ratio = longest_side / float(max(1, min(w_box, h_box)))
-        is_thin_line = (
-            aspect_ratio >= MIN_LINE_ASPECT_RATIO and longest_side >= MIN_LINE_LENGTH
-        )
-
-        if (area < MIN_COMPONENT_AREA and longest_side < LINE_LENGTH_THRESHOLD and not is_thin_line) or w_box < MIN_DIM or h_box < MIN_DIM:
-            continue
-
-        filtered_indices.append(label_idx)
+    raw_components = num_labels - 1
+
+    widths = stats[:, cv2.CC_STAT_WIDTH]
+    heights = stats[:, cv2.CC_STAT_HEIGHT]
+    box_areas = widths * heights
+    longest_sides = np.maximum(widths, heights)
+    aspect_ratios = longest_sides / np.maximum(1, np.minimum(widths, heights)).astype(np.float64)
+    thin_lines = (aspect_ratios >= MIN_LINE_ASPECT_RATIO) & (longest_sides >= MIN_LINE_LENGTH)
+    noise = (
+        (box_areas < MIN_COMPONENT_AREA) & (longest_sides < LINE_LENGTH_THRESHOLD) & ~thin_lines
+    ) | (widths < MIN_DIM) | (heights < MIN_DIM)
+    noise[0] = True
+    filtered_indices: List[int] = np.flatnonzero(~noise).tolist()
 
     logger.info(
-        "%s components raw=%d after_noise=%d", label, len(raw_components), len(filtered_indices)
+        "%s components raw=%d after_noise=%d", label, raw_components, len(filtered_indices)
     )
 
     if len(filtered_indices) > MAX_COMPONENTS_PER_PAGE:
@@ -1732,51 +2317,78 @@ def extract_regions(
         )
         filtered_indices = kept
 
-    for label_idx in filtered_indices:
-        x = stats[label_idx, cv2.CC_STAT_LEFT]
-        y = stats[label_idx, cv2.CC_STAT_TOP]
-        w_box = stats[label_idx, cv2.CC_STAT_WIDTH]
-        h_box = stats[label_idx, cv2.CC_STAT_HEIGHT]
+    # Per-component statistics in one pass over the labelled pixels instead of
+    # one masked OpenCV call per component.
+    flat_labels = labels.ravel()
+    labelled = np.flatnonzero(flat_labels)
+    component_labels = flat_labels[labelled]
+    pixel_counts = np.maximum(stats[:, cv2.CC_STAT_AREA], 1)
+    mean_diffs = (
+        np.bincount(component_labels, weights=diff_img.ravel()[labelled], minlength=num_labels)
+        / pixel_counts
+    )
+    ink_counts = np.bincount(
+        component_labels, weights=ink_mask.ravel()[labelled] > 0, minlength=num_labels
+    )
+    line_counts = np.bincount(
+        component_labels, weights=line_boost.ravel()[labelled] > 0, minlength=num_labels
+    )
+    mean_thresholds = MEAN_DIFF_MIN * np.where(thin_lines | (line_boost is not None), 0.6, 1.0)
+    fore_fractions = ink_counts / np.maximum(box_areas, 1)
+    fore_cutoffs = np.where(
+        thin_lines, min(MIN_FORE_FRACTION, MIN_FORE_FRACTION_LINE_BONUS), MIN_FORE_FRACTION
+    )
+    # Without line pixels there can be no line evidence, so the mean and
+    # foreground tests below are final for those components.
+    no_lines = line_counts == 0
+    hopeless = no_lines & ((mean_diffs < mean_thresholds) | (fore_fractions < fore_cutoffs))
 
-        component_mask = np.where(labels == label_idx, 255, 0).astype(np.uint8)
+    for label_idx in filtered_indices:
+        if hopeless[label_idx] or box_areas[label_idx] == 0:
+            continue
+        x = int(stats[label_idx, cv2.CC_STAT_LEFT])
+        y = int(stats[label_idx, cv2.CC_STAT_TOP])
+        w_box = int(widths[label_idx])
+        h_box = int(heights[label_idx])
+        is_thin_line = bool(thin_lines[label_idx])
+
+        # Work on the component's bounding box (plus a 1px margin so erosion
+        # sees the background) instead of materializing a full-page mask.
+        mx1 = max(0, x - 1)
+        my1 = max(0, y - 1)
+        mx2 = min(width, x + w_box + 1)
+        my2 = min(height, y + h_box + 1)
+        offset = (mx1, my1)
+        component_mask = cv2.compare(labels[my1:my2, mx1:mx2], int(label_idx), cv2.CMP_EQ)
+        diff_roi = diff_img[my1:my2, mx1:mx2]
 
         raw_rect = (x, y, x + w_box, y + h_box)
 
-        region = base_img[y : y + h_box, x : x + w_box]
-        std_val = 0.0
-        if region.size:
-            _, stddev = cv2.meanStdDev(region)
-            std_val = float(stddev[0][0])
-
-        mean_val = cv2.mean(diff_img, mask=component_mask)[0]
-        mean_threshold = MEAN_DIFF_MIN * (0.6 if is_thin_line or line_boost is not None else 1.0)
+        mean_val = float(mean_diffs[label_idx])
+        mean_threshold = float(mean_thresholds[label_idx])
         cx1 = max(0, x - pad * 2)
         cy1 = max(0, y - pad * 2)
         cx2 = min(width, x + w_box + pad * 2)
         cy2 = min(height, y + h_box + pad * 2)
-        context_mask = np.zeros_like(mask)
-        context_mask[cy1:cy2, cx1:cx2] = 255
-        context_mean = cv2.mean(diff_img, mask=context_mask)[0]
+        context_mean = cv2.mean(diff_img[cy1:cy2, cx1:cx2])[0]
         adaptive_delta = mean_threshold - min(mean_threshold * 0.25, global_std * 0.6)
-        if std_val < 2.0 and mean_val < mean_threshold and not line_evidence:
-            continue
 
         glyph_match = is_identical_text_region(
             raw_rect,
             old_groups,
             new_groups,
             component_mask,
-            diff_img,
+            diff_roi,
             edge_old,
             edge_new,
             kernel,
+            offset=offset,
         )
         if glyph_match:
             continue
-        line_region = cv2.bitwise_and(component_mask, line_boost)
-        has_line_pixels = cv2.countNonZero(line_region) > 0
         line_evidence = False
-        if has_line_pixels:
+        if not no_lines[label_idx]:
+            line_region = cv2.bitwise_and(component_mask, line_boost[my1:my2, mx1:mx2])
             try:
                 lines = cv2.HoughLinesP(
                     line_region,
@@ -1795,10 +2407,7 @@ def extract_regions(
         if (mean_val - context_mean) < adaptive_delta and not line_evidence:
             continue
 
-        foreground = cv2.bitwise_and(component_mask, ink_mask)
-        if area == 0:
-            continue
-        fore_fraction = float(cv2.countNonZero(foreground)) / float(area)
+        fore_fraction = float(fore_fractions[label_idx])
         fore_cutoff = MIN_FORE_FRACTION
         if line_evidence or is_thin_line:
             fore_cutoff = min(fore_cutoff, MIN_FORE_FRACTION_LINE_BONUS)
@@ -1818,7 +2427,7 @@ def extract_regions(
         )
         rectangles.append(apply_view_expand(padded_rect, width, height, ink_mask))
 
-    return rectangles, len(rectangles), len(raw_components), len(filtered_indices)
+    return rectangles, len(rectangles), raw_components, len(filtered_indices)
 
 
 def is_identical_text_region(
@@ -1830,8 +2439,14 @@ def is_identical_text_region(
     edge_old: np.ndarray,
     edge_new: np.ndarray,
     kernel: np.ndarray,
+    *,
+    offset: Tuple[int, int] = (0, 0),
 ) -> bool:
-    """Return True if the region should be suppressed as stable text."""
+    """Return True if the region should be suppressed as stable text.
+
+    ``component_mask`` and ``diff_img`` may be crops whose top-left corner sits
+    at ``offset`` in page pixel coordinates.
+    """
 
     old_text, old_iou = gather_text_groups(old_groups, rect)
     new_text, new_iou = gather_text_groups(new_groups, rect)
@@ -1847,7 +2462,7 @@ def is_identical_text_region(
     if mean_absdiff >= MEAN_TEXT_DIFF_MIN:
         return False
 
-    overlap = compute_edge_overlap(rect, component_mask, edge_old, edge_new)
+    overlap = compute_edge_overlap(rect, component_mask, edge_old, edge_new, offset=offset)
     return overlap >= EDGE_OVERLAP_MIN
 
 
@@ -1855,6 +2470,9 @@ def gather_text_groups(groups: Sequence[TextGroup], rect: Rect) -> Tuple[str, fl
     """Collect grouped text overlapping a rectangle and compute IoU."""
 
     x1, y1, x2, y2 = rect
+    if isinstance(groups, TextGroupIndex):
+        return _gather_indexed_text_groups(groups, rect)
+
     selected: List[TextGroup] = []
     min_x, min_y = float("inf"), float("inf")
     max_x, max_y = float("-inf"), float("-inf")
@@ -1886,6 +2504,40 @@ def gather_text_groups(groups: Sequence[TextGroup], rect: Rect) -> Tuple[str, fl
     return text, iou
 
 
+def _gather_indexed_text_groups(index: TextGroupIndex, rect: Rect) -> Tuple[str, float]:
+    x1, y1, x2, y2 = rect
+    if not (x1 < x2 and y1 < y2):
+        return "", 0.0
+    candidates = index.candidate_indices(rect)
+    boxes = index.boxes[candidates]
+    # Same positive-area intersection test as the list path above.
+    hit = (
+        (boxes[:, 0] < x2)
+        & (boxes[:, 2] > x1)
+        & (boxes[:, 1] < y2)
+        & (boxes[:, 3] > y1)
+        & (boxes[:, 0] < boxes[:, 2])
+        & (boxes[:, 1] < boxes[:, 3])
+    )
+    if not hit.any():
+        return "", 0.0
+    selected = candidates[hit]
+    boxes = boxes[hit]
+
+    bbox = (
+        float(boxes[:, 0].min()),
+        float(boxes[:, 1].min()),
+        float(boxes[:, 2].max()),
+        float(boxes[:, 3].max()),
+    )
+    iou = compute_iou(rect, bbox)
+
+    # Reading order: 4 px rows, then left to right; lexsort is stable like sorted().
+    order = np.lexsort((boxes[:, 0], np.round(boxes[:, 1] / 4.0) * 4.0))
+    text = " ".join(index.texts[selected[order]])
+    return text, iou
+
+
 def compute_iou(a: Rect, b: Rect) -> float:
     """Compute the intersection over union of two rectangles."""
 
@@ -1906,6 +2558,55 @@ def compute_iou(a: Rect, b: Rect) -> float:
     return float(inter_area / union)
 
 
+def _iou_against_numpy(boxes: np.ndarray, x1: float, y1: float, x2: float, y2: float) -> np.ndarray:
+    inter_w = np.minimum(boxes[:, 2], x2) - np.maximum(boxes[:, 0], x1)
+    inter_h = np.minimum(boxes[:, 3], y2) - np.maximum(boxes[:, 1], y1)
+    overlap = (inter_w > 0.0) & (inter_h > 0.0)
+    inter_area = np.where(overlap, inter_w * inter_h, 0.0)
+    area_boxes = np.maximum(0.0, boxes[:, 2] - boxes[:, 0]) * np.maximum(0.0, boxes[:, 3] - boxes[:, 1])
+    union = area_boxes + max(0.0, x2 - x1) * max(0.0, y2 - y1) - inter_area
+    valid = overlap & (union > 0.0)
+    return np.divide(inter_area, union, out=np.zeros(len(boxes)), where=valid)
+
+
+if njit is not None:
+
+    @njit(cache=True, nogil=True)
+    def _iou_against_numba(boxes, x1, y1, x2, y2):  # pragma: no cover - optional dependency
+        result = np.zeros(boxes.shape[0])
+        area_rect = max(0.0, x2 - x1) * max(0.0, y2 - y1)
+        for index in range(boxes.shape[0]):
+            inter_w = min(boxes[index, 2], x2) - max(boxes[index, 0], x1)
+            inter_h = min(boxes[index, 3], y2) - max(boxes[index, 1], y1)
+            if inter_w <= 0.0 or inter_h <= 0.0:
+                continue
+            inter_area = inter_w * inter_h
+            area_box = max(0.0, boxes[index, 2] - boxes[index, 0]) * max(0.0, boxes[index, 3] - boxes[index, 1])
+            union = area_box + area_rect - inter_area
+            if union > 0.0:
+                result[index] = inter_area / union
+        return result
+
+    _iou_against = _iou_against_numba
+else:  # pragma: no cover - optional dependency
+    _iou_against = _iou_against_numpy
+
+
+def word_box_array(words: Sequence[WordBox]) -> np.ndarray:
+    """Return the word rectangles as an ``(N, 4)`` float64 array."""
+
+    return np.asarray([word[1] for word in words], dtype=np.float64).reshape(-1, 4)
+
+
+def iou_against(boxes: np.ndarray, rect: Rect) -> np.ndarray:
+    """Return :func:`compute_iou` of every row of ``boxes`` against ``rect``."""
+
+    if not len(boxes):
+        return np.zeros(0)
+    x1, y1, x2, y2 = (float(value) for value in rect)
+    return _iou_against(boxes, x1, y1, x2, y2)
+
+
 def box_center(box: Rect) -> Tuple[float, float]:
     """Return the center point of an axis-aligned rectangle."""
 
@@ -2151,8 +2852,12 @@ def suppress_identical_text_pairs(
     def _normalize_text(text: str) -> str:
         return " ".join(text.lower().strip().split())
 
-    def _collect_text(words: Sequence[WordBox], rect: Rect) -> str:
-        collected = [w[0] for w in words if compute_iou(w[1], rect) >= WORD_IOU_MIN]
+    old_word_boxes = word_box_array(words_old)
+    new_word_boxes = word_box_array(words_new)
+
+    def _collect_text(words: Sequence[WordBox], boxes: np.ndarray, rect: Rect) -> str:
+        hits = np.flatnonzero(iou_against(boxes, rect) >= WORD_IOU_MIN)
+        collected = [words[index][0] for index in hits]
         return _normalize_text(" ".join(sorted(collected))) if collected else ""
 
     for ridx, rbox in enumerate(removed_boxes):
@@ -2180,8 +2885,8 @@ def suppress_identical_text_pairs(
             if shift > MAX_CENTER_SHIFT_PX:
                 continue
 
-            old_text = _collect_text(words_old, rbox)
-            new_text = _collect_text(words_new, abox)
+            old_text = _collect_text(words_old, old_word_boxes, rbox)
+            new_text = _collect_text(words_new, new_word_boxes, abox)
             if not old_text or not new_text:
                 continue
             if old_text != new_text:
@@ -2208,9 +2913,14 @@ def filter_identical_text_regions(
     def _normalize(text: str) -> str:
         return " ".join(text.lower().strip().split())
 
+    old_word_boxes = word_box_array(words_old)
+    new_word_boxes = word_box_array(words_new)
+
     def _collect(rect: Rect) -> Tuple[str, str]:
-        old_text = [w[0] for w in words_old if compute_iou(w[1], rect) >= WORD_IOU_MIN]
-        new_text = [w[0] for w in words_new if compute_iou(w[1], rect) >= WORD_IOU_MIN]
+        old_hits = np.flatnonzero(iou_against(old_word_boxes, rect) >= WORD_IOU_MIN)
+        new_hits = np.flatnonzero(iou_against(new_word_boxes, rect) >= WORD_IOU_MIN)
+        old_text = [words_old[index][0] for index in old_hits]
+        new_text = [words_new[index][0] for index in new_hits]
         norm_old = _normalize(" ".join(sorted(old_text))) if old_text else ""
         norm_new = _normalize(" ".join(sorted(new_text))) if new_text else ""
         return norm_old, norm_new
@@ -2302,18 +3012,52 @@ def drop_overlapping_removals(
     if not old_boxes or not new_boxes:
         return list(old_boxes), 0
 
+    def _area(rect: Rect) -> float:
+        return max(0.0, rect[2] - rect[0]) * max(0.0, rect[3] - rect[1])
+
+    # IoU can never exceed min(area)/max(area), so pairs whose areas differ too
+    # much (or whose boxes do not intersect) are rejected before computing IoU.
+    new_entries = [(new_rect, _area(new_rect)) for new_rect in new_boxes]
+
+    def _overlaps(old_rect: Rect) -> bool:
+        old_area = _area(old_rect)
+        for new_rect, new_area in new_entries:
+            if (
+                new_rect[2] <= old_rect[0]
+                or old_rect[2] <= new_rect[0]
+                or new_rect[3] <= old_rect[1]
+                or old_rect[3] <= new_rect[1]
+            ):
+                continue
+            larger = max(old_area, new_area)
+            if larger <= 0.0 or min(old_area, new_area) < iou_threshold * larger:
+                continue
+            if compute_iou(old_rect, new_rect) >= iou_threshold:
+                return True
+        return False
+
     pruned: List[Rect] = []
     suppressed = 0
     for old_rect in old_boxes:
-        if any(compute_iou(old_rect, new_rect) >= iou_threshold for new_rect in new_boxes):
+        if _overlaps(old_rect):
             suppressed += 1
             continue
         pruned.append(old_rect)
     return pruned, suppressed
 
 
-def compute_edge_overlap(rect: Rect, component_mask: np.ndarray, edge_old: np.ndarray, edge_new: np.ndarray) -> float:
-    """Compute overlap ratio between old/new edge maps inside a region."""
+def compute_edge_overlap(
+    rect: Rect,
+    component_mask: np.ndarray,
+    edge_old: np.ndarray,
+    edge_new: np.ndarray,
+    *,
+    offset: Tuple[int, int] = (0, 0),
+) -> float:
+    """Compute overlap ratio between old/new edge maps inside a region.
+
+    ``component_mask`` may be a crop whose top-left corner sits at ``offset``.
+    """
 
     x1, y1, x2, y2 = [int(round(v)) for v in rect]
     x1 = max(0, x1)
@@ -2323,18 +3067,31 @@ def compute_edge_overlap(rect: Rect, component_mask: np.ndarray, edge_old: np.nd
     if x2 <= x1 or y2 <= y1:
         return 0.0
 
-    region_mask = component_mask[y1:y2, x1:x2] > 0
-    if not np.any(region_mask):
+    # All inputs are binary 0/255 uint8 masks, so bitwise ops act as logical ones.
+    off_x, off_y = offset
+    x1 = max(x1, off_x)
+    y1 = max(y1, off_y)
+    x2 = min(x2, off_x + component_mask.shape[1])
+    y2 = min(y2, off_y + component_mask.shape[0])
+    if x2 <= x1 or y2 <= y1:
         return 0.0
 
-    old_edges = np.logical_and(edge_old[y1:y2, x1:x2] > 0, region_mask)
-    new_edges = np.logical_and(edge_new[y1:y2, x1:x2] > 0, region_mask)
+    region_mask = component_mask[y1 - off_y : y2 - off_y, x1 - off_x : x2 - off_x]
+    if cv2.countNonZero(region_mask) == 0:
+        return 0.0
 
-    union = np.logical_or(old_edges, new_edges)
-    union_count = int(np.count_nonzero(union))
+    # Restricting the ops to the component via ``mask=`` avoids materializing
+    # the per-image masked edge maps. The output lands in a window of a
+    # page-sized per-thread buffer, so regions of any size share one array.
+    old_edges = edge_old[y1:y2, x1:x2]
+    new_edges = edge_new[y1:y2, x1:x2]
+    scratch = _SCRATCH.get("edge_overlap", edge_old.shape[:2])[y1:y2, x1:x2]
+    scratch.fill(0)
+    union_count = cv2.countNonZero(cv2.bitwise_or(old_edges, new_edges, dst=scratch, mask=region_mask))
     if union_count == 0:
         return 0.0
-    intersection = int(np.count_nonzero(np.logical_and(old_edges, new_edges)))
+    scratch.fill(0)
+    intersection = cv2.countNonZero(cv2.bitwise_and(old_edges, new_edges, dst=scratch, mask=region_mask))
     return float(intersection / union_count)
 
 
@@ -2376,6 +3133,9 @@ def suppress_unchanged_text(
     if not clipped_old or not clipped_new:
         return list(candidates), 0
 
+    clipped_old_boxes = word_box_array(clipped_old)
+    clipped_new_boxes = word_box_array(clipped_new)
+
     kept: List[Rect] = []
     suppressed = 0
     kernel = np.ones((3, 3), np.uint8)
@@ -2403,12 +3163,14 @@ def suppress_unchanged_text(
             kept.append(rect)
             continue
 
-        old_hits = [word for word in clipped_old if compute_iou(word[1], clipped) >= WORD_IOU_MIN]
+        old_scores = iou_against(clipped_old_boxes, clipped)
+        old_hits = [clipped_old[i] for i in np.flatnonzero(old_scores >= WORD_IOU_MIN)]
         if not old_hits:
             kept.append(rect)
             continue
 
-        new_hits = [word for word in clipped_new if compute_iou(word[1], clipped) >= WORD_IOU_MIN]
+        new_scores = iou_against(clipped_new_boxes, clipped)
+        new_hits = [clipped_new[i] for i in np.flatnonzero(new_scores >= WORD_IOU_MIN)]
         if not new_hits:
             kept.append(rect)
             continue
@@ -2531,6 +3293,36 @@ def compute_rect_ink_fraction(rect: Rect, ink_mask: np.ndarray) -> float:
     return float(ink) / area
 
 
+def _touching_groups(boxes: List[Rect]) -> List[int]:
+    """Label rectangles by connected group of overlapping/touching boxes.
+
+    A sweep over ``x1`` keeps a heap of boxes whose ``x2`` is still ahead of the
+    sweep line, so each box is only compared with horizontally reachable ones.
+    """
+
+    parent = list(range(len(boxes)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    active: List[Tuple[float, int]] = []
+    for index in sorted(range(len(boxes)), key=lambda idx: boxes[idx][0]):
+        current = boxes[index]
+        while active and active[0][0] <= current[0]:
+            heapq.heappop(active)
+        for _, other_index in active:
+            if rectangles_touch(current, boxes[other_index]):
+                root_a = find(index)
+                root_b = find(other_index)
+                if root_a != root_b:
+                    parent[root_b] = root_a
+        heapq.heappush(active, (current[2], index))
+    return [find(index) for index in range(len(boxes))]
+
+
 def merge_rectangles(rectangles: Sequence[Rect]) -> List[Rect]:
     """Merge overlapping or touching rectangles within a color set."""
 
@@ -2538,31 +3330,20 @@ def merge_rectangles(rectangles: Sequence[Rect]) -> List[Rect]:
     if not rects:
         return []
 
-    merged: List[Rect] = list(rects)
-    changed = True
-    while changed:
-        changed = False
-        next_pass: List[Rect] = []
-        while merged:
-            current = merged.pop()
-            index = 0
-            while index < len(merged):
-                other = merged[index]
-                if rectangles_touch(current, other):
-                    current = (
-                        min(current[0], other[0]),
-                        min(current[1], other[1]),
-                        max(current[2], other[2]),
-                        max(current[3], other[3]),
-                    )
-                    merged.pop(index)
-                    changed = True
-                else:
-                    index += 1
-            next_pass.append(current)
-        merged = next_pass
-    merged.reverse()
-    return merged
+    merged: List[Rect] = rects
+    # A merged box can reach rectangles none of its members touched, so regroup
+    # until no two boxes touch.
+    while True:
+        roots = np.asarray(_touching_groups(merged))
+        unique_roots, inverse = np.unique(roots, return_inverse=True)
+        if len(unique_roots) == len(merged):
+            return merged
+        order = np.argsort(inverse, kind="stable")
+        starts = np.flatnonzero(np.r_[True, np.diff(inverse[order]) != 0])
+        boxes = np.asarray(merged, dtype=np.float64)[order]
+        mins = np.minimum.reduceat(boxes[:, :2], starts, axis=0)
+        maxs = np.maximum.reduceat(boxes[:, 2:], starts, axis=0)
+        merged = [tuple(row) for row in np.hstack((mins, maxs)).tolist()]
 
 
 def merge_close_rectangles(rectangles: Sequence[Rect]) -> List[Rect]:
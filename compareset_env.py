@@ -6,13 +6,16 @@ no GUI code.
 """
 from __future__ import annotations
 
+import atexit
+import functools
 import json
 import logging
 import getpass
 import os
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 # ----------------------------------------------------------------------------
 # Core configuration
@@ -181,8 +184,13 @@ def is_server_available(server_root: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=4096)
 def make_long_path(path: str) -> str:
-    """Return a Windows long-path compatible absolute path."""
+    """Return a Windows long-path compatible absolute path.
+
+    Memoized: the same few roots and database paths are wrapped on every
+    connection lookup and file operation.
+    """
 
     if not path:
         return ""
@@ -257,21 +265,32 @@ def set_connection_state(server_online: bool) -> None:
     else:
         effective_online = server_online
 
+    previous_online = SERVER_ONLINE
     SERVER_ONLINE = bool(effective_online)
     OFFLINE_MODE = not SERVER_ONLINE
+    if SERVER_ONLINE != previous_online:
+        # Handles opened before a drop or on the other storage root are stale.
+        invalidate_sqlite_connections()
 
     use_local = OFFLINE_MODE and is_local_storage_user(get_current_username())
     _determine_storage_paths(use_local)
 
 
+_ENSURED_DIRECTORIES: Optional[tuple] = None
+
+
 def ensure_directories() -> None:
     """Create required directories based on current connection state.
 
     The function is intentionally defensive: when offline it silently skips
     paths that cannot be created (for example, unreachable UNC roots) instead of
-    surfacing a traceback to the user.
+    surfacing a traceback to the user. Repeat calls for an unchanged set of
+    paths return immediately once every one of them has been created; a
+    skipped path is retried on the next call.
     """
 
+    global _ENSURED_DIRECTORIES
+
     paths = (
         DATA_ROOT,
         RESULTS_ROOT,
@@ -287,6 +306,9 @@ def ensure_directories() -> None:
         LOCAL_UPDATE_DIR,
         LOCAL_CONFIG_DIR,
     )
+    if paths == _ENSURED_DIRECTORIES:
+        return
+    complete = True
     for path in paths:
         if not path or not str(path).strip("\\/"):
             continue
@@ -296,6 +318,7 @@ def ensure_directories() -> None:
         try:
             os.makedirs(safe_path, exist_ok=True)
         except Exception as exc:
+            complete = False
             if OFFLINE_MODE:
                 logging.debug("Skipping directory creation while offline: %s (%s)", safe_path, exc)
                 continue
@@ -303,6 +326,219 @@ def ensure_directories() -> None:
                 logging.debug("Skipping directory creation in dev mode: %s (%s)", safe_path, exc)
                 continue
             raise
+    if complete:
+        _ENSURED_DIRECTORIES = paths
+
+
+# Per-connection tuning applied to every SQLite handle.
+SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+)
+_SQLITE_JOURNAL_CONFIGURED: set[str] = set()
+_SQLITE_JOURNAL_LOCK = threading.Lock()
+# WAL-mode databases (long path -> path as given); checkpointed in the background.
+_SQLITE_WAL_PATHS: Dict[str, str] = {}
+SQLITE_CHECKPOINT_INTERVAL_SECONDS = 30.0
+_SQLITE_CHECKPOINT_STOP = threading.Event()
+_SQLITE_CHECKPOINT_THREAD: Optional[threading.Thread] = None
+# Open connections keyed by (thread id, long path); see get_sqlite_connection.
+_SQLITE_POOL: Dict[Tuple[int, str], "_PooledConnection"] = {}
+_SQLITE_POOL_LOCK = threading.Lock()
+# Bumped by invalidate_sqlite_connections; older pooled handles are reopened.
+_SQLITE_POOL_GENERATION = 0
+
+
+class _PooledConnection(sqlite3.Connection):
+    """Pooled handle that leaves the pool once SQLite reports it unusable.
+
+    Only I/O-level failures (``OperationalError`` and bare ``DatabaseError``)
+    evict it; constraint and programming errors leave it pooled. The handle is
+    not closed on eviction so the caller's ``with conn:`` can still roll back.
+    """
+
+    pool_key: Optional[Tuple[int, str]] = None
+    generation = 0
+
+    def _evict_if_broken(self, exc: sqlite3.DatabaseError) -> None:
+        if type(exc) not in (sqlite3.OperationalError, sqlite3.DatabaseError):
+            return
+        with _SQLITE_POOL_LOCK:
+            if self.pool_key is not None and _SQLITE_POOL.get(self.pool_key) is self:
+                del _SQLITE_POOL[self.pool_key]
+        logging.debug("Dropped pooled SQLite connection after error: %s", exc)
+
+    def execute(self, *args, **kwargs):
+        try:
+            return super().execute(*args, **kwargs)
+        except sqlite3.DatabaseError as exc:
+            self._evict_if_broken(exc)
+            raise
+
+    def executemany(self, *args, **kwargs):
+        try:
+            return super().executemany(*args, **kwargs)
+        except sqlite3.DatabaseError as exc:
+            self._evict_if_broken(exc)
+            raise
+
+    def commit(self) -> None:
+        try:
+            super().commit()
+        except sqlite3.DatabaseError as exc:
+            self._evict_if_broken(exc)
+            raise
+
+
+def _is_local_appdata_path(path: str) -> bool:
+    """Return whether ``path`` lies under the per-user local app-data root."""
+
+    root = os.path.normcase(os.path.abspath(LOCAL_BASE_DIR))
+    target = os.path.normcase(os.path.abspath(path))
+    return target.startswith(root + os.sep)
+
+
+def connect_sqlite(
+    path: str, *, check_same_thread: bool = True, factory: type = sqlite3.Connection
+) -> sqlite3.Connection:
+    """Open a SQLite database with the shared pragmas applied."""
+
+    long_path = make_long_path(path)
+    conn = sqlite3.connect(long_path, check_same_thread=check_same_thread, factory=factory)
+    for pragma in SQLITE_CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    # journal_mode persists in the file, so it only needs setting once per
+    # process. WAL relies on shared memory, which SMB shares do not provide.
+    # A mapped drive letter can point at the same share as a UNC path, so WAL
+    # is only enabled under the local app-data root; everything else keeps
+    # the default rollback journal.
+    with _SQLITE_JOURNAL_LOCK:
+        if long_path not in _SQLITE_JOURNAL_CONFIGURED:
+            if _is_local_appdata_path(path):
+                mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+                if str(mode).lower() == "wal":
+                    _SQLITE_WAL_PATHS[long_path] = path
+            _SQLITE_JOURNAL_CONFIGURED.add(long_path)
+        wal = long_path in _SQLITE_WAL_PATHS
+    if wal:
+        # Commits never checkpoint inline; see start_sqlite_checkpointer.
+        conn.execute("PRAGMA wal_autocheckpoint=0")
+    return conn
+
+
+def get_sqlite_connection(path: str) -> sqlite3.Connection:
+    """Return the calling thread's pooled connection to ``path``.
+
+    Connections use ``sqlite3.Row`` rows and stay open until the thread calls
+    close_thread_sqlite_connections, the connection state changes or SQLite
+    reports an I/O error on them; the next call then reconnects. Callers must
+    not close them; use ``with conn:`` for transactions.
+    """
+
+    key = (threading.get_ident(), make_long_path(path))
+    stale: Optional[sqlite3.Connection] = None
+    with _SQLITE_POOL_LOCK:
+        conn = _SQLITE_POOL.get(key)
+        if conn is not None and conn.generation != _SQLITE_POOL_GENERATION:
+            stale = _SQLITE_POOL.pop(key)
+            conn = None
+        generation = _SQLITE_POOL_GENERATION
+    if stale is not None:
+        _close_quietly(stale)
+    if conn is None:
+        # Thread ids can be reused once a thread exits, so the handle may end
+        # up on a new thread with the same id.
+        conn = connect_sqlite(path, check_same_thread=False, factory=_PooledConnection)
+        conn.row_factory = sqlite3.Row
+        conn.pool_key = key
+        conn.generation = generation
+        with _SQLITE_POOL_LOCK:
+            _SQLITE_POOL[key] = conn
+    return conn
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def invalidate_sqlite_connections() -> None:
+    """Make every thread reopen its pooled connections on its next call.
+
+    Handles are not closed here because other threads may be using them; each
+    thread closes its own stale handle in get_sqlite_connection.
+    """
+
+    global _SQLITE_POOL_GENERATION
+    with _SQLITE_POOL_LOCK:
+        _SQLITE_POOL_GENERATION += 1
+
+
+def close_thread_sqlite_connections() -> None:
+    """Close the calling thread's pooled connections.
+
+    Short-lived worker threads call this when their task ends so the pool does
+    not keep one handle per finished thread.
+    """
+
+    ident = threading.get_ident()
+    with _SQLITE_POOL_LOCK:
+        keys = [key for key in _SQLITE_POOL if key[0] == ident]
+        connections = [_SQLITE_POOL.pop(key) for key in keys]
+    for conn in connections:
+        _close_quietly(conn)
+
+
+def _run_sqlite_checkpoints(interval: float) -> None:
+    while not _SQLITE_CHECKPOINT_STOP.wait(interval):
+        with _SQLITE_JOURNAL_LOCK:
+            paths = list(_SQLITE_WAL_PATHS.values())
+        for path in paths:
+            try:
+                get_sqlite_connection(path).execute("PRAGMA wal_checkpoint(PASSIVE)")
+            except sqlite3.Error as exc:
+                logging.debug("WAL checkpoint failed for %s: %s", path, exc)
+    close_thread_sqlite_connections()
+
+
+def start_sqlite_checkpointer(interval: float = SQLITE_CHECKPOINT_INTERVAL_SECONDS) -> None:
+    """Start the daemon thread that checkpoints WAL databases every ``interval`` seconds.
+
+    WAL connections disable automatic checkpoints, so without this thread the
+    write-ahead logs are only folded back when the connections close.
+    """
+
+    global _SQLITE_CHECKPOINT_THREAD
+    if _SQLITE_CHECKPOINT_THREAD is not None and _SQLITE_CHECKPOINT_THREAD.is_alive():
+        return
+    _SQLITE_CHECKPOINT_STOP.clear()
+    _SQLITE_CHECKPOINT_THREAD = threading.Thread(
+        target=_run_sqlite_checkpoints,
+        args=(interval,),
+        name="sqlite-checkpoint",
+        daemon=True,
+    )
+    _SQLITE_CHECKPOINT_THREAD.start()
+
+
+def close_sqlite_connections() -> None:
+    """Close every pooled SQLite connection."""
+
+    _SQLITE_CHECKPOINT_STOP.set()
+    if _SQLITE_CHECKPOINT_THREAD is not None:
+        _SQLITE_CHECKPOINT_THREAD.join(timeout=5)
+    with _SQLITE_POOL_LOCK:
+        connections = list(_SQLITE_POOL.values())
+        _SQLITE_POOL.clear()
+    for conn in connections:
+        _close_quietly(conn)
+
+
+atexit.register(close_sqlite_connections)
 
 
 def get_user_setting(username: str, key: str) -> Optional[str]:
@@ -312,10 +548,8 @@ def get_user_setting(username: str, key: str) -> Optional[str]:
     if not os.path.exists(settings_db):
         return None
 
-    conn: Optional[sqlite3.Connection] = None
     try:
-        conn = sqlite3.connect(make_long_path(settings_db))
-        conn.row_factory = sqlite3.Row
+        conn = get_sqlite_connection(settings_db)
         cursor = conn.execute(
             "SELECT username, language, email, local_output_dir, theme FROM UserSettings WHERE username = ?",
             (username,),
@@ -329,12 +563,6 @@ def get_user_setting(username: str, key: str) -> Optional[str]:
         return None
     except Exception:
         return None
-    finally:
-        if conn is not None:
-            try:
-                conn.close()
-            except Exception:
-                pass
 
 
 def get_output_directory_for_user(username: str) -> Path:
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 import threading
-from typing import Optional
+from typing import Optional, Tuple
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, Qt, QTimer, Signal, Slot
 
 import compareset_env as csenv
 
+# Poll delays while the server stays unreachable; the last step repeats.
+OFFLINE_BACKOFF_MS: Tuple[int, ...] = (1000, 2000, 5000, 15000, 30000)
+
 
 class ConnectionMonitor(QObject):
     """Background monitor that periodically checks server connectivity."""
 
     status_changed = Signal(bool)
     check_failed = Signal(str)
+    _check_done = Signal(bool)
 
     def __init__(self, *, interval_ms: int = 10000, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
@@ -22,6 +26,9 @@ class ConnectionMonitor(QObject):
         self._timer.timeout.connect(self._schedule_check)
         self._online = False
         self._checking = False
+        self._backoff_step = 0
+        # Checks finish on a worker thread; the timer must be adjusted on ours.
+        self._check_done.connect(self._on_check_done, Qt.QueuedConnection)
 
     def start(self) -> None:
         self._schedule_check()
@@ -30,6 +37,12 @@ class ConnectionMonitor(QObject):
     def stop(self) -> None:
         self._timer.stop()
 
+    def set_interval(self, interval_ms: int) -> None:
+        """Change the polling delay, leaving the timer alone if it already matches."""
+
+        if self._timer.interval() != interval_ms:
+            self._timer.setInterval(interval_ms)
+
     def _schedule_check(self) -> None:
         if self._checking:
             return
@@ -42,11 +55,21 @@ class ConnectionMonitor(QObject):
         except Exception as exc:  # pragma: no cover - defensive
             self.check_failed.emit(str(exc))
             self._checking = False
+            self._check_done.emit(False)
             return
-        finally:
-            pass
 
         if available != self._online:
             self._online = available
             self.status_changed.emit(available)
         self._checking = False
+        self._check_done.emit(available)
+
+    @Slot(bool)
+    def _on_check_done(self, available: bool) -> None:
+        if available:
+            self._backoff_step = 0
+            self.set_interval(self.interval_ms)
+            return
+        step = min(self._backoff_step, len(OFFLINE_BACKOFF_MS) - 1)
+        self._backoff_step += 1
+        self.set_interval(OFFLINE_BACKOFF_MS[step])
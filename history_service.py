@@ -94,26 +94,31 @@ def update_entry_status(
 
 
 def clear_history_and_temp() -> None:
-    history_file = _history_path()
-    if history_file.exists():
-        history_file.unlink()
-    if os.path.isdir(csenv.LOCAL_TEMP_DIR):
-        for child in Path(csenv.LOCAL_TEMP_DIR).iterdir():
-            if child.is_dir():
-                for nested in child.iterdir():
+    try:
+        os.unlink(_history_path())
+    except FileNotFoundError:
+        pass
+    temp_root = csenv.LOCAL_TEMP_DIR
+    if not os.path.isdir(temp_root):
+        return
+    with os.scandir(temp_root) as jobs:
+        for job in jobs:
+            if not job.is_dir():
+                continue
+            with os.scandir(job.path) as files:
+                for item in files:
                     try:
-                        nested.unlink()
-                    except Exception:
+                        os.unlink(item.path)
+                    except OSError:
                         pass
-                try:
-                    child.rmdir()
-                except Exception:
-                    pass
-    if os.path.isdir(csenv.LOCAL_TEMP_DIR):
-        try:
-            os.rmdir(csenv.LOCAL_TEMP_DIR)
-        except Exception:
-            pass
+            try:
+                os.rmdir(job.path)
+            except OSError:
+                pass
+    try:
+        os.rmdir(temp_root)
+    except OSError:
+        pass
 
 
 def temp_dir_for_job(job_id: str) -> Path:
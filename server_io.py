@@ -10,6 +10,8 @@ from __future__ import annotations
 import json
 import os
 import shutil
+import stat
+import sys
 import urllib.request
 from datetime import datetime
 from pathlib import Path
@@ -17,6 +19,47 @@ from typing import Any, Dict, Tuple
 
 import compareset_env as csenv
 
+# Windows CopyFileExW lets SMB copy server-side or with pipelined large I/O.
+try:
+    if sys.platform.startswith("win"):
+        import ctypes
+        from ctypes import wintypes
+
+        _copy_file_ex = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileExW
+        _copy_file_ex.argtypes = [
+            wintypes.LPCWSTR,
+            wintypes.LPCWSTR,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            wintypes.DWORD,
+        ]
+        _copy_file_ex.restype = wintypes.BOOL
+    else:
+        _copy_file_ex = None
+except (ImportError, OSError, AttributeError):  # pragma: no cover - platform specific
+    _copy_file_ex = None
+
+
+def copy_file(source_path: str, target_path: str) -> None:
+    """Copy file contents using the platform's native copy routine.
+
+    Uses CopyFileExW on Windows; elsewhere ``shutil.copyfile`` already copies
+    in-kernel via ``sendfile``. CopyFileExW also copies file attributes, so a
+    read-only flag inherited from the source is cleared to keep the target
+    writable, as ``shutil.copyfile`` leaves it.
+    """
+
+    if _copy_file_ex is not None:
+        if not _copy_file_ex(str(source_path), str(target_path), None, None, None, 0):
+            raise ctypes.WinError(ctypes.get_last_error())
+        mode = os.stat(target_path).st_mode
+        if not mode & stat.S_IWRITE:
+            # On Windows this clears only FILE_ATTRIBUTE_READONLY.
+            os.chmod(target_path, mode | stat.S_IWRITE)
+        return
+    shutil.copyfile(source_path, target_path)
+
 
 def _load_remote_json(source: str) -> Dict[str, Any]:
     """Load JSON from a UNC path or HTTP URL."""
@@ -0,0 +1,38 @@
+import unittest
+
+try:
+    from compareset_engine import merge_rectangles
+    _IMPORT_OK = True
+    _IMPORT_ERROR = None
+except Exception as exc:  # pragma: no cover - environment-dependent
+    merge_rectangles = None
+    _IMPORT_OK = False
+    _IMPORT_ERROR = exc
+
+
+@unittest.skipUnless(_IMPORT_OK, "compareset_engine dependencies unavailable: %s" % _IMPORT_ERROR)
+class MergeRectanglesTest(unittest.TestCase):
+    def test_disjoint_rectangles_are_kept(self):
+        rects = [(0.0, 0.0, 10.0, 10.0), (20.0, 20.0, 30.0, 30.0)]
+
+        self.assertEqual(merge_rectangles(rects), rects)
+
+    def test_overlapping_chain_is_merged(self):
+        rects = [(0.0, 0.0, 10.0, 10.0), (8.0, 8.0, 20.0, 20.0), (18.0, 0.0, 25.0, 9.0)]
+
+        self.assertEqual(merge_rectangles(rects), [(0.0, 0.0, 25.0, 20.0)])
+
+    def test_grown_box_absorbs_untouched_rectangle(self):
+        # The third box touches neither input, only their merged bounds.
+        rects = [(0.0, 0.0, 10.0, 2.0), (8.0, 0.0, 10.0, 20.0), (2.0, 15.0, 5.0, 18.0)]
+
+        self.assertEqual(merge_rectangles(rects), [(0.0, 0.0, 10.0, 20.0)])
+
+    def test_edge_contact_is_not_merged(self):
+        rects = [(0.0, 0.0, 10.0, 10.0), (10.0, 0.0, 20.0, 10.0)]
+
+        self.assertEqual(sorted(merge_rectangles(rects)), rects)
+
+
+if __name__ == "__main__":
+    unittest.main()
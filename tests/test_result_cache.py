@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    import compareset_engine as engine
+    _IMPORT_OK = True
+    _IMPORT_ERROR = None
+except Exception as exc:  # pragma: no cover - environment-dependent
+    engine = None
+    _IMPORT_OK = False
+    _IMPORT_ERROR = exc
+
+
+@unittest.skipUnless(_IMPORT_OK, "compareset_engine dependencies unavailable: %s" % _IMPORT_ERROR)
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = mock.patch.object(engine, "LOCAL_RESULT_CACHE_DIR", self._tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_round_trip(self):
+        summary = engine.PageDiffSummary(1, "identity", 3, 1, 4, 2)
+        engine.store_cached_result("key", b"%PDF-data", [summary])
+
+        self.assertEqual(engine.load_cached_result("key"), (b"%PDF-data", [summary]))
+        self.assertIsNone(engine.load_cached_result("missing"))
+
+    def test_entry_is_checked_against_recorded_page_count(self):
+        summary = engine.PageDiffSummary(1, "identity", 3, 1, 4, 2)
+        # Three input pages, two of them skipped, leave a single summary.
+        engine.store_cached_result("key", b"%PDF-data", [summary], page_count=3)
+
+        self.assertEqual(engine.load_cached_result("key", 3), (b"%PDF-data", [summary]))
+        self.assertIsNone(engine.load_cached_result("key", 4))
+
+    def test_oldest_entry_is_evicted_over_cap(self):
+        with mock.patch.object(engine, "RESULT_CACHE_MAX_BYTES", 15):
+            engine.store_cached_result("first", b"0123456789", [])
+            old_time = os.path.getmtime(os.path.join(self._tmp.name, "first.pdf")) - 10
+            os.utime(os.path.join(self._tmp.name, "first.pdf"), (old_time, old_time))
+            engine.store_cached_result("second", b"0123456789", [])
+
+        self.assertIsNone(engine.load_cached_result("first"))
+        self.assertIsNotNone(engine.load_cached_result("second"))
+
+    def test_cache_key_changes_with_content(self):
+        first = os.path.join(self._tmp.name, "a.pdf")
+        second = os.path.join(self._tmp.name, "b.pdf")
+        with open(first, "wb") as handle:
+            handle.write(b"one")
+        with open(second, "wb") as handle:
+            handle.write(b"")
+
+        key = engine.result_cache_key(first, second)
+        with open(second, "wb") as handle:
+            handle.write(b"two")
+
+        self.assertNotEqual(engine.result_cache_key(first, second), key)
+
+
+if __name__ == "__main__":
+    unittest.main()